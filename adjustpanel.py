@@ -0,0 +1,95 @@
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QComboBox, QDockWidget, QLabel, QSlider, QVBoxLayout, QWidget
+
+# Canlı eşik / kontrast paneli. Kaydırıcı hareketleri ekran yenileme hızına kısılır:
+# ilk değişiklik hemen, sonrakiler kare başına en fazla bir kez önizlenir. Kaydırıcı
+# bırakıldığında (klavye ile değiştirildiğinde kısa bir beklemeden sonra) tek bir
+# uygulama isteği gönderilir.
+
+MODES = {
+    "threshold": ("Eşik", 0, 255, 128),
+    "contrast": ("Kontrast (%)", 0, 300, 100),
+}
+KEYBOARD_COMMIT_MS = 400
+
+
+class AdjustPanel(QDockWidget):
+    preview_requested = pyqtSignal(str, int)
+    commit_requested = pyqtSignal(str, int)
+
+    def __init__(self, parent=None):
+        super().__init__("Canlı Ayar", parent)
+        self.setObjectName("adjust_panel")
+        self.mode = "threshold"
+        self.shown_value = None
+
+        self.mode_choice = QComboBox()
+        for key, (title, *_) in MODES.items():
+            self.mode_choice.addItem(title, key)
+        self.mode_choice.currentIndexChanged.connect(lambda _: self.start(self.mode_choice.currentData()))
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.valueChanged.connect(self.on_value_changed)
+        self.slider.sliderReleased.connect(self.commit)
+        self.value_label = QLabel("")
+        self.info_label = QLabel("")
+
+        refresh_rate = QApplication.primaryScreen().refreshRate() if QApplication.primaryScreen() else 60
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.setInterval(max(1, round(1000 / (refresh_rate or 60))))
+        self.frame_timer.timeout.connect(self.on_frame)
+        self.commit_timer = QTimer(self)
+        self.commit_timer.setSingleShot(True)
+        self.commit_timer.setInterval(KEYBOARD_COMMIT_MS)
+        self.commit_timer.timeout.connect(self.commit)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.mode_choice)
+        layout.addWidget(self.slider)
+        layout.addWidget(self.value_label)
+        layout.addWidget(self.info_label)
+        layout.addStretch(1)
+        content = QWidget()
+        content.setLayout(layout)
+        self.setWidget(content)
+
+    def start(self, mode):
+        self.mode = mode
+        _, low, high, default = MODES[mode]
+        self.mode_choice.blockSignals(True)
+        self.mode_choice.setCurrentIndex(self.mode_choice.findData(mode))
+        self.mode_choice.blockSignals(False)
+        self.slider.blockSignals(True)
+        self.slider.setRange(low, high)
+        self.slider.setValue(default)
+        self.slider.blockSignals(False)
+        self.show()
+        self.raise_()
+        self.shown_value = None
+        self.show_value()
+
+    def value(self):
+        return self.slider.value()
+
+    def on_value_changed(self, value):
+        if not self.slider.isSliderDown():
+            self.commit_timer.start()
+        if not self.frame_timer.isActive():
+            self.show_value()
+
+    def on_frame(self):
+        if self.shown_value != self.value():
+            self.show_value()
+
+    def show_value(self):
+        self.shown_value = self.value()
+        self.value_label.setText(f"{MODES[self.mode][0]}: {self.shown_value}")
+        self.frame_timer.start()
+        self.preview_requested.emit(self.mode, self.shown_value)
+
+    def commit(self):
+        self.commit_timer.stop()
+        self.commit_requested.emit(self.mode, self.value())
+
+    def set_info(self, text):
+        self.info_label.setText(text)
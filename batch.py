@@ -0,0 +1,206 @@
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from filters.cache import ResultCache
+from filters.dtypes import to_gray
+from filters.graph import LazyImage, evaluate_pipeline
+from filters.pipeline import parse_pipeline
+from filters.stack import iter_chunks, run_stack_steps
+from imagefile import IMAGE_EXTENSIONS, PREFETCH_DEPTH, AsyncWriter, decode, prefetch
+
+# Başsız toplu işleme: PyQt5 içe aktarılmaz.
+# Örnek:
+#   python batch.py "equalize | otsu | dilate:3 | skeletonize" "girdi/*.png" -o cikti/ -j 8
+#   python batch.py "gaussian:1.5 | otsu" video.npy -o cikti/ --stack   # (N, H, W[, C]) kare yığını
+
+
+def collect_inputs(inputs):
+    paths = []
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            for name in sorted(os.listdir(pattern)):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(pattern, name))
+        else:
+            paths.extend(sorted(glob.glob(pattern)))
+    return paths
+
+
+def read_input(path, color=False):
+    return decode(path, color), os.path.getsize(path)
+
+
+def output_path(path, output_dir, extension):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(output_dir, stem + extension)
+
+
+def process_chunk(paths, spec, output_dir, extension, fuse_linear=False, cache_dir=None, color=False,
+                  png_level=None, jpeg_quality=None):
+    # İşçi süreç: okuyucu iş parçacıkları sonraki PREFETCH_DEPTH dosyayı önceden çözer,
+    # yazıcı kuyruğu önceki sonuçları kodlar; süreç kendisi yalnızca işlem hattını çalıştırır.
+    steps = parse_pipeline(spec)
+    stats = {"images": 0, "bytes_in": 0, "bytes_out": 0, "pixels": 0, "errors": [], "cache_hits": 0}
+    cache = ResultCache(spill_dir=cache_dir) if cache_dir else None
+    writer = AsyncWriter(max_pending=PREFETCH_DEPTH, png_level=png_level, jpeg_quality=jpeg_quality)
+
+    writes = []
+    try:
+        for path, loading in prefetch(paths, lambda p: read_input(p, color)):
+            try:
+                image_array, size = loading.result()
+                if cache is None:
+                    result = evaluate_pipeline(steps, image_array, fuse_linear)
+                else:
+                    result = cache.call("pipeline", evaluate_pipeline, steps, image_array, fuse_linear)
+            except Exception as exc:
+                stats["errors"].append(f"{path}: {exc}")
+                continue
+            stats["images"] += 1
+            stats["bytes_in"] += size
+            stats["pixels"] += image_array.shape[0] * image_array.shape[1]
+            target = output_path(path, output_dir, extension)
+            writes.append((target, writer.submit(result, target)))
+    finally:
+        writer.close()
+
+    for target, future in writes:
+        try:
+            stats["bytes_out"] += future.result()
+        except Exception as exc:
+            stats["errors"].append(f"{target}: {exc}")
+    if cache is not None:
+        cache.flush()
+        summary = cache.summary()
+        stats["cache_hits"] = summary["hits"] + summary["disk_hits"]
+    return stats
+
+
+def process_stack_files(paths, spec, output_dir, color=False, chunk_frames=None):
+    # İşçi süreç: her .npy kare yığını bellek eşlemeli okunur, parça parça tüm parçaya tek
+    # çağrıyla işlenir ve bellek eşlemeli .npy çıktısına yazılır; bellekte yalnızca bir parça
+    steps = parse_pipeline(spec)
+    stats = {"images": 0, "bytes_in": 0, "bytes_out": 0, "pixels": 0, "errors": [], "cache_hits": 0}
+    for path in paths:
+        target = output_path(path, output_dir, ".npy")
+        try:
+            frames = np.load(path, mmap_mode="r")
+            if frames.ndim not in (3, 4) or len(frames) == 0:
+                raise ValueError(f"Kare yığını (N, H, W[, C]) bekleniyordu: {frames.shape}")
+            output, done = None, 0
+            for chunk in iter_chunks(frames, chunk_frames):
+                if chunk.ndim == 4 and not color:
+                    chunk = to_gray(chunk)
+                result = run_stack_steps(steps, chunk)
+                if output is None:
+                    # Çıktı boyutu ilk parçadan belli olur (döndürme vb. kare boyunu değiştirir)
+                    output = np.lib.format.open_memmap(target, mode="w+", dtype=result.dtype,
+                                                       shape=(len(frames),) + result.shape[1:])
+                output[done:done + len(result)] = result
+                done += len(result)
+            output.flush()
+            del output
+        except Exception as exc:
+            stats["errors"].append(f"{path}: {exc}")
+            continue
+        stats["images"] += len(frames)
+        stats["bytes_in"] += os.path.getsize(path)
+        stats["bytes_out"] += os.path.getsize(target)
+        stats["pixels"] += len(frames) * frames.shape[1] * frames.shape[2]
+    return stats
+
+
+def run_batch(spec, paths, output_dir, jobs=None, chunk_size=8, extension=".png", fuse_linear=False,
+              cache_dir=None, color=False, png_level=None, jpeg_quality=None, stack=False):
+    os.makedirs(output_dir, exist_ok=True)
+    totals = {"images": 0, "bytes_in": 0, "bytes_out": 0, "pixels": 0, "errors": [], "cache_hits": 0}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        if stack:
+            # Yığın dosyaları kendi içinde parçalanır; süreçler arasında dosyalar paylaştırılır
+            futures = [pool.submit(process_stack_files, [path], spec, output_dir, color) for path in paths]
+        else:
+            chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+            futures = [pool.submit(process_chunk, chunk, spec, output_dir, extension, fuse_linear, cache_dir,
+                                   color, png_level, jpeg_quality)
+                       for chunk in chunks]
+        for future in futures:
+            stats = future.result()
+            for key in totals:
+                totals[key] += stats[key]
+    totals["seconds"] = time.perf_counter() - start
+    return totals
+
+
+def format_report(totals):
+    seconds = max(totals["seconds"], 1e-9)
+    lines = [
+        f"{totals['images']} görüntü, {seconds:.2f} s",
+        f"{totals['images'] / seconds:.1f} görüntü/s",
+        f"{totals['bytes_in'] / seconds / 1e6:.1f} MB/s okuma, "
+        f"{totals['bytes_out'] / seconds / 1e6:.1f} MB/s yazma, "
+        f"{totals['pixels'] / seconds / 1e6:.1f} MP/s",
+    ]
+    if totals["cache_hits"]:
+        lines.append(f"{totals['cache_hits']} görüntü önbellekten")
+    if totals["errors"]:
+        lines.append(f"{len(totals['errors'])} hata:")
+        lines.extend("  " + e for e in totals["errors"])
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Filtre işlem hattını bir klasördeki görüntülere uygular.")
+    parser.add_argument("pipeline", help='örn. "equalize | otsu | dilate:3 | skeletonize"')
+    parser.add_argument("inputs", nargs="+", help="klasör veya glob deseni")
+    parser.add_argument("-o", "--output", required=True, help="çıktı klasörü")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="işçi süreç sayısı")
+    parser.add_argument("--chunk-size", type=int, default=8, help="işçi başına görüntü grubu")
+    parser.add_argument("--format", default="png", help="çıktı biçimi (png, jpg, bmp, npy...)")
+    parser.add_argument("--png-level", type=int, choices=range(10), default=None, metavar="0-9",
+                        help="PNG sıkıştırma düzeyi (düşük: hızlı yazma, büyük dosya; varsayılan 6)")
+    parser.add_argument("--jpeg-quality", type=int, choices=range(1, 96), default=None, metavar="1-95",
+                        help="JPEG kalitesi (varsayılan 75)")
+    parser.add_argument("--fuse-linear", action="store_true",
+                        help="ardışık konvolüsyonları tek çekirdekte birleştir (yaklaşık)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="sonuç önbelleği klasörü; yeniden çalıştırmalarda aynı girdiler hesaplanmaz")
+    parser.add_argument("--color", action="store_true",
+                        help="renkli görüntüleri gri seviyeye çevirmeden işle (filtreler kanal başına, "
+                             "eşitleme/germe parlaklıkta)")
+    parser.add_argument("--stack", action="store_true",
+                        help="girdiler (N, H, W[, C]) .npy kare yığınları (video kareleri); her yığın parça "
+                             "parça tek çağrıyla işlenir, çıktı .npy yığını")
+    parser.add_argument("--explain", action="store_true", help="birleştirilen adımları yazdır")
+    args = parser.parse_args(argv)
+
+    try:
+        parse_pipeline(args.pipeline)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.explain:
+        plan = LazyImage(None, fuse_linear=args.fuse_linear).extend(parse_pipeline(args.pipeline))
+        print("Plan: " + " -> ".join(plan.explain()))
+
+    paths = collect_inputs(args.inputs)
+    if args.stack:
+        paths = [path for path in paths if path.lower().endswith(".npy")]
+    if not paths:
+        parser.error("Girdi görüntüsü bulunamadı")
+    totals = run_batch(args.pipeline, paths, args.output, args.jobs, args.chunk_size,
+                       "." + args.format.lstrip("."), args.fuse_linear, args.cache_dir, args.color,
+                       args.png_level, args.jpeg_quality, args.stack)
+    print(format_report(totals))
+    return 1 if totals["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
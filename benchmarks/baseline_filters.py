@@ -0,0 +1,258 @@
+import numpy as np
+from PIL import Image
+from scipy.ndimage import affine_transform, convolve
+from skimage.morphology import skeletonize as ski_skeletonize
+
+# İlk sürümdeki filtre uygulamaları, döngüleriyle birlikte olduğu gibi.
+# suite.py --golden hızlandırılmış fonksiyonların çıktısını bunlarla doğrudan karşılaştırır;
+# golden.json yalnızca sonraki değişiklikleri yakalar. Yalnızca küçük girdilerde çağrılmalı.
+
+# --- filters/convolution.py
+# Filtre fonksiyonları
+def apply_mean_filter(image_array, kernel_size=3):
+    kernel = np.ones((kernel_size, kernel_size)) / (kernel_size ** 2)
+    filtered = convolve(image_array, kernel, mode='reflect')
+    return filtered.astype(np.uint8)
+
+def apply_median_filter(image_array, kernel_size=3):
+    padded = np.pad(image_array, kernel_size // 2, mode='reflect')
+    output = np.zeros_like(image_array)
+    h, w = image_array.shape
+
+    for i in range(h):
+        for j in range(w):
+            region = padded[i:i+kernel_size, j:j+kernel_size]
+            output[i, j] = np.median(region)
+
+    return output
+
+# TO-DO: farklı kernelle çalış, perwitt ve sobel
+def apply_edge_filter(image_array):
+    kernel = np.array([[-1, -1, -1],
+                       [-1,  8, -1],
+                       [-1, -1, -1]])
+    filtered = convolve(image_array, kernel, mode='reflect')
+    return np.clip(filtered, 0, 255).astype(np.uint8)
+
+def apply_smoothing_filter(image_array):
+    kernel = np.ones((3, 3), dtype=np.float32) / 9.0  # 3x3 filtre
+    return convolve(image_array, kernel)
+
+def apply_sharpen_filter(image_array):
+    kernel = np.array([[0, -1,  0],
+                       [-1,  5, -1],
+                       [0, -1,  0]], dtype=np.float32)
+    return convolve(image_array, kernel)
+
+
+# --- filters/histogram.py
+def calculate_histogram(image_array):
+    histogram = np.zeros(256, dtype=int)
+    for value in image_array.flatten():
+        histogram[value] += 1
+    return histogram
+
+def histogram_equalization(image_array):
+    hist = calculate_histogram(image_array)
+    cdf = np.cumsum(hist)
+
+    if cdf.max() == cdf.min():
+        return image_array.copy()
+
+    cdf_normalized = (cdf - cdf.min()) * 255 / (cdf.max() - cdf.min())
+    cdf_normalized = cdf_normalized.astype(np.uint8)
+    equalized = cdf_normalized[image_array]
+    return equalized
+
+def contrast_stretching(image_array):
+    p1, p99 = np.percentile(image_array, (1, 99))
+
+    if p1 == p99:
+        return image_array.copy()
+
+    stretched = (image_array - p1) * 255 / (p99 - p1)
+    return np.clip(stretched, 0, 255).astype(np.uint8)
+
+
+# --- filters/thresholding.py
+def manual_threshold(image_array, threshold):
+    binary = np.where(image_array > threshold, 255, 0)
+    return binary.astype(np.uint8)
+
+def otsu_threshold(image_array):
+    histogram, _ = np.histogram(image_array, bins=256, range=(0, 256))
+    total = image_array.size
+
+    current_max, threshold = 0, 0
+    sum_total, sum_foreground = 0, 0
+    weight_background, weight_foreground = 0, 0
+
+    for i in range(256):
+        sum_total += i * histogram[i]
+
+    for t in range(256):
+        weight_background += histogram[t]
+        if weight_background == 0:
+            continue
+
+        weight_foreground = total - weight_background
+        if weight_foreground == 0:
+            break
+
+        sum_foreground += t * histogram[t]
+
+        mean_b = sum_foreground / weight_background
+        mean_f = (sum_total - sum_foreground) / weight_foreground
+
+        between_var = weight_background * weight_foreground * (mean_b - mean_f) ** 2
+
+        if between_var > current_max:
+            current_max = between_var
+            threshold = t
+
+    return np.where(image_array > threshold, 255, 0).astype(np.uint8)
+
+def kapur_threshold(image_array):
+    hist, _ = np.histogram(image_array, bins=256, range=(0, 256))
+    hist = hist.astype(np.float64)
+    hist = hist / hist.sum()  # normalize et
+
+    max_entropy = -np.inf
+    threshold = 0
+
+    for t in range(1, 255):
+        p1 = hist[:t]
+        p2 = hist[t:]
+
+        w1 = p1.sum()
+        w2 = p2.sum()
+
+        if w1 == 0 or w2 == 0:
+            continue
+
+        H1 = -np.sum(p1 / w1 * np.log(p1 / w1 + 1e-12)) # 0'a bölmeyi engelle
+        H2 = -np.sum(p2 / w2 * np.log(p2 / w2 + 1e-12))
+
+        total_entropy = H1 + H2
+
+        if total_entropy > max_entropy:
+            max_entropy = total_entropy
+            threshold = t
+
+    return np.where(image_array > threshold, 255, 0).astype(np.uint8)
+
+
+# --- filters/morphology.py
+# 3x3 Yapısal Eleman ile
+def dilation(binary_image):
+    kernel = np.ones((3, 3), dtype=np.uint8)
+    padded = np.pad(binary_image, pad_width=1, mode='constant', constant_values=0)
+    result = np.zeros_like(binary_image)
+
+    for i in range(result.shape[0]):
+        for j in range(result.shape[1]):
+            region = padded[i:i+3, j:j+3]
+            if np.any(region & kernel):
+                result[i, j] = 255
+    return result
+
+def erosion(binary_image):
+    kernel = np.ones((3, 3), dtype=np.uint8)
+    padded = np.pad(binary_image, pad_width=1, mode='constant', constant_values=0)
+    result = np.zeros_like(binary_image)
+
+    for i in range(result.shape[0]):
+        for j in range(result.shape[1]):
+            region = padded[i:i+3, j:j+3]
+            if np.all(region & kernel):
+                result[i, j] = 255
+    return result
+
+
+# --- filters/geometry.py
+def compute_centroid(binary_image):
+    indices = np.argwhere(binary_image == 255)
+
+    if len(indices) == 0:
+        return None
+
+    centroid = indices.mean(axis=0)
+    return int(centroid[1]), int(centroid[0])  # (x, y)
+
+def skeletonize(binary_image):
+    binary = (binary_image == 255).astype(np.uint8)
+    skeleton = ski_skeletonize(binary)
+    return (skeleton * 255).astype(np.uint8)
+
+def rotate_image(pil_image, angle_deg=90):
+    img_array = np.array(pil_image)
+
+    if len(img_array.shape) == 2:
+        rotated = rotate_image_array(img_array, angle_deg)
+        return Image.fromarray(rotated.astype(np.uint8))
+
+    channels = []
+    for i in range(3):
+        rotated_channel = rotate_image_array(img_array[:, :, i], angle_deg)
+        channels.append(rotated_channel.astype(np.uint8))
+
+    rotated_rgb = np.stack(channels, axis=2)
+    return Image.fromarray(rotated_rgb)
+
+
+def rotate_image_array(image_array, angle_deg):
+    angle_rad = np.deg2rad(angle_deg)
+    cos_a, sin_a = np.cos(angle_rad), np.sin(angle_rad)
+
+    transform_matrix = np.array([
+        [cos_a, -sin_a],
+        [sin_a,  cos_a]
+    ])
+
+    h, w = image_array.shape
+
+    new_w = int(abs(h * sin_a) + abs(w * cos_a))
+    new_h = int(abs(h * cos_a) + abs(w * sin_a))
+    output_shape = (new_h, new_w)
+
+    old_center = np.array([h / 2, w / 2])
+    new_center = np.array([new_h / 2, new_w / 2])
+    offset = old_center - transform_matrix @ new_center
+
+    rotated = affine_transform(
+        image_array,
+        transform_matrix,
+        offset=offset,
+        output_shape=output_shape,
+        order=1,
+        mode='constant',
+        cval=255 
+    )
+
+    return rotated
+
+
+def shear_image(pil_image, shear_x=0.2, shear_y=0.0):
+    width, height = pil_image.size
+
+    matrix = (
+        1, shear_x, 0,
+        shear_y, 1, 0
+    )
+
+    return pil_image.transform(
+        (int(width * 1.5), int(height * 1.5)),  # Kırpma olmasın diye
+        Image.AFFINE,
+        matrix,
+        resample=Image.BICUBIC
+    )
+
+def flip_horizontal(pil_image):
+    arr = np.array(pil_image)
+    flipped = arr[:, ::-1]
+    return Image.fromarray(flipped)
+
+def flip_vertical(pil_image):
+    arr = np.array(pil_image)
+    flipped = arr[::-1, :]
+    return Image.fromarray(flipped)
@@ -0,0 +1,51 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from scipy.ndimage import convolve
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from filters.linear import METHODS, choose_method, convolve_image, gaussian_kernel
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def kernels(rng):
+    # (ad, çekirdek, denenecek yöntemler)
+    for k in (3, 15, 31):
+        yield f"box {k}x{k}", np.full((k, k), 1.0 / (k * k)), ("box", "separable", "fft", "direct")
+    for sigma in (1.0, 4.0):
+        kernel = gaussian_kernel(sigma)
+        yield f"gauss s={sigma:g}", kernel, ("separable", "fft", "direct")
+    for k in (5, 21):
+        yield f"rastgele {k}x{k}", rng.standard_normal((k, k)), ("fft", "direct")
+
+
+def main(size=1024):
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, (size, size), dtype=np.uint8)
+
+    print(f"Görüntü: {size}x{size} uint8; referans: scipy.ndimage.convolve (float64)")
+    print(f"{'çekirdek':>16} {'referans (s)':>13} " + " ".join(f"{m:>10}" for m in METHODS[1:]) + f" {'seçilen':>10}")
+    for name, kernel, methods in kernels(rng):
+        expected, t_ref = timed(convolve, image.astype(np.float64), kernel, mode='reflect')
+        cells = []
+        for method in METHODS[1:]:
+            if method not in methods:
+                cells.append(f"{'-':>10}")
+                continue
+            result, elapsed = timed(convolve_image, image, kernel, method)
+            error = np.abs(result - expected).max()
+            assert error < 1e-3 * max(1.0, np.abs(expected).max()), f"{method} farklı sonuç verdi ({name})"
+            cells.append(f"{elapsed:>10.3f}")
+        print(f"{name:>16} {t_ref:>13.3f} " + " ".join(cells) + f" {choose_method(kernel):>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1024)
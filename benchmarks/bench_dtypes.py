@@ -0,0 +1,93 @@
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from filters.convolution import (apply_gaussian_filter, apply_mean_filter, apply_median_filter,
+                                 apply_sharpen_filter, apply_sobel_filter)
+from filters.histogram import adjust_contrast, contrast_stretching, histogram_equalization
+from filters.morphology import dilation
+from filters.thresholding import manual_threshold, otsu_threshold
+
+# Çağrı başına bellek (tracemalloc tepe değeri, ısınma çağrısından sonra): out=None ile
+# sonuç dizisi + ara diziler, out= ile yalnızca ara diziler. Son bölüm zincirleme bir
+# işlem hattını iki dönüşümlü (ping-pong) tamponla çalıştırır.
+
+STEPS = (
+    ("mean:15", lambda a, out=None: apply_mean_filter(a, 15, out=out)),
+    ("median:3", lambda a, out=None: apply_median_filter(a, 3, out=out)),
+    ("gaussian:2", lambda a, out=None: apply_gaussian_filter(a, 2.0, out=out)),
+    ("sharpen", lambda a, out=None: apply_sharpen_filter(a, out=out)),
+    ("sobel", lambda a, out=None: apply_sobel_filter(a, out=out)),
+    ("equalize", lambda a, out=None: histogram_equalization(a, out=out)),
+    ("stretch", lambda a, out=None: contrast_stretching(a, out=out)),
+    ("contrast:1.5", lambda a, out=None: adjust_contrast(a, 1.5, out=out)),
+    ("threshold:128", lambda a, out=None: manual_threshold(a, 128, out=out)),
+    ("otsu", lambda a, out=None: otsu_threshold(a, out=out)),
+    ("dilate:3", lambda a, out=None: dilation(a, 3, out=out)),
+)
+GRAY_ONLY = ("dilate:3",)
+CHAIN = ("equalize", "gaussian:2", "sharpen", "contrast:1.5", "otsu")
+
+
+def peak_bytes(func):
+    func()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def best(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_image(shape):
+    rng = np.random.default_rng(0)
+    h, w = shape[:2]
+    yy, xx = np.mgrid[0:h, 0:w]
+    base = (np.sin(xx / w * 6.0) + np.cos(yy / h * 4.0)) * 60 + 128
+    base = base[..., None] if len(shape) == 3 else base
+    return np.clip(base + rng.normal(0, 25, shape), 0, 255).astype(np.uint8)
+
+
+def main(height=1024, width=1024):
+    for shape in ((height, width), (height, width, 3)):
+        image = test_image(shape)
+        out = np.empty_like(image)
+        print(f"\n{width}x{height} {'RGB' if image.ndim == 3 else 'gri'} uint8 ({image.nbytes / 1e6:.1f} MB)")
+        print(f"{'adım':>14} {'out=None (MB)':>14} {'out= (MB)':>10} {'out=None (ms)':>14} {'out= (ms)':>10}")
+        for label, step in STEPS:
+            if image.ndim == 3 and label in GRAY_ONLY:
+                continue
+            assert np.array_equal(step(image), step(image, out=out)), f"{label}: out= sonucu farklı"
+            print(f"{label:>14} {peak_bytes(lambda: step(image)) / 1e6:>14.2f} "
+                  f"{peak_bytes(lambda: step(image, out=out)) / 1e6:>10.2f} "
+                  f"{best(lambda: step(image)) * 1000:>14.1f} {best(lambda: step(image, out=out)) * 1000:>10.1f}")
+
+        steps = [dict(STEPS)[name] for name in CHAIN]
+        buffers = (np.empty_like(image), np.empty_like(image))
+
+        def chained(use_out):
+            result = image
+            for index, step in enumerate(steps):
+                result = step(result, out=buffers[index % 2] if use_out else None)
+            return result
+
+        assert np.array_equal(chained(False), chained(True)), "zincir sonucu farklı"
+        print(f"{' | '.join(CHAIN)}: out=None {peak_bytes(lambda: chained(False)) / 1e6:.2f} MB, "
+              f"ping-pong {peak_bytes(lambda: chained(True)) / 1e6:.2f} MB")
+
+
+if __name__ == "__main__":
+    main(*(int(v) for v in sys.argv[1:3]))
@@ -0,0 +1,67 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from scipy.ndimage import affine_transform
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from filters.geometry import rotate_image, shear_image, affine_image, flip_horizontal
+
+
+# Eski yol: her kanal için çift doğrusal affine_transform (karşılaştırma referansı)
+def reference_rotate(image_array, angle_deg):
+    angle_rad = np.deg2rad(angle_deg)
+    cos_a, sin_a = np.cos(angle_rad), np.sin(angle_rad)
+    matrix = np.array([[cos_a, -sin_a], [sin_a, cos_a]])
+    h, w = image_array.shape[:2]
+    new_w = int(abs(h * sin_a) + abs(w * cos_a))
+    new_h = int(abs(h * cos_a) + abs(w * sin_a))
+    offset = np.array([h / 2, w / 2]) - matrix @ np.array([new_h / 2, new_w / 2])
+    channels = [affine_transform(image_array[:, :, c], matrix, offset=offset, output_shape=(new_h, new_w),
+                                 order=1, mode='constant', cval=255) for c in range(image_array.shape[2])]
+    return np.stack(channels, axis=2)
+
+
+def reference_shear(pil_image, shear_x=0.2):
+    width, height = pil_image.size
+    return pil_image.transform((int(width * 1.5), int(height * 1.5)), Image.AFFINE,
+                               (1, shear_x, 0, 0, 1, 0), resample=Image.BICUBIC)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(height=1500, width=2000):
+    rng = np.random.default_rng(0)
+    array = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    image = Image.fromarray(array)
+
+    print(f"Görüntü: {width}x{height} RGB")
+    print(f"{'işlem':>22} {'eski (s)':>10} {'yeni (s)':>10} {'eski boyut':>12} {'yeni boyut':>12}")
+    cases = [
+        ("90° döndürme", lambda: reference_rotate(array, 90), lambda: rotate_image(image, 90)),
+        ("30° döndürme", lambda: reference_rotate(array, 30), lambda: rotate_image(image, 30)),
+        ("shear x=0.2", lambda: reference_shear(image), lambda: shear_image(image)),
+        ("yatay aynalama", lambda: np.array(array)[:, ::-1].copy(), lambda: flip_horizontal(image)),
+        ("ölçek+shear+döndürme", lambda: reference_rotate(array, 15), lambda: affine_image(image, 15, 0.2, 0, 0.5)),
+    ]
+    for name, old, new in cases:
+        old_result, t_old = timed(old)
+        new_result, t_new = timed(new)
+        old_size = np.asarray(old_result).shape[:2]
+        new_size = np.asarray(new_result).shape[:2]
+        print(f"{name:>22} {t_old:>10.3f} {t_new:>10.3f} {str(old_size):>12} {str(new_size):>12}")
+
+    # 90°'nin katları yeniden örneklenmeden birebir olmalı
+    for angle, turns in ((90, -1), (180, 2), (270, 1)):
+        assert np.array_equal(np.asarray(rotate_image(image, angle)), np.rot90(array, turns)), angle
+
+
+if __name__ == "__main__":
+    main(*(int(v) for v in sys.argv[1:3]))
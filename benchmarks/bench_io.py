@@ -0,0 +1,85 @@
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from imagefile import AsyncWriter, decode, encode, preview_image, probe
+
+PREVIEW_SIZE = (800, 600)
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def best(func, repeat=3):
+    return min(timed(func)[1] for _ in range(repeat))
+
+
+# Eski yol: dosya tamamen çözülüp RGB'ye çevrilir, ilk piksel ancak bundan sonra gösterilir
+# (.npy için karşılığı tam np.load)
+def reference_open(path):
+    if path.endswith(".npy"):
+        return np.load(path)
+    return np.array(Image.open(path).convert("RGB"))
+
+
+def new_first_pixel(path):
+    # Başlık + (JPEG ise) draft ile küçük çözme; önizleme yoksa tam çözme
+    probe(path)
+    preview = preview_image(path, PREVIEW_SIZE)
+    if preview is not None:
+        return preview
+    # Bellek eşlemeli .npy'de yalnızca görünen satırlar okunur
+    return np.array(decode(path, color=True)[:PREVIEW_SIZE[1]])
+
+
+def test_image(height, width):
+    yy, xx = np.mgrid[0:height, 0:width]
+    rng = np.random.default_rng(0)
+    base = np.stack([(xx // 7) % 256, (yy // 5) % 256, ((xx + yy) // 11) % 256], axis=2)
+    return np.clip(base + rng.normal(0, 12, base.shape), 0, 255).astype(np.uint8)
+
+
+def main(height=3000, width=4000):
+    array = test_image(height, width)
+    with tempfile.TemporaryDirectory() as folder:
+        paths = {ext: os.path.join(folder, "girdi" + ext) for ext in (".jpg", ".png", ".npy")}
+        encode(array, paths[".jpg"], jpeg_quality=90)
+        encode(array, paths[".png"], png_level=1)
+        encode(array, paths[".npy"])
+
+        print(f"Görüntü: {width}x{height} RGB, önizleme {PREVIEW_SIZE[0]}x{PREVIEW_SIZE[1]}")
+        print(f"{'ilk piksel':>12} {'eski (ms)':>10} {'yeni (ms)':>10} {'başlık (ms)':>12}")
+        for ext, path in paths.items():
+            t_old = best(lambda: reference_open(path))
+            t_new = best(lambda: new_first_pixel(path))
+            t_probe = best(lambda: probe(path))
+            print(f"{ext:>12} {t_old * 1000:>10.1f} {t_new * 1000:>10.1f} {t_probe * 1000:>12.2f}")
+
+        print(f"\n{'kaydetme':>16} {'boyut (KB)':>11} {'engelleyen (ms)':>16} {'async çağrı (ms)':>17}")
+        image = Image.fromarray(array)
+        settings = [(".png", {"png_level": level}) for level in (1, 6, 9)] + \
+                   [(".jpg", {"jpeg_quality": quality}) for quality in (50, 75, 95)]
+        writer = AsyncWriter()
+        for ext, options in settings:
+            path = os.path.join(folder, "cikti" + ext)
+            # Eski yol: GUI iş parçacığında engelleyen save()
+            size, t_block = timed(encode, image, path, **options)
+            future, t_submit = timed(writer.submit, image, path, **options)
+            future.result()
+            label = f"{ext[1:]} {list(options.values())[0]}"
+            print(f"{label:>16} {size / 1024:>11.0f} {t_block * 1000:>16.1f} {t_submit * 1000:>17.2f}")
+        writer.close()
+
+
+if __name__ == "__main__":
+    main(*(int(v) for v in sys.argv[1:3]))
@@ -0,0 +1,49 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from filters.median import median_filter
+
+
+# Eski Python döngüsü (karşılaştırma ve doğruluk referansı)
+def reference_median_filter(image_array, kernel_size=3):
+    padded = np.pad(image_array, kernel_size // 2, mode='reflect')
+    output = np.zeros_like(image_array)
+    h, w = image_array.shape
+
+    for i in range(h):
+        for j in range(w):
+            region = padded[i:i+kernel_size, j:j+kernel_size]
+            output[i, j] = np.median(region)
+
+    return output
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(size=256, kernel_sizes=(3, 7, 21)):
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, (size, size), dtype=np.uint8)
+
+    print(f"Görüntü: {size}x{size} uint8")
+    print(f"{'kernel':>8} {'döngü (s)':>12} {'partition (s)':>14} {'histogram (s)':>14} {'hızlanma':>10}")
+    for k in kernel_sizes:
+        expected, t_ref = timed(reference_median_filter, image, k)
+        part, t_part = timed(median_filter, image, k, method="partition")
+        hist, t_hist = timed(median_filter, image, k, method="histogram")
+        assert np.array_equal(part, expected), f"partition farklı sonuç verdi (k={k})"
+        assert np.array_equal(hist, expected), f"histogram farklı sonuç verdi (k={k})"
+        best = min(t_part, t_hist)
+        print(f"{k:>8} {t_ref:>12.3f} {t_part:>14.3f} {t_hist:>14.3f} {t_ref / best:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 256)
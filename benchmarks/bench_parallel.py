@@ -0,0 +1,88 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from filters.geometry import rotation_matrix, shear_matrix, warp_affine
+from filters.parallel import PARALLEL_FILTERS, band_height, cpu_count, l2_cache_bytes, parallel_filter, parallel_warp
+
+# Bant zamanlayıcının çekirdek sayısına göre hızlanması. 1 işçi = doğrudan tek çağrı
+# (bantlama yok); karolanamayan işlemler (otsu, uzaklık dönüşümü) her sayıda tek çağrıya düşer.
+# "fark" sütunu tek çağrıya göre en büyük gri seviye farkıdır (0 = birebir aynı).
+# Çarpıtmalarda yalnızca scipy yolu bantlanır; uint8 girdide derece 0/1/3 (PIL) tek çağrıdır.
+
+CASES = (
+    ("mean", "gray", (15,)),
+    ("median", "gray", (3,)),
+    ("gaussian", "rgb", (2.0,)),
+    ("sobel", "gray", ()),
+    ("dilation", "binary", (5,)),
+    ("otsu", "gray", ()),
+    ("distance", "binary", ()),
+)
+WARPS = (
+    ("döndürme 30°", "float32", rotation_matrix(30), 1),
+    ("shear spline-5", "gray", shear_matrix(0.2, 0), 5),
+)
+
+
+def best(func, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return result, min(times)
+
+
+def test_images(height, width):
+    rng = np.random.default_rng(0)
+    yy, xx = np.mgrid[0:height, 0:width]
+    base = (np.sin(xx / width * 6.0) + np.cos(yy / height * 4.0)) * 60 + 128
+    gray = np.clip(base + rng.normal(0, 25, base.shape), 0, 255).astype(np.uint8)
+    rgb = np.clip(base[..., None] + rng.normal(0, 25, base.shape + (3,)), 0, 255).astype(np.uint8)
+    return {"gray": gray, "rgb": rgb, "float32": gray.astype(np.float32),
+            "binary": np.where(gray > 128, 255, 0).astype(np.uint8)}
+
+
+def worker_counts():
+    counts = [1]
+    while counts[-1] * 2 < cpu_count():
+        counts.append(counts[-1] * 2)
+    if cpu_count() > 1:
+        counts.append(cpu_count())
+    return counts
+
+
+def main(height=2160, width=3840):
+    images = test_images(height, width)
+    counts = worker_counts()
+    print(f"Görüntü: {width}x{height}, {cpu_count()} çekirdek, L2 {l2_cache_bytes() // 1024} KB, "
+          f"bant {band_height(images['gray'].shape, 1, counts[-1])} satır (gri, halo 1)")
+    print(f"{'işlem':>16} " + " ".join(f"{str(n) + ' çekirdek':>12}" for n in counts) + f" {'fark':>5}")
+
+    rows = [(f"{name}{list(params) if params else ''}", images[kind],
+             lambda image, n, name=name, params=params: parallel_filter(name, image, *params, workers=n),
+             lambda image, name=name, params=params: PARALLEL_FILTERS[name][0](image, *params))
+            for name, kind, params in CASES]
+    rows += [(label, images[kind],
+              lambda image, n, matrix=matrix, order=order: parallel_warp(image, matrix, order, workers=n),
+              lambda image, matrix=matrix, order=order: warp_affine(image, matrix, order))
+             for label, kind, matrix, order in WARPS]
+
+    for label, image, run, direct in rows:
+        expected = direct(image)
+        cells, difference, baseline = [], 0, None
+        for n in counts:
+            result, seconds = best(lambda: run(image, n))
+            difference = max(difference, int(np.abs(result.astype(np.float64) - expected).max()))
+            baseline = baseline or seconds
+            cells.append(f"{seconds * 1000:>6.0f} ms {baseline / seconds:>3.1f}x")
+        print(f"{label:>16} " + " ".join(f"{cell:>12}" for cell in cells) + f" {difference:>5}")
+
+
+if __name__ == "__main__":
+    main(*(int(v) for v in sys.argv[1:3]))
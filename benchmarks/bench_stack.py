@@ -0,0 +1,71 @@
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from filters.pipeline import PIPELINE_STEPS, parse_pipeline, run_pipeline
+from filters.stack import chunk_frames_for, run_stack
+
+# Kare kare (PIPELINE_STEPS) ve parça başına tek çağrı (run_stack -> STACK_STEPS)
+# karşılaştırması; ikisinin sonucu da birebir aynı olmalı. Son satır: üreteçten gelen
+# karelerde tepe bellek.
+
+STEPS = ("mean:3", "gaussian:1.5", "sobel", "equalize", "stretch", "otsu", "kapur",
+         "threshold:128", "dilate:3", "erode:5", "flip_h")
+PIPELINE = "equalize | gaussian:1.5 | otsu | dilate:3"
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def frames(count, height, width, seed=0):
+    rng = np.random.default_rng(seed)
+    yy, xx = np.mgrid[0:height, 0:width]
+    base = (np.sin(xx / width * 6.0) + np.cos(yy / height * 4.0)) * 60 + 128
+    for _ in range(count):
+        yield np.clip(base + rng.normal(0, 25, base.shape), 0, 255).astype(np.uint8)
+
+
+def main(count=1000, height=64, width=64):
+    stack = np.stack(list(frames(count, height, width)))
+    binary = np.where(stack > 128, 255, 0).astype(np.uint8)
+
+    print(f"Yığın: {count} kare, {width}x{height} uint8")
+    print(f"{'adım':>14} {'kare kare (ms)':>15} {'yığın (ms)':>11} {'hızlanma':>9}")
+    for spec in STEPS:
+        steps = parse_pipeline(spec)
+        (name, args), = steps
+        source = binary if name in ("dilate", "erode") else stack
+        expected, t_loop = timed(lambda: np.stack([PIPELINE_STEPS[name](f, *args) for f in source]))
+        result, t_stack = timed(run_stack, steps, source)
+        assert np.array_equal(result, expected), f"{spec}: yığın sonucu farklı"
+        print(f"{spec:>14} {t_loop * 1000:>15.1f} {t_stack * 1000:>11.1f} {t_loop / t_stack:>8.1f}x")
+
+    steps = parse_pipeline(PIPELINE)
+    expected, t_loop = timed(lambda: np.stack([run_pipeline(steps, f) for f in stack]))
+    result, t_stack = timed(run_stack, steps, stack)
+    assert np.array_equal(result, expected), "işlem hattı sonucu farklı"
+    print(f"\n{PIPELINE}: kare kare {t_loop * 1000:.1f} ms, yığın {t_stack * 1000:.1f} ms "
+          f"({t_loop / t_stack:.1f}x)")
+
+    # Üreteç girdisi: çıktı da bellek eşlemeli olabileceği için burada yalnızca girdi
+    # parçalarının ve ara sonuçların tepe belleği ölçülür (tüm yığın = count * H * W bayt)
+    chunk = chunk_frames_for(stack[0])
+    out = np.empty_like(expected)
+    tracemalloc.start()
+    run_stack(steps, frames(count, height, width), out=out)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"Üreteçten {chunk} karelik parçalarla: tepe bellek {peak / 1e6:.1f} MB "
+          f"(tüm yığın {stack.nbytes / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main(*(int(v) for v in sys.argv[1:4]))
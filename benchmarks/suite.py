@@ -0,0 +1,516 @@
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from scipy import ndimage
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import baseline_filters as baseline
+
+# filters.* genel fonksiyonları için mikro ölçüm ve regresyon paketi.
+# Her durum bir fonksiyonu bir girdi türü (gri, RGB, float32, ikili...) ve parametre
+# kümesiyle çalıştırır; süre (tekrarların en iyisi) ve tepe bellek (tracemalloc) ölçülür.
+#   python benchmarks/suite.py --sizes 256 1024 4k --save sonuc.json
+#   python benchmarks/suite.py --compare sonuc.json --threshold 0.25
+#   python benchmarks/suite.py --golden           # çıktılar golden.json ve ilk sürümle birebir mi
+#   python benchmarks/suite.py --update-golden    # referans çıktıları yeniden kaydet
+# --filter ile durum adlarında alt dize araması yapılır (örn. --filter median).
+
+MODULES = ("convolution", "histogram", "thresholding", "morphology", "geometry", "regions", "thinning",
+           "stack", "parallel", "dtypes")
+GOLDEN_PATH = Path(__file__).resolve().parent / "golden.json"
+GOLDEN_SHAPE = (97, 131)          # tek sayılı boyutlar kenar durumlarını da yakalar
+DEFAULT_SIZES = ("256", "1024")
+NAMED_SIZES = {"hd": (1080, 1920), "4k": (2160, 3840), "8k": (4320, 7680)}
+MIN_TIME = 0.2                    # durum başına en az ölçüm süresi (s)
+MAX_REPEAT = 7
+NOISE_FLOOR = 0.002               # bu süreden kısa farklar regresyon sayılmaz (s)
+MEMORY_FLOOR = 1024 * 1024
+
+# Ölçülmeyen genel fonksiyonlar ve nedenleri
+SKIPPED = {
+    "histogram.plot_histogram": "etkileşimli pencere açar",
+    "parallel.cpu_count": "makineye bağlı",
+    "parallel.l2_cache_bytes": "makineye bağlı",
+    "parallel.band_height": "makineye bağlı (L2 boyutu)",
+    "parallel.thread_pool": "havuz nesnesi döndürür",
+    "parallel.run_bands": "parallel_filter ve parallel_warp üzerinden ölçülür",
+    "dtypes.output_array": "başlatılmamış dizi döndürür",
+    "dtypes.scratch": "başlatılmamış tampon döndürür",
+    "dtypes.clear_scratch": "iş parçacığı durumunu değiştirir",
+    "dtypes.row_blocks": "dilim listesi; apply_lut ve histogramlar üzerinden ölçülür",
+}
+
+
+def make_inputs(shape, seed=0):
+    # Rastgele gürültü yerine yumuşak gradyan + gürültü: eşikleme ve morfoloji anlamlı sonuç verir
+    rng = np.random.default_rng(seed)
+    h, w = shape
+    yy, xx = np.mgrid[0:h, 0:w]
+    base = (np.sin(xx / max(w, 1) * 6.0) + np.cos(yy / max(h, 1) * 4.0)) * 60 + 128
+    gray = np.clip(base + rng.normal(0, 25, shape), 0, 255).astype(np.uint8)
+    rgb = np.clip(base[..., None] + rng.normal(0, 25, shape + (3,)), 0, 255).astype(np.uint8)
+    binary = np.where(gray > 128, 255, 0).astype(np.uint8)
+    stack_shape = (8, max(h // 4, 1), max(w // 4, 1))
+    return {
+        "gray": gray,
+        "rgb": rgb,
+        "float32": gray.astype(np.float32),
+        "binary": binary,
+        "labels": ndimage.label(binary == 255, output=np.int32)[0],
+        "histogram": np.bincount(gray.ravel(), minlength=256),
+        "stack": rng.integers(0, 256, stack_shape, dtype=np.uint8),
+        "rgb_stack": rng.integers(0, 256, stack_shape + (3,), dtype=np.uint8),
+        "binary_stack": np.where(rng.random(stack_shape) > 0.5, 255, 0).astype(np.uint8),
+        "pil_gray": Image.fromarray(gray),
+        "pil_rgb": Image.fromarray(rgb),
+        "matrix": np.array([[0.8, 0.3], [-0.2, 1.1]]),
+        "none": None,
+    }
+
+
+class Case:
+    def __init__(self, module, name, kind, call=None, max_pixels=None, **params):
+        self.module = module
+        self.name = name
+        self.kind = kind
+        self.params = params
+        self.call = call
+        self.max_pixels = max_pixels
+
+    @property
+    def function_id(self):
+        return f"{self.module}.{self.name}"
+
+    @property
+    def label(self):
+        params = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.function_id}[{self.kind}{',' if params else ''}{params}]"
+
+    def runner(self, inputs):
+        func = getattr(importlib.import_module("filters." + self.module), self.name)
+        value = inputs[self.kind]
+        if self.call is not None:
+            return lambda: self.call(func, value, **self.params)
+        return lambda: func(value, **self.params)
+
+
+def _cases():
+    cases = []
+
+    def add(module, name, kinds, max_pixels=None, call=None, **params):
+        for kind in kinds:
+            cases.append(Case(module, name, kind, call, max_pixels, **params))
+
+    images = ("gray", "rgb", "float32")
+    for k in (3, 15, 31):
+        add("convolution", "apply_mean_filter", images, kernel_size=k)
+    for k in (3, 7, 21):
+        add("convolution", "apply_median_filter", ("gray", "rgb") if k < 21 else ("gray",),
+            max_pixels=None if k < 21 else 4_200_000, kernel_size=k)
+    for sigma in (1.0, 4.0):
+        add("convolution", "apply_gaussian_filter", images, sigma=sigma)
+    for name in ("apply_edge_filter", "apply_smoothing_filter", "apply_sharpen_filter",
+                 "apply_sobel_filter", "apply_prewitt_filter", "apply_scharr_filter"):
+        add("convolution", name, images)
+    add("convolution", "apply_gradient_filter", ("gray",), operator="scharr")
+
+    add("histogram", "calculate_histogram", ("gray", "rgb"))
+    add("histogram", "channel_histograms", ("rgb",))
+    add("histogram", "luma_histogram", ("rgb",))
+    add("histogram", "tile_histograms", ("gray",), tile_size=64)
+    add("histogram", "histogram_percentile", ("histogram",), q=(1, 50, 99))
+    add("histogram", "equalization_lut", ("histogram",))
+    add("histogram", "apply_luma_lut", ("gray", "rgb"), lut=np.arange(256, dtype=np.uint8)[::-1].copy())
+    add("histogram", "histogram_equalization", ("gray", "rgb"))
+    add("histogram", "contrast_stretching", ("gray", "rgb", "float32"))
+    add("histogram", "contrast_lut", ("none",), call=lambda f, _: f(1.5))
+    add("histogram", "adjust_contrast", ("gray", "rgb", "float32"), gain=1.5)
+
+    add("thresholding", "manual_threshold", ("gray", "float32"), threshold=128)
+    add("thresholding", "threshold_lut", ("none",), call=lambda f, _: f(100))
+    add("thresholding", "otsu_level", ("histogram",))
+    add("thresholding", "kapur_level", ("histogram",))
+    add("thresholding", "otsu_threshold", ("gray",))
+    add("thresholding", "kapur_threshold", ("gray",))
+    add("thresholding", "multi_otsu_levels", ("histogram",), thresholds=2)
+    add("thresholding", "multi_otsu_threshold", ("gray",), thresholds=3)
+    for window in (15, 31):
+        add("thresholding", "niblack_threshold", ("gray",), window_size=window)
+        add("thresholding", "sauvola_threshold", ("gray",), window_size=window)
+    add("thresholding", "stack_histograms", ("stack",))
+    add("thresholding", "batch_threshold", ("stack",), method="otsu")
+
+    add("morphology", "structuring_element", ("none",), call=lambda f, _, **p: f(**p), shape="disk", size=15)
+    for size in (3, 9):
+        for name in ("dilation", "erosion"):
+            add("morphology", name, ("binary",), size=size)
+        for name in ("gray_dilation", "gray_erosion"):
+            add("morphology", name, ("gray",), size=size)
+    for name in ("opening", "closing", "morphological_gradient", "top_hat"):
+        add("morphology", name, ("binary",))
+        add("morphology", name, ("gray",), grayscale=True)
+    add("morphology", "dilation", ("binary",), shape="disk", size=7)
+
+    add("geometry", "compute_centroid", ("binary",))
+    add("geometry", "skeletonize", ("binary",), max_pixels=4_200_000)
+    for angle in (90, 30):
+        add("geometry", "rotate_image", ("pil_gray", "pil_rgb"), angle_deg=angle)
+        add("geometry", "rotate_image_array", ("gray", "rgb"), angle_deg=angle)
+    add("geometry", "rotate_image_array", ("gray",), angle_deg=30, order=3)
+    add("geometry", "shear_image", ("pil_gray", "pil_rgb"))
+    add("geometry", "affine_image", ("pil_rgb",), angle_deg=15, shear_x=0.2, scale=0.5)
+    add("geometry", "warp_affine", ("gray", "float32"), call=lambda f, a, **p: f(a, np.array([[0.8, 0.3], [-0.2, 1.1]]), **p))
+    add("geometry", "warp_image", ("pil_rgb",), call=lambda f, a, **p: f(a, np.array([[0.8, 0.3], [-0.2, 1.1]]), **p))
+    add("geometry", "warp_source", ("gray", "float32"), order=1)
+    add("geometry", "warp_rows", ("gray", "rgb", "float32"),
+        call=lambda f, a: f(a, np.array([[0.8, 0.3], [-0.2, 1.1]]), rows=(10, 40)))
+    add("geometry", "flip_horizontal", ("pil_gray", "pil_rgb"))
+    add("geometry", "flip_vertical", ("pil_gray", "pil_rgb"))
+    add("geometry", "flip_array", ("rgb",), axis=1)
+    add("geometry", "permute_view", ("rgb",), call=lambda f, a: f(a, np.array([[0, 1], [-1, 0]])))
+    add("geometry", "rotation_matrix", ("none",), call=lambda f, _: f(33.0))
+    add("geometry", "shear_matrix", ("none",), call=lambda f, _: f(0.2, 0.1))
+    add("geometry", "scale_matrix", ("none",), call=lambda f, _: f(0.5, 2.0))
+    add("geometry", "compose_affine", ("matrix",), call=lambda f, m: f(m, m.T, m))
+    add("geometry", "signed_permutation", ("matrix",))
+    add("geometry", "output_bounds", ("matrix",), call=lambda f, m: f((1080, 1920), m))
+
+    for connectivity in (4, 8):
+        add("regions", "label_components", ("binary",), connectivity=connectivity)
+        add("regions", "find_regions", ("binary",), connectivity=connectivity)
+    add("regions", "region_stats", ("labels",))
+    add("regions", "find_regions", ("binary",), min_area=20)
+
+    for method in ("zhang_suen", "guo_hall"):
+        add("thinning", "thin", ("binary",), max_pixels=4_200_000, method=method)
+    add("thinning", "foreground_box", ("binary",))
+    add("thinning", "distance_transform", ("binary",))
+    add("thinning", "distance_map", ("binary",))
+    add("thinning", "medial_axis", ("binary",), max_pixels=4_200_000)
+
+    # workers=2: tek çekirdekli makinede de bant yolu çalışır (küçük görüntüler tek çağrıya düşer)
+    for step, kinds, args in (("gaussian", ("gray", "rgb"), (2.0,)), ("median", ("gray",), (3,)),
+                              ("sobel", ("gray",), ()), ("dilation", ("binary",), (5,)), ("otsu", ("gray",), ())):
+        add("parallel", "parallel_filter", kinds, call=lambda f, a, step, args: f(step, a, *args, workers=2),
+            step=step, args=args)
+    add("parallel", "parallel_warp", ("gray", "float32"), call=lambda f, a: f(a, np.array([[0.8, 0.3], [-0.2, 1.1]]), workers=2))
+    add("parallel", "parallel_warp_image", ("pil_rgb",), call=lambda f, a: f(a, np.array([[0.8, 0.3], [-0.2, 1.1]]), workers=2))
+
+    # to_uint8 girdisini yerinde değiştirir: her çağrıya yeni float dizi
+    add("dtypes", "to_uint8", ("float32",), call=lambda f, a: f(a * 1.7 - 40))
+    add("dtypes", "to_gray", ("rgb", "rgb_stack"))
+    for out in (False, True):
+        add("dtypes", "apply_lut", ("gray", "rgb"), out=out,
+            call=lambda f, a, out: f(a, np.arange(256, dtype=np.uint8)[::-1].copy(), np.empty_like(a) if out else None))
+
+    add("stack", "chunk_frames_for", ("gray",))
+    add("stack", "iter_chunks", ("stack",), call=lambda f, a: [c.copy() for c in f(iter(a), 3)])
+    add("stack", "stack_histograms_batched", ("stack",))
+    add("stack", "frame_histograms", ("stack", "rgb_stack"))
+    add("stack", "apply_frame_luts", ("stack", "rgb_stack"),
+        call=lambda f, a: f(a, np.tile(np.arange(256, dtype=np.uint8)[::-1], (len(a), 1))))
+    add("stack", "equalization_luts", ("stack",), call=lambda f, a: f(np.stack([np.bincount(x.ravel(), minlength=256) for x in a])))
+    add("stack", "stretching_luts", ("stack",), call=lambda f, a: f(np.stack([np.bincount(x.ravel(), minlength=256) for x in a])))
+    add("stack", "stack_equalization", ("stack", "rgb_stack"))
+    add("stack", "stack_stretching", ("stack", "rgb_stack"))
+    for method in ("otsu", "kapur"):
+        add("stack", "stack_threshold", ("stack", "rgb_stack"), method=method)
+    add("stack", "run_stack_steps", ("binary_stack",), call=lambda f, a: f([("dilate", (5,)), ("erode", (3,))], a))
+    add("stack", "process_stack", ("stack",), call=lambda f, a: list(f("equalize | gaussian:1.5 | otsu | dilate:3", iter(a), 3)))
+    add("stack", "run_stack", ("stack", "rgb_stack"), call=lambda f, a: f("equalize | gaussian:1.5 | otsu", a))
+    return cases
+
+
+CASES = _cases()
+
+
+def _shift_columns(current, reference):
+    # İlk sürümdeki 90° döndürme bir sütun kayıktı ve boş sütunu 255 ile dolduruyordu; kenar
+    # pikselleri kayan nokta hatasıyla sınır dışından (255) örneklenebildiği için atlanır
+    return np.asarray(current)[1:-1, :-1][:, 1:-1], np.asarray(reference)[1:-1, 1:][:, 1:-1]
+
+
+def _reference_cases():
+    # (etiket, güncel fonksiyon, ilk sürüm). İlk sürümün bilerek düzeltilen davranışlarında
+    # eşdeğer girdiyle çağrılır: uint8 taşması (sarma) yerine geniş tip, kesme yerine yuvarlama
+    from filters import convolution, geometry, histogram, morphology, thresholding
+
+    def rounded(values):
+        return np.clip(np.rint(values), 0, 255).astype(np.uint8)
+
+    cases = []
+    for k in (3, 15, 31):
+        # Ortalama artık yuvarlanıyor; tek kenarlı çekirdekte .5 eşitliği olamaz, +0.5 ve kesme aynı sonuç
+        cases.append((f"convolution.apply_mean_filter[gray,kernel_size={k}]",
+                      lambda i, k=k: convolution.apply_mean_filter(i["gray"], k),
+                      lambda i, k=k: baseline.apply_mean_filter(i["gray"] + 0.5, k)))
+    for k in (3, 7):
+        cases.append((f"convolution.apply_median_filter[gray,kernel_size={k}]",
+                      lambda i, k=k: convolution.apply_median_filter(i["gray"], k),
+                      lambda i, k=k: baseline.apply_median_filter(i["gray"], k)))
+    cases += [
+        ("convolution.apply_median_filter[rgb,kernel_size=3]",
+         lambda i: convolution.apply_median_filter(i["rgb"], 3),
+         lambda i: np.stack([baseline.apply_median_filter(i["rgb"][..., c], 3) for c in range(3)], axis=-1)),
+        ("convolution.apply_edge_filter[gray]", lambda i: convolution.apply_edge_filter(i["gray"]),
+         lambda i: baseline.apply_edge_filter(i["gray"].astype(np.int32))),
+        ("convolution.apply_smoothing_filter[gray]", lambda i: convolution.apply_smoothing_filter(i["gray"]),
+         lambda i: rounded(baseline.apply_smoothing_filter(i["gray"].astype(np.float32)))),
+        ("convolution.apply_sharpen_filter[gray]", lambda i: convolution.apply_sharpen_filter(i["gray"]),
+         lambda i: rounded(baseline.apply_sharpen_filter(i["gray"].astype(np.float32)))),
+    ]
+    for name in ("calculate_histogram", "histogram_equalization", "contrast_stretching"):
+        cases.append((f"histogram.{name}[gray]", lambda i, name=name: getattr(histogram, name)(i["gray"]),
+                      lambda i, name=name: getattr(baseline, name)(i["gray"])))
+    cases.append(("thresholding.manual_threshold[gray,threshold=128]",
+                  lambda i: thresholding.manual_threshold(i["gray"], 128),
+                  lambda i: baseline.manual_threshold(i["gray"], 128)))
+    for name in ("otsu_threshold", "kapur_threshold"):
+        cases.append((f"thresholding.{name}[gray]", lambda i, name=name: getattr(thresholding, name)(i["gray"]),
+                      lambda i, name=name: getattr(baseline, name)(i["gray"])))
+    for module, name in ((morphology, "dilation"), (morphology, "erosion"),
+                         (geometry, "compute_centroid"), (geometry, "skeletonize")):
+        cases.append((f"{module.__name__.split('.')[-1]}.{name}[binary]",
+                      lambda i, module=module, name=name: getattr(module, name)(i["binary"]),
+                      lambda i, name=name: getattr(baseline, name)(i["binary"])))
+    for name in ("flip_horizontal", "flip_vertical"):
+        cases.append((f"geometry.{name}[pil_rgb]", lambda i, name=name: getattr(geometry, name)(i["pil_rgb"]),
+                      lambda i, name=name: getattr(baseline, name)(i["pil_rgb"])))
+    cases += [
+        ("geometry.rotate_image_array[gray,angle_deg=90]",
+         lambda i: geometry.rotate_image_array(i["gray"], 90),
+         lambda i: baseline.rotate_image_array(i["gray"], 90), _shift_columns),
+        ("geometry.rotate_image[pil_rgb,angle_deg=90]",
+         lambda i: geometry.rotate_image(i["pil_rgb"], 90),
+         lambda i: baseline.rotate_image(i["pil_rgb"], 90), _shift_columns),
+    ]
+    return [case if len(case) == 4 else case + (None,) for case in cases]
+
+
+# İlk sürümle karşılaştırılmayan, bilerek değiştirilmiş davranışlar
+REFERENCE_SKIPPED = {
+    "geometry.rotate_image_array (90° katı olmayan)": "çıktı tuvali sıkı sınır kutusu, piksel merkezleri +0.5",
+    "geometry.shear_image": "sabit 1.5x tuval yerine kaydırılmış görüntüyü tam kapsayan tuval",
+    "renkli ve float32 girdiler": "ilk sürüm yalnızca gri uint8 görüntü işliyordu (medyan hariç)",
+}
+
+
+def reference_mismatches(pattern=None):
+    inputs = make_inputs(GOLDEN_SHAPE, seed=1234)
+    mismatched = []
+    for label, current, reference, align in _reference_cases():
+        if pattern and pattern not in label:
+            continue
+        actual, expected = current(inputs), reference(inputs)
+        if align is not None:
+            actual, expected = align(actual, expected)
+        if isinstance(expected, (tuple, type(None))):
+            same = actual == expected
+        else:
+            actual, expected = np.asarray(actual), np.asarray(expected)
+            same = actual.shape == expected.shape and np.array_equal(actual, expected)
+        if not same:
+            mismatched.append(label)
+    return mismatched
+
+
+def coverage_report():
+    covered = {case.function_id for case in CASES}
+    missing = []
+    for module_name in MODULES:
+        module = importlib.import_module("filters." + module_name)
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            function_id = f"{module_name}.{name}"
+            if func.__module__ == module.__name__ and not name.startswith("_") \
+                    and function_id not in covered and function_id not in SKIPPED:
+                missing.append(function_id)
+    return missing
+
+
+def parse_size(text):
+    text = text.lower()
+    if text in NAMED_SIZES:
+        return NAMED_SIZES[text]
+    if "x" in text:
+        w, h = text.split("x")
+        return int(h), int(w)
+    return int(text), int(text)
+
+
+def size_label(shape):
+    return f"{shape[1]}x{shape[0]}"
+
+
+def measure(func):
+    # Isınma çalıştırması süre ölçümüne katılmaz; bellek ayrı bir çalıştırmada izlenir
+    start = time.perf_counter()
+    func()
+    times = [time.perf_counter() - start]
+    total = times[0]
+    while total < MIN_TIME and len(times) < MAX_REPEAT:
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+        total += times[-1]
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return {"time": min(times), "median": statistics.median(times), "repeat": len(times), "peak_bytes": peak}
+
+
+def run(sizes, pattern=None, progress=print):
+    results = {}
+    for shape in sizes:
+        inputs = make_inputs(shape)
+        for case in CASES:
+            if pattern and pattern not in case.label:
+                continue
+            if case.max_pixels and shape[0] * shape[1] > case.max_pixels:
+                continue
+            key = f"{case.label}@{size_label(shape)}"
+            results[key] = measure(case.runner(inputs))
+            if progress:
+                entry = results[key]
+                progress(f"{key:<78} {entry['time'] * 1000:>10.2f} ms {entry['peak_bytes'] / 1e6:>9.1f} MB")
+    return results
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def compare(baseline, results, threshold):
+    # (satırlar, regresyonlar): süre veya tepe bellek eşikten fazla artmışsa regresyon
+    rows, regressions = [], []
+    for key, entry in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        ratio = entry["time"] / max(old["time"], 1e-12)
+        memory_ratio = entry["peak_bytes"] / max(old["peak_bytes"], 1)
+        slower = ratio > 1 + threshold and entry["time"] - old["time"] > NOISE_FLOOR
+        larger = memory_ratio > 1 + threshold and entry["peak_bytes"] - old["peak_bytes"] > MEMORY_FLOOR
+        rows.append((key, old["time"], entry["time"], ratio, memory_ratio))
+        if slower or larger:
+            regressions.append(key)
+    return rows, regressions
+
+
+def digest(value):
+    if isinstance(value, Image.Image):
+        value = np.asarray(value)
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        header = f"{data.dtype.str}{data.shape}".encode()
+        return hashlib.blake2b(header + data.tobytes(), digest_size=16).hexdigest()
+    if isinstance(value, (tuple, list)):
+        return "(" + ",".join(digest(v) for v in value) + ")"
+    if isinstance(value, (float, np.floating)):
+        return repr(round(float(value), 9))
+    if isinstance(value, (bool, np.bool_)):
+        return repr(bool(value))
+    if isinstance(value, (int, np.integer)):
+        # numpy sayılarının repr'i sürüme bağlı (np.int64(0) / 0)
+        return repr(int(value))
+    return repr(value)
+
+
+def golden_outputs(pattern=None):
+    inputs = make_inputs(GOLDEN_SHAPE, seed=1234)
+    outputs = {}
+    for case in CASES:
+        if pattern and pattern not in case.label:
+            continue
+        outputs[case.label] = digest(case.runner(inputs)())
+    return outputs
+
+
+def check_golden(pattern=None):
+    expected = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+    actual = golden_outputs(pattern)
+    mismatched = [key for key, value in actual.items() if key in expected and expected[key] != value]
+    unknown = [key for key in actual if key not in expected]
+    return mismatched, unknown
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="filters.* ölçüm ve regresyon paketi")
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES),
+                        help="kare kenarı (1024), GxY (1920x1080) ya da hd/4k/8k")
+    parser.add_argument("--filter", default=None, help="durum adında aranacak alt dize")
+    parser.add_argument("--save", default=None, help="sonuçları JSON temel çizgi olarak kaydet")
+    parser.add_argument("--compare", default=None, help="JSON temel çizgiyle karşılaştır")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="izin verilen göreli yavaşlama / bellek artışı (0.25 = %%25)")
+    parser.add_argument("--golden", action="store_true", help="çıktıları golden.json ile karşılaştır")
+    parser.add_argument("--update-golden", action="store_true", help="golden.json'u yeniden yaz")
+    args = parser.parse_args(argv)
+
+    missing = coverage_report()
+    if missing:
+        print("Ölçüm durumu olmayan fonksiyonlar: " + ", ".join(missing))
+
+    if args.update_golden:
+        outputs = golden_outputs()
+        GOLDEN_PATH.write_text(json.dumps(outputs, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"{len(outputs)} referans çıktı kaydedildi: {GOLDEN_PATH}")
+        return 0
+
+    if args.golden:
+        mismatched, unknown = check_golden(args.filter)
+        for key in unknown:
+            print(f"referansı yok: {key}")
+        for key in mismatched:
+            print(f"FARKLI: {key}")
+        print(f"{len(mismatched)} farklı çıktı")
+        baseline_mismatched = reference_mismatches(args.filter)
+        for key in baseline_mismatched:
+            print(f"İLK SÜRÜMDEN FARKLI: {key}")
+        print(f"{len(baseline_mismatched)} ilk sürümden farklı çıktı")
+        return 1 if mismatched or baseline_mismatched else 0
+
+    sizes = [parse_size(s) for s in args.sizes]
+    results = run(sizes, args.filter)
+
+    if args.save:
+        Path(args.save).write_text(json.dumps({"environment": environment(), "results": results}, indent=1),
+                                   encoding="utf-8")
+        print(f"{len(results)} ölçüm kaydedildi: {args.save}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["results"]
+        rows, regressions = compare(baseline, results, args.threshold)
+        print(f"\n{'durum':<78} {'önce (ms)':>10} {'sonra (ms)':>10} {'süre':>7} {'bellek':>7}")
+        for key, old, new, ratio, memory_ratio in rows:
+            mark = "  <-- regresyon" if key in regressions else ""
+            print(f"{key:<78} {old * 1000:>10.2f} {new * 1000:>10.2f} {ratio:>6.2f}x {memory_ratio:>6.2f}x{mark}")
+        print(f"{len(regressions)} regresyon (eşik %{args.threshold * 100:.0f})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Filtre sonuçları için önbellek. Anahtar: işlem adı + parametreler + girdi dizilerinin
+# içerik özeti (xxhash varsa xxh3_128, yoksa blake2b). Bellekte bayt sınırlı LRU tutulur;
+# isteğe bağlı bir klasör verilirse bellekten atılan sonuçlar diske yazılır ve
+# sonraki çalıştırmalarda oradan okunur. Disk biçimi pickle değildir (klasör paylaşılabilir):
+# diziler .npz girdileri olarak (allow_pickle=False ile okunur), demet/sayı yapısı JSON.
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+SMALL_RESULT_BYTES = 64
+
+_hash_memo = {}
+_hash_lock = threading.Lock()
+
+
+def _digest(data):
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def content_hash(array):
+    # Verisinin sahibi olan salt okunur diziler değişemeyeceğinden özetleri
+    # nesne başına bir kez hesaplanır
+    array = np.asarray(array)
+    memo_key = id(array)
+    immutable = not array.flags.writeable and array.base is None
+    if immutable:
+        with _hash_lock:
+            entry = _hash_memo.get(memo_key)
+        if entry is not None and entry[0]() is array:
+            return entry[1]
+
+    data = np.ascontiguousarray(array).data
+    value = f"{array.dtype.str}{array.shape}:{_digest(data)}"
+
+    if immutable:
+        def forget(_, key=memo_key):
+            with _hash_lock:
+                _hash_memo.pop(key, None)
+        with _hash_lock:
+            _hash_memo[memo_key] = (weakref.ref(array, forget), value)
+    return value
+
+
+def result_nbytes(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(result_nbytes(v) for v in value) + SMALL_RESULT_BYTES
+    return SMALL_RESULT_BYTES
+
+
+def freeze(value):
+    # Paylaşılan sonuçlar yanlışlıkla yerinde değiştirilmesin
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            freeze(v)
+    return value
+
+
+def _key_part(value):
+    if isinstance(value, np.ndarray):
+        return content_hash(value)
+    if isinstance(value, (tuple, list)):
+        return "(" + ",".join(_key_part(v) for v in value) + ")"
+    return repr(value)
+
+
+def _encode(value, arrays):
+    # Diziler ve numpy sayıları arrays listesine, yapının geri kalanı JSON uyumlu düzene
+    if isinstance(value, (np.ndarray, np.generic)):
+        array = np.asarray(value)
+        if array.dtype.hasobject:
+            raise TypeError("Nesne dizileri diske yazılamaz")
+        arrays.append(array)
+        return {"array": len(arrays) - 1, "scalar": isinstance(value, np.generic)}
+    if isinstance(value, (tuple, list)):
+        return {"tuple" if isinstance(value, tuple) else "list": [_encode(v, arrays) for v in value]}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return {"value": value}
+    raise TypeError(f"Diske yazılamayan sonuç tipi: {type(value).__name__}")
+
+
+def _decode(layout, arrays):
+    if "array" in layout:
+        array = arrays[f"a{layout['array']}"]
+        return array[()] if layout["scalar"] else array
+    if "tuple" in layout:
+        return tuple(_decode(v, arrays) for v in layout["tuple"])
+    if "list" in layout:
+        return [_decode(v, arrays) for v in layout["list"]]
+    return layout["value"]
+
+
+def make_key(name, args, kwargs):
+    parts = [name] + [_key_part(v) for v in args]
+    parts += [f"{k}={_key_part(kwargs[k])}" for k in sorted(kwargs)]
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, spill_dir=None):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "spills": 0}
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def spill_path(self, key):
+        return os.path.join(self.spill_dir, key + ".npz")
+
+    def get(self, key):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return True, self.entries[key][0]
+        if self.spill_dir and os.path.exists(self.spill_path(key)):
+            value = self.load_spilled(key)
+            if value is not None:
+                with self.lock:
+                    self.stats["disk_hits"] += 1
+                self.put(key, value[0], spilled=True)
+                return True, value[0]
+        with self.lock:
+            self.stats["misses"] += 1
+        return False, None
+
+    def put(self, key, value, spilled=False):
+        size = result_nbytes(value)
+        evicted = []
+        with self.lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+            self.entries[key] = (freeze(value), size, spilled)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                old_key, (old_value, old_size, old_spilled) = self.entries.popitem(last=False)
+                self.total_bytes -= old_size
+                self.stats["evictions"] += 1
+                if not old_spilled:
+                    evicted.append((old_key, old_value))
+        for old_key, old_value in evicted:
+            self.spill(old_key, old_value)
+
+    def load_spilled(self, key):
+        # (değer,) ya da okunamayan/bozuk dosyada None (ıska sayılır)
+        try:
+            with np.load(self.spill_path(key), allow_pickle=False) as data:
+                layout = json.loads(str(data["layout"]))
+                return (freeze(_decode(layout, data)),)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def spill(self, key, value):
+        if not self.spill_dir:
+            return
+        arrays = []
+        try:
+            layout = _encode(value, arrays)
+        except TypeError:
+            return
+        tmp = self.spill_path(key) + ".tmp"
+        with open(tmp, "wb") as handle:
+            np.savez(handle, layout=np.array(json.dumps(layout)),
+                     **{f"a{index}": array for index, array in enumerate(arrays)})
+        os.replace(tmp, self.spill_path(key))
+        with self.lock:
+            self.stats["spills"] += 1
+
+    def flush(self):
+        # Bellekteki tüm sonuçları diske yaz (sonraki çalıştırmalar için)
+        with self.lock:
+            pending = [(k, v[0]) for k, v in self.entries.items() if not v[2]]
+            for k, _ in pending:
+                value, size, _ = self.entries[k]
+                self.entries[k] = (value, size, True)
+        for key, value in pending:
+            self.spill(key, value)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def call(self, name, func, *args, **kwargs):
+        key = make_key(name, args, kwargs)
+        found, value = self.get(key)
+        if found:
+            return value
+        value = func(*args, **kwargs)
+        self.put(key, value)
+        return value
+
+    def memoize(self, func, name=None):
+        name = name or f"{func.__module__}.{func.__qualname__}"
+
+        def wrapper(*args, **kwargs):
+            return self.call(name, func, *args, **kwargs)
+        wrapper.__wrapped__ = func
+        return wrapper
+
+    def summary(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self.entries)
+            stats["bytes"] = self.total_bytes
+        return stats
@@ -1,39 +1,48 @@
 import numpy as np
-from scipy.ndimage import convolve
-
-
-# Filtre fonksiyonları
-def apply_mean_filter(image_array, kernel_size=3):
-    kernel = np.ones((kernel_size, kernel_size)) / (kernel_size ** 2)
-    filtered = convolve(image_array, kernel, mode='reflect')
-    return filtered.astype(np.uint8)
-
-def apply_median_filter(image_array, kernel_size=3):
-    padded = np.pad(image_array, kernel_size // 2, mode='reflect')
-    output = np.zeros_like(image_array)
-    h, w = image_array.shape
-
-    for i in range(h):
-        for j in range(w):
-            region = padded[i:i+kernel_size, j:j+kernel_size]
-            output[i, j] = np.median(region)
-
-    return output
-
-# TO-DO: farklı kernelle çalış, perwitt ve sobel
-def apply_edge_filter(image_array):
-    kernel = np.array([[-1, -1, -1],
-                       [-1,  8, -1],
-                       [-1, -1, -1]])
-    filtered = convolve(image_array, kernel, mode='reflect')
-    return np.clip(filtered, 0, 255).astype(np.uint8)
-
-def apply_smoothing_filter(image_array):
-    kernel = np.ones((3, 3), dtype=np.float32) / 9.0  # 3x3 filtre
-    return convolve(image_array, kernel)
-
-def apply_sharpen_filter(image_array):
-    kernel = np.array([[0, -1,  0],
-                       [-1,  5, -1],
-                       [0, -1,  0]], dtype=np.float32)
-    return convolve(image_array, kernel)
\ No newline at end of file
+
+from filters.dtypes import to_uint8
+from filters.linear import box_filter, filter_image, gaussian_kernel, gradient_magnitude
+from filters.median import median_filter
+
+EDGE_KERNEL = np.array([[-1, -1, -1],
+                        [-1,  8, -1],
+                        [-1, -1, -1]], dtype=np.float32)
+
+SHARPEN_KERNEL = np.array([[0, -1,  0],
+                           [-1, 5, -1],
+                           [0, -1,  0]], dtype=np.float32)
+
+
+# Filtre fonksiyonları; hepsi uint8 döndürür (yuvarlama + [0, 255] kırpma, float girdide
+# ortanca dahil), out verilirse sonuç o diziye yazılır
+def apply_mean_filter(image_array, kernel_size=3, out=None):
+    return box_filter(image_array, kernel_size, out)
+
+def apply_median_filter(image_array, kernel_size=3, out=None):
+    if image_array.dtype == np.uint8:
+        return median_filter(image_array, kernel_size, out=out)
+    return to_uint8(median_filter(image_array, kernel_size).astype(np.float32, copy=False), out)
+
+def apply_edge_filter(image_array, out=None):
+    return filter_image(image_array, EDGE_KERNEL, out=out)
+
+def apply_smoothing_filter(image_array, out=None):
+    return box_filter(image_array, 3, out)
+
+def apply_sharpen_filter(image_array, out=None):
+    return filter_image(image_array, SHARPEN_KERNEL, out=out)
+
+def apply_gaussian_filter(image_array, sigma=1.0, out=None):
+    return filter_image(image_array, gaussian_kernel(float(sigma)), out=out)
+
+def apply_gradient_filter(image_array, operator="sobel", out=None):
+    return gradient_magnitude(image_array, operator, out)
+
+def apply_sobel_filter(image_array, out=None):
+    return gradient_magnitude(image_array, "sobel", out)
+
+def apply_prewitt_filter(image_array, out=None):
+    return gradient_magnitude(image_array, "prewitt", out)
+
+def apply_scharr_filter(image_array, out=None):
+    return gradient_magnitude(image_array, "scharr", out)
@@ -0,0 +1,84 @@
+import threading
+
+import numpy as np
+
+# Filtre modülleri için veri tipi politikası:
+# - çalışma hassasiyeti float32 (WORK_DTYPE); float64 yalnızca gerçekten gereken yerde
+#   (integral görüntüler, histogram istatistikleri)
+# - float -> uint8 dönüşümü doyurmalı: yuvarlama + [0, 255] kırpma, taşma/sarma yok
+# - uint8 nokta işlemleri 256'lık LUT ile tamsayı-kesin; out verilirse önbellek boyu
+#   satır parçalarıyla, tam boy ara dizi olmadan
+# - out verilirse sonuç o diziye yazılır (aynı şekil ve tip). Ara float32 sonuçlar iş
+#   parçacığına özel karalama tamponlarından gelir; zincirleme çağrılarda yeniden kullanılır.
+# - gri dönüşüm (to_gray) tüm modüllerde ortak: histogram, karo, toplu işleme, yığınlar
+
+WORK_DTYPE = np.float32
+BLOCK_PIXELS = 1 << 16              # parça parça işlemlerde parça boyu (L2'de kalır)
+SCRATCH_MAX_BYTES = 16 * 1024 * 1024  # daha büyük ara diziler saklanmaz, her çağrıda açılır
+
+_local = threading.local()
+
+
+def to_uint8(values, out=None):
+    # values yerinde yuvarlanır ve kırpılır (çağıranın kendi float tamponu)
+    np.rint(values, out=values)
+    np.clip(values, 0, 255, out=values)
+    if out is None:
+        return values.astype(np.uint8)
+    np.copyto(out, values, casting="unsafe")
+    return out
+
+
+def to_gray(block):
+    # PIL convert("L") ile aynı tamsayı formülü (ITU-R 601-2); son eksen RGB/RGBA kanalları
+    # olmalı ((N, H, W) gibi gri yığınlar kanal sanılmaz)
+    if block.ndim == 2:
+        return block
+    if block.shape[-1] not in (3, 4):
+        raise ValueError(f"Son eksende 3 ya da 4 renk kanalı bekleniyordu: {block.shape}")
+    r, g, b = (block[..., c].astype(np.uint32) for c in range(3))
+    return ((r * 19595 + g * 38470 + b * 7471 + 0x8000) >> 16).astype(np.uint8)
+
+
+def output_array(shape, out=None, dtype=np.uint8):
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != tuple(shape) or out.dtype != dtype:
+        raise ValueError(f"out dizisi uyumsuz: {out.shape} {out.dtype}, beklenen {tuple(shape)} {np.dtype(dtype)}")
+    return out
+
+
+def scratch(name, shape, dtype=WORK_DTYPE):
+    # Adla yeniden kullanılan ara tampon; içeriği aynı adlı bir sonraki çağrıda ezilir,
+    # bu yüzden hiçbir zaman sonuç olarak döndürülmez
+    dtype = np.dtype(dtype)
+    size = int(np.prod(shape))
+    if size * dtype.itemsize > SCRATCH_MAX_BYTES:
+        return np.empty(shape, dtype=dtype)
+    buffers = getattr(_local, "buffers", None)
+    if buffers is None:
+        buffers = _local.buffers = {}
+    buffer = buffers.get((name, dtype))
+    if buffer is None or buffer.size < size:
+        buffer = buffers[(name, dtype)] = np.empty(size, dtype=dtype)
+    return buffer[:size].reshape(shape)
+
+
+def clear_scratch():
+    # Bu iş parçacığının karalama tamponlarını bırak (örn. uzun bir toplu işin sonunda)
+    _local.buffers = {}
+
+
+def row_blocks(shape):
+    rows = max(1, BLOCK_PIXELS // max(int(np.prod(shape[1:])), 1))
+    return [slice(start, start + rows) for start in range(0, shape[0], rows)]
+
+
+def apply_lut(image_array, lut, out=None):
+    # uint8 -> LUT tipi; out yoksa tek gather (yalnızca sonuç dizisi açılır)
+    if out is None:
+        return lut[image_array]
+    out = output_array(image_array.shape, out, lut.dtype)
+    for block in row_blocks(image_array.shape):
+        out[block] = lut[image_array[block]]
+    return out
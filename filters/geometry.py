@@ -1,91 +1,238 @@
 import numpy as np
 from skimage.morphology import skeletonize as ski_skeletonize
 from PIL import Image
-from scipy.ndimage import affine_transform
+from scipy.ndimage import affine_transform, spline_filter
+
+from filters.dtypes import to_uint8
+from filters.thinning import foreground_box
+
+# Geometrik dönüşümler. Matrisler (satır, sütun) koordinatlarında ileri yönlüdür:
+# çıktı = M @ girdi. 90°'nin katları ve aynalamalar (işaretli permütasyon matrisleri)
+# yeniden örneklenmez: dizilerde kopyasız adım (stride) görünümü, PIL görüntülerinde tek
+# transpose. Diğer dönüşüm zincirleri (döndürme + kaydırma + ölçekleme) tek matriste
+# birleştirilip bir kez örneklenir; çıktı, dönüştürülen görüntünün sınır kutusu kadardır.
+# uint8 L/RGB görüntüler ve 0/1/3 dereceleri PIL ile (kanallar tek geçişte), diğerleri
+# scipy.ndimage ile örneklenir.
+
+PIL_RESAMPLE = {0: Image.NEAREST, 1: Image.BILINEAR, 3: Image.BICUBIC}
 
 def compute_centroid(binary_image):
-    indices = np.argwhere(binary_image == 255)
+    # N x 2 indis dizisi yerine satır/sütun izdüşümlerinin ağırlıklı ortalaması
+    mask = binary_image == 255
+    rows, cols = np.count_nonzero(mask, axis=1), np.count_nonzero(mask, axis=0)
+    total = rows.sum()
 
-    if len(indices) == 0:
+    if total == 0:
         return None
 
-    centroid = indices.mean(axis=0)
-    return int(centroid[1]), int(centroid[0])  # (x, y)
+    y = np.dot(rows, np.arange(rows.size)) / total
+    x = np.dot(cols, np.arange(cols.size)) / total
+    return int(x), int(y)  # (x, y)
 
 def skeletonize(binary_image):
-    binary = (binary_image == 255).astype(np.uint8)
-    skeleton = ski_skeletonize(binary)
-    return (skeleton * 255).astype(np.uint8)
+    # Yalnızca ön plan kutusu (+1 piksel arka plan) işlenir; sonuç tek yazımla uint8'e
+    mask = binary_image == 255
+    skeleton = np.zeros(mask.shape, dtype=np.uint8)
+    box = foreground_box(mask, margin=1)
+    if box is not None:
+        y0, y1, x0, x1 = box
+        skeleton[y0:y1, x0:x1][ski_skeletonize(mask[y0:y1, x0:x1])] = 255
+    return skeleton
+
+def rotation_matrix(angle_deg):
+    # Pozitif açı ekranda saat yönünde
+    angle_rad = np.deg2rad(angle_deg)
+    cos_a, sin_a = np.cos(angle_rad), np.sin(angle_rad)
+    return np.array([[cos_a, sin_a],
+                     [-sin_a, cos_a]])
 
-def rotate_image(pil_image, angle_deg=90):
-    img_array = np.array(pil_image)
 
-    if len(img_array.shape) == 2:
-        rotated = rotate_image_array(img_array, angle_deg)
-        return Image.fromarray(rotated.astype(np.uint8))
+def shear_matrix(shear_x=0.0, shear_y=0.0):
+    # PIL AFFINE tanımı: girdi_x = x + shear_x * y, girdi_y = shear_y * x + y
+    return np.linalg.inv(np.array([[1.0, shear_y],
+                                   [shear_x, 1.0]]))
 
-    channels = []
-    for i in range(3):
-        rotated_channel = rotate_image_array(img_array[:, :, i], angle_deg)
-        channels.append(rotated_channel.astype(np.uint8))
 
-    rotated_rgb = np.stack(channels, axis=2)
-    return Image.fromarray(rotated_rgb)
+def scale_matrix(scale_y, scale_x=None):
+    return np.diag([scale_y, scale_y if scale_x is None else scale_x]).astype(np.float64)
 
 
-def rotate_image_array(image_array, angle_deg):
-    angle_rad = np.deg2rad(angle_deg)
-    cos_a, sin_a = np.cos(angle_rad), np.sin(angle_rad)
+def compose_affine(*matrices):
+    # Verilen sırayla uygulanan dönüşümlerin tek matrisi
+    result = np.eye(2)
+    for matrix in matrices:
+        result = np.asarray(matrix, dtype=np.float64) @ result
+    return result
 
-    transform_matrix = np.array([
-        [cos_a, -sin_a],
-        [sin_a,  cos_a]
-    ])
 
-    h, w = image_array.shape
+def signed_permutation(matrix, tolerance=1e-9):
+    rounded = np.rint(matrix)
+    if np.abs(matrix - rounded).max() > tolerance:
+        return None
+    magnitude = np.abs(rounded)
+    if magnitude.max() != 1 or not (magnitude.sum(axis=0) == 1).all() or not (magnitude.sum(axis=1) == 1).all():
+        return None
+    return rounded.astype(int)
+
+
+def permute_view(image_array, matrix):
+    # matrix = aynalama @ permütasyon; önce eksen değişimi, sonra aynalama; kopya yapılmaz
+    if matrix[0, 0] == 0:
+        view = image_array.swapaxes(0, 1)
+        signs = (matrix[0, 1], matrix[1, 0])
+    else:
+        view = image_array
+        signs = (matrix[0, 0], matrix[1, 1])
+    if signs[0] < 0:
+        view = view[::-1]
+    if signs[1] < 0:
+        view = view[:, ::-1]
+    return view
+
+
+def output_bounds(shape, matrix):
+    # Dönüştürülen piksel kenarlarının sınır kutusu: (sol üst köşe, çıktı boyutu)
+    h, w = shape[:2]
+    corners = np.array([[0, 0], [0, w], [h, 0], [h, w]], dtype=np.float64) @ matrix.T
+    low = corners.min(axis=0)
+    size = np.maximum(np.ceil(corners.max(axis=0) - low - 1e-6), 1).astype(int)
+    return low, (int(size[0]), int(size[1]))
+
+
+def _pil_compatible(image_array, order):
+    return (order in PIL_RESAMPLE and image_array.dtype == np.uint8
+            and (image_array.ndim == 2 or image_array.shape[2] in (3, 4)))
+
+
+def _band(output_shape, rows):
+    # rows = (r0, r1): çıktının yalnızca bu satırları (paralel bant işleme); None ise tümü
+    return rows if rows is not None else (0, output_shape[0])
+
+
+def _pil_warp(image, matrix, order, cval, rows=None):
+    low, output_shape = output_bounds((image.height, image.width), matrix)
+    r0, r1 = _band(output_shape, rows)
+    inverse = np.linalg.inv(matrix)
+    # PIL (x, y) sürekli koordinatlarıyla çalışır: girdi = inverse @ (çıktı + low)
+    shift = inverse @ (low + (r0, 0))
+    coefficients = (inverse[1, 1], inverse[1, 0], shift[1], inverse[0, 1], inverse[0, 0], shift[0])
+    fill = cval if len(image.getbands()) == 1 else (cval,) * len(image.getbands())
+    return image.transform((output_shape[1], r1 - r0), Image.AFFINE, coefficients,
+                           resample=PIL_RESAMPLE[order], fillcolor=fill)
+
+
+def warp_affine(image_array, matrix, order=1, cval=0, rows=None):
+    # İşaretli permütasyonlarda girdinin görünümü döner (yazılabilir kopya değil)
+    matrix = np.asarray(matrix, dtype=np.float64)
+    permutation = signed_permutation(matrix)
+    if permutation is not None:
+        view = permute_view(image_array, permutation)
+        return view if rows is None else view[rows[0]:rows[1]]
+
+    if _pil_compatible(image_array, order):
+        image = Image.fromarray(np.ascontiguousarray(image_array))
+        return np.asarray(_pil_warp(image, matrix, order, cval, rows))
+    return _scipy_warp(image_array, matrix, order, cval, rows)
+
+
+def _planes(image_array, output):
+    # scipy.ndimage kanal kanal çalışır: (girdi düzlemi, çıktı düzlemi) çiftleri
+    if image_array.ndim == 2:
+        return [(image_array, output)]
+    return [(image_array[:, :, c], output[:, :, c]) for c in range(image_array.shape[2])]
+
+
+def _scipy_warp(image_array, matrix, order, cval, rows=None, dtype=None, prefilter=True):
+    # prefilter=False: image_array warp_source'ta spline ön süzgecinden geçmiş float64 kaynak,
+    # dtype orijinal girdinin tipi
+    dtype = image_array.dtype if dtype is None else dtype
+    low, output_shape = output_bounds(image_array.shape, matrix)
+    r0, r1 = _band(output_shape, rows)
+    inverse = np.linalg.inv(matrix)
+    # Piksel merkezleri +0.5'te: girdi = inverse @ (çıktı + 0.5 + low) - 0.5
+    offset = inverse @ (low + (r0, 0) + 0.5) - 0.5
+    # 1'den büyük derecelerde spline aşımı olur; float32'de hesaplanıp kırpılır
+    smooth = order > 1 and dtype == np.uint8
+    output = np.empty((r1 - r0, output_shape[1]) + image_array.shape[2:],
+                      dtype=np.float32 if smooth else dtype)
+    for plane, target in _planes(image_array, output):
+        affine_transform(plane, inverse, offset=offset, output=target, order=order,
+                         mode='constant', cval=cval, prefilter=prefilter)
+    return to_uint8(output) if smooth else output
+
+
+def warp_source(image_array, order=1):
+    # Bant bant çarpıtmada her bantta yeniden kullanılan kaynak: PIL yolunda dizi bir kez
+    # görüntüye dönüştürülür (her bantta dönüştürmek tüm görüntüyü kopyalardı). scipy yolunda
+    # 1'den büyük derecelerde spline ön süzgeci bir kez uygulanır: (float64 katsayılar, girdi tipi);
+    # affine_transform aksi halde her bantta tüm girdiyi yeniden süzerdi
+    if _pil_compatible(image_array, order):
+        return Image.fromarray(np.ascontiguousarray(image_array))
+    if order > 1:
+        coefficients = np.empty(image_array.shape, dtype=np.float64)
+        for plane, target in _planes(image_array, coefficients):
+            spline_filter(plane, order, output=target, mode='constant')
+        return coefficients, image_array.dtype
+    return image_array
+
+
+def warp_rows(source, matrix, order=1, cval=0, rows=None):
+    # warp_affine'in çıktı satırları [r0, r1); source, warp_source çıktısı
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if isinstance(source, Image.Image):
+        return np.asarray(_pil_warp(source, matrix, order, cval, rows))
+    if isinstance(source, tuple):
+        coefficients, dtype = source
+        return _scipy_warp(coefficients, matrix, order, cval, rows, dtype, prefilter=False)
+    return warp_affine(source, matrix, order, cval, rows)
+
 
-    new_w = int(abs(h * sin_a) + abs(w * cos_a))
-    new_h = int(abs(h * cos_a) + abs(w * sin_a))
-    output_shape = (new_h, new_w)
+def warp_image(pil_image, matrix, order=1, cval=0):
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if signed_permutation(matrix) is None and order in PIL_RESAMPLE and pil_image.mode in ("L", "RGB", "RGBA"):
+        return _pil_warp(pil_image, matrix, order, cval)
+    return Image.fromarray(np.ascontiguousarray(warp_affine(np.asarray(pil_image), matrix, order, cval)))
 
-    old_center = np.array([h / 2, w / 2])
-    new_center = np.array([new_h / 2, new_w / 2])
-    offset = old_center - transform_matrix @ new_center
 
-    rotated = affine_transform(
-        image_array,
-        transform_matrix,
-        offset=offset,
-        output_shape=output_shape,
-        order=1,
-        mode='constant',
-        cval=255 
-    )
+def rotate_image_array(image_array, angle_deg, order=1, cval=255):
+    return warp_affine(image_array, rotation_matrix(angle_deg), order, cval)
 
-    return rotated
 
+def _quarter_turns(angle_deg):
+    turns = angle_deg / 90
+    return int(turns) % 4 if float(turns).is_integer() else None
 
-def shear_image(pil_image, shear_x=0.2, shear_y=0.0):
-    width, height = pil_image.size
 
-    matrix = (
-        1, shear_x, 0,
-        shear_y, 1, 0
-    )
+# Saat yönünde çeyrek tur sayısı -> PIL transpose
+_QUARTER_TURNS = {1: Image.ROTATE_270, 2: Image.ROTATE_180, 3: Image.ROTATE_90}
+
+
+def rotate_image(pil_image, angle_deg=90, order=1):
+    turns = _quarter_turns(angle_deg)
+    if turns == 0:
+        return pil_image.copy()
+    if turns is not None:
+        return pil_image.transpose(_QUARTER_TURNS[turns])
+    return warp_image(pil_image, rotation_matrix(angle_deg), order, cval=255)
+
+
+def shear_image(pil_image, shear_x=0.2, shear_y=0.0, order=3):
+    # Çıktı tuvali kaydırılmış görüntüyü tam kapsar (kırpma ve boş kenar yok)
+    return warp_image(pil_image, shear_matrix(shear_x, shear_y), order)
+
+
+def affine_image(pil_image, angle_deg=0.0, shear_x=0.0, shear_y=0.0, scale=1.0, order=1, cval=0):
+    # Ölçekleme, kaydırma ve döndürme tek matriste; görüntü bir kez örneklenir
+    matrix = compose_affine(scale_matrix(scale), shear_matrix(shear_x, shear_y), rotation_matrix(angle_deg))
+    return warp_image(pil_image, matrix, order, cval)
 
-    return pil_image.transform(
-        (int(width * 1.5), int(height * 1.5)),  # Kırpma olmasın diye
-        Image.AFFINE,
-        matrix,
-        resample=Image.BICUBIC
-    )
 
 def flip_horizontal(pil_image):
-    arr = np.array(pil_image)
-    flipped = arr[:, ::-1]
-    return Image.fromarray(flipped)
+    return pil_image.transpose(Image.FLIP_LEFT_RIGHT)
 
 def flip_vertical(pil_image):
-    arr = np.array(pil_image)
-    flipped = arr[::-1, :]
-    return Image.fromarray(flipped)
+    return pil_image.transpose(Image.FLIP_TOP_BOTTOM)
+
+def flip_array(image_array, axis):
+    # Kopyasız görünüm; axis=1 yatay, axis=0 dikey aynalama
+    return np.flip(image_array, axis)
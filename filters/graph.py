@@ -0,0 +1,153 @@
+import numpy as np
+from scipy.signal import convolve2d
+
+from filters.convolution import EDGE_KERNEL, SHARPEN_KERNEL
+from filters.geometry import permute_view, rotation_matrix, signed_permutation
+from filters.histogram import calculate_histogram
+from filters.linear import filter_image, gaussian_kernel
+from filters.pipeline import PIPELINE_STEPS, format_pipeline
+
+# Tembel işlem grafiği: işlemler kaydedilir, sonuç yalnızca evaluate() çağrıldığında
+# (gösterim/kayıt anında) hesaplanır. Ardışık uyumlu adımlar tek adımda birleştirilir:
+# - nokta işlemleri (eşikleme, eşitleme, germe) tek bir 256'lık LUT'a; veri bağımlı
+#   eşikler ara görüntü yerine histogramın LUT ile eşlenmesinden hesaplanır (birebir aynı)
+# - aynalama ve 90°'nin katı döndürmeler tek bir eksen permütasyonu + aynalamaya (tek kopya)
+# - doğrusal konvolüsyonlar tek bir çekirdeğe (isteğe bağlı: ara uint8 yuvarlamaları ve
+#   kenar yansımaları atlandığından sonuç adım adım çalıştırmadan birkaç gri seviye farklı olabilir)
+
+LUT_STEPS = {
+    "equalize": lambda lut_input, hist: PIPELINE_STEPS["equalize"](lut_input, hist),
+    "stretch": lambda lut_input, hist: PIPELINE_STEPS["stretch"](lut_input, hist),
+    "threshold": lambda lut_input, hist, value: PIPELINE_STEPS["threshold"](lut_input, value),
+    "contrast": lambda lut_input, hist, *args: PIPELINE_STEPS["contrast"](lut_input, *args),
+    "otsu": lambda lut_input, hist: PIPELINE_STEPS["otsu"](lut_input, hist),
+    "kapur": lambda lut_input, hist: PIPELINE_STEPS["kapur"](lut_input, hist),
+}
+
+# Merkez etrafında (satır, sütun) koordinatlarına etki eden işaretli permütasyon matrisleri
+GEOMETRY_STEPS = {
+    "flip_h": np.array([[1, 0], [0, -1]]),
+    "flip_v": np.array([[-1, 0], [0, 1]]),
+    "rot90": np.array([[0, -1], [1, 0]]),  # saat yönünün tersine (np.rot90)
+}
+
+LINEAR_KERNELS = {
+    "mean": lambda k=3: np.ones((k, k)) / (k * k),
+    "smooth": lambda: np.ones((3, 3)) / 9.0,
+    "sharpen": lambda: SHARPEN_KERNEL,
+    "edge": lambda: EDGE_KERNEL,
+    "gaussian": lambda sigma=1.0: gaussian_kernel(float(sigma)),
+}
+
+
+def step_kind(name, fuse_linear=False, args=()):
+    if name in LUT_STEPS:
+        return "lut"
+    if name in GEOMETRY_STEPS or name == "rotate" and step_matrix(name, args) is not None:
+        return "geometry"
+    if fuse_linear and name in LINEAR_KERNELS:
+        return "linear"
+    return "single"
+
+
+def step_matrix(name, args):
+    if name == "rotate":
+        # Yalnızca 90°'nin katları (varsayılan 90, saat yönünde) birebir permütasyondur
+        return signed_permutation(rotation_matrix(args[0] if args else 90))
+    step = GEOMETRY_STEPS[name]
+    matrix = np.eye(2, dtype=int)
+    turns = args[0] % 4 if name == "rot90" and args else 1
+    for _ in range(turns):
+        matrix = step @ matrix
+    return matrix
+
+
+def geometry_matrix(steps):
+    matrix = np.eye(2, dtype=int)
+    for name, args in steps:
+        matrix = step_matrix(name, args) @ matrix
+    return matrix
+
+
+def apply_geometry(image_array, matrix):
+    # Tüm zincir tek görünüm; yalnızca sonunda bir kez kopyalanır
+    return np.ascontiguousarray(permute_view(image_array, matrix))
+
+
+def compose_lut(steps, histogram):
+    # (LUT, son histogram): her adımın LUT'u o ana kadarki görüntünün histogramından
+    identity = np.arange(256, dtype=np.uint8)
+    lut = identity
+    for name, args in steps:
+        step_lut = np.asarray(LUT_STEPS[name](identity, histogram, *args), dtype=np.uint8)
+        histogram = np.bincount(step_lut, weights=histogram, minlength=256).astype(np.int64)
+        lut = step_lut[lut]
+    return lut, histogram
+
+
+def compose_kernel(steps):
+    kernel = np.ones((1, 1))
+    for name, args in steps:
+        kernel = convolve2d(kernel, LINEAR_KERNELS[name](*args))
+    return kernel
+
+
+class LazyImage:
+    def __init__(self, image_array, steps=(), fuse_linear=False):
+        self.source = image_array
+        self.steps = tuple(steps)
+        self.fuse_linear = fuse_linear
+        self.result = None
+
+    def apply(self, name, *args):
+        if name not in PIPELINE_STEPS:
+            raise ValueError(f"Bilinmeyen adım: {name}")
+        return LazyImage(self.source, self.steps + ((name, args),), self.fuse_linear)
+
+    def extend(self, steps):
+        image = self
+        for name, args in steps:
+            image = image.apply(name, *args)
+        return image
+
+    def plan(self):
+        groups = []
+        for name, args in self.steps:
+            kind = step_kind(name, self.fuse_linear, args)
+            if groups and kind != "single" and groups[-1][0] == kind:
+                groups[-1][1].append((name, args))
+            else:
+                groups.append((kind, [(name, args)]))
+        return groups
+
+    def explain(self):
+        lines = []
+        for kind, steps in self.plan():
+            label = format_pipeline(steps)
+            lines.append(f"{kind}[{label}]" if len(steps) > 1 else label)
+        return lines
+
+    def evaluate(self):
+        if self.result is None:
+            image_array = self.source
+            for kind, steps in self.plan():
+                image_array = self.run_group(kind, steps, image_array)
+            self.result = image_array
+        return self.result
+
+    def run_group(self, kind, steps, image_array):
+        if kind == "lut" and image_array.dtype == np.uint8 and image_array.ndim == 2:
+            lut, _ = compose_lut(steps, calculate_histogram(image_array))
+            return lut[image_array]
+        if kind == "geometry":
+            return apply_geometry(image_array, geometry_matrix(steps))
+        if kind == "linear" and len(steps) > 1:
+            # Birleşik çekirdek de motorda en uygun yöntemle (ayrıştırma/FFT) uygulanır
+            return filter_image(image_array, compose_kernel(steps))
+        for name, args in steps:
+            image_array = PIPELINE_STEPS[name](image_array, *args)
+        return image_array
+
+
+def evaluate_pipeline(steps, image_array, fuse_linear=False):
+    return LazyImage(image_array, fuse_linear=fuse_linear).extend(steps).evaluate()
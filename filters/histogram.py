@@ -1,41 +1,153 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from filters.dtypes import apply_lut, output_array, row_blocks, scratch, to_gray, to_uint8
+
+# Ortak histogram çekirdeği: tüm tüketiciler (eşitleme, germe, Otsu, Kapur, çizim)
+# önceden hesaplanmış bir histogramı `histogram=` ile alabilir.
+# Renkli (H, W, 3) görüntülerde eşitleme ve germe parlaklıkta (YCbCr'nin Y bileşeni)
+# yapılır; bu durumda `histogram=` Y kanalının histogramıdır.
+# Histogramlar ve renkli LUT uygulaması satır parçalarıyla yapılır: bincount'un intp
+# dönüşümü ve Y/fark ara dizileri görüntü boyunda değil, parça boyunda açılır.
 
 def calculate_histogram(image_array):
-    histogram = np.zeros(256, dtype=int)
-    for value in image_array.flatten():
-        histogram[value] += 1
+    if image_array.ndim == 3:
+        return channel_histograms(image_array)
+    histogram = np.zeros(256, dtype=np.intp)
+    for block in row_blocks(image_array.shape):
+        histogram += np.bincount(image_array[block].ravel(), minlength=256)
     return histogram
 
+def channel_histograms(image_array):
+    # (H, W, C) -> (C, 256); her kanal 256'lık kaydırma ile tek bincount'ta
+    channels = image_array.shape[2]
+    offsets = np.arange(channels) * 256
+    histogram = np.zeros(channels * 256, dtype=np.intp)
+    for block in row_blocks(image_array.shape):
+        flat = (image_array[block].reshape(-1, channels) + offsets).ravel()
+        histogram += np.bincount(flat, minlength=channels * 256)
+    return histogram.reshape(channels, 256)
+
+def tile_histograms(image_array, tile_size=64):
+    # (H, W) -> (satır karo, sütun karo, 256)
+    th, tw = (tile_size, tile_size) if np.isscalar(tile_size) else tile_size
+    h, w = image_array.shape
+    rows, cols = -(-h // th), -(-w // tw)
+    tile_index = (np.arange(h) // th)[:, None] * cols + (np.arange(w) // tw)[None, :]
+    flat = (tile_index * 256 + image_array).ravel()
+    return np.bincount(flat, minlength=rows * cols * 256).reshape(rows, cols, 256)
+
+def histogram_percentile(histogram, q):
+    # np.percentile (linear) ile birebir aynı sonuç, sıralama yapmadan
+    cdf = np.cumsum(histogram)
+    n = cdf[-1]
+    results = []
+    for value in np.atleast_1d(q):
+        index = (n - 1) * (value / 100)
+        lower = int(np.floor(index))
+        upper = min(lower + 1, n - 1)
+        gamma = index - lower
+        a = float(np.searchsorted(cdf, lower, side='right'))
+        b = float(np.searchsorted(cdf, upper, side='right'))
+        diff = b - a
+        results.append(b - diff * (1 - gamma) if gamma >= 0.5 else a + diff * gamma)
+    return results if np.ndim(q) else results[0]
+
 def plot_histogram(histogram):
+    # Başsız (headless) kullanımda matplotlib yüklenmesin diye burada içe aktarılır
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(6, 4))
     plt.title("Görüntü Histogramı")
     plt.xlabel("Piksel Değeri (0–255)")
     plt.ylabel("Frekans")
-    plt.bar(range(256), histogram, color='gray')
+    if histogram.ndim == 2:
+        for channel, color in zip(histogram, ('red', 'green', 'blue')):
+            plt.plot(range(256), channel, color=color)
+    else:
+        plt.bar(range(256), histogram, color='gray')
     plt.tight_layout()
     plt.show()
 
-def histogram_equalization(image_array):
-    hist = calculate_histogram(image_array)
-    cdf = np.cumsum(hist)
+def luma_histogram(image_array):
+    if image_array.ndim != 3:
+        return calculate_histogram(image_array)
+    histogram = np.zeros(256, dtype=np.intp)
+    for block in row_blocks(image_array.shape):
+        histogram += np.bincount(to_gray(image_array[block]).ravel(), minlength=256)
+    return histogram
 
-    if cdf.max() == cdf.min():
+def apply_luma_lut(image_array, lut, out=None):
+    # Cb ve Cr sabitken YCbCr -> RGB dönüşümünde her kanal Y ile aynı miktarda değişir;
+    # tam dönüşüm yerine Y farkı üç kanala birden eklenir
+    if image_array.ndim != 3:
+        return apply_lut(image_array, lut, out)
+    out = output_array(image_array.shape, out)
+    for block in row_blocks(image_array.shape):
+        pixels = image_array[block]
+        luma = to_gray(pixels)
+        delta = lut[luma].astype(np.int16) - luma
+        np.clip(pixels + delta[..., None], 0, 255, out=out[block], casting="unsafe")
+    return out
+
+def _copy(image_array, out):
+    if out is None:
         return image_array.copy()
+    np.copyto(out, image_array, casting="unsafe")
+    return out
 
+def equalization_lut(histogram):
+    cdf = np.cumsum(histogram)
+    if cdf.max() == cdf.min():
+        return None
     cdf_normalized = (cdf - cdf.min()) * 255 / (cdf.max() - cdf.min())
-    cdf_normalized = cdf_normalized.astype(np.uint8)
-    equalized = cdf_normalized[image_array]
-    return equalized
+    return cdf_normalized.astype(np.uint8)
 
-def contrast_stretching(image_array):
-    p1, p99 = np.percentile(image_array, (1, 99))
+def histogram_equalization(image_array, histogram=None, out=None):
+    if histogram is None:
+        histogram = luma_histogram(image_array)
+    lut = equalization_lut(histogram)
+    if lut is None:
+        return _copy(image_array, out)
+    return apply_luma_lut(image_array, lut, out)
+
+def contrast_stretching(image_array, histogram=None, out=None):
+    if histogram is None and image_array.dtype != np.uint8:
+        p1, p99 = np.percentile(image_array, (1, 99))
+    else:
+        if histogram is None:
+            histogram = luma_histogram(image_array)
+        p1, p99 = histogram_percentile(histogram, (1, 99))
 
     if p1 == p99:
-        return image_array.copy()
+        return _copy(image_array, out)
+
+    if image_array.dtype != np.uint8:
+        # float32'de; LUT yolu gibi kırpılıp kesilir (yuvarlanmaz)
+        stretched = scratch("result", image_array.shape)
+        np.subtract(image_array, np.float32(p1), out=stretched, casting="unsafe")
+        stretched *= np.float32(255)
+        stretched /= np.float32(p99 - p1)
+        np.clip(stretched, 0, 255, out=stretched)
+        if out is None:
+            return stretched.astype(np.uint8)
+        np.copyto(output_array(image_array.shape, out), stretched, casting="unsafe")
+        return out
+    lut = np.clip((np.arange(256) - p1) * 255 / (p99 - p1), 0, 255).astype(np.uint8)
+    return apply_luma_lut(image_array, lut, out)
 
-    stretched = (image_array - p1) * 255 / (p99 - p1)
-    return np.clip(stretched, 0, 255).astype(np.uint8)
 
+def contrast_lut(gain, center=128):
+    values = (np.arange(256) - center) * gain + center
+    return np.clip(np.rint(values), 0, 255).astype(np.uint8)
 
 
+def adjust_contrast(image_array, gain, center=128, out=None):
+    # Doğrusal kontrast: renkli görüntüde aynı LUT her kanala uygulanır (kırpılmadıkça
+    # parlaklık da aynı oranda değişir, renk tonu korunur)
+    if image_array.dtype == np.uint8:
+        return apply_lut(image_array, contrast_lut(gain, center), out)
+    values = scratch("result", image_array.shape)
+    np.subtract(image_array, center, out=values, casting="unsafe")
+    values *= gain
+    values += center
+    return to_uint8(values, out)
@@ -0,0 +1,171 @@
+from functools import lru_cache
+
+import numpy as np
+from scipy.ndimage import convolve, convolve1d, uniform_filter1d
+from scipy.signal import fftconvolve, oaconvolve
+
+from filters.dtypes import WORK_DTYPE, scratch, to_uint8
+
+# Doğrusal filtre motoru: her çekirdek için en uygun yöntem seçilir.
+# - "box": sabit çekirdek; iki eksende kayan toplam, maliyet çekirdek boyutundan bağımsız
+# - "separable": rank-1 çekirdek (Gauss, Sobel...) iki 1B geçişle
+# - "fft": büyük çekirdekler FFT ile, büyük görüntülerde overlap-add
+# - "direct": küçük, ayrıştırılamayan çekirdekler doğrudan
+# Kenarlar scipy.ndimage "reflect" kipiyle aynı yansıtılır. Ara sonuçlar float32 tutulur
+# (filters.dtypes karalama tamponları; FFT yolu hariç çağrı başına ara dizi açılmaz);
+# uint8'e dönüşte her yöntemde yuvarlanıp [0, 255] aralığına kırpılır.
+# RGB (H, W, C) girdilerde çekirdek yalnızca ilk iki eksene uygulanır; axes ile başka
+# eksenler seçilebilir (örn. (N, H, W[, C]) kare yığınında axes=(1, 2)).
+
+FFT_MIN_TAPS = 225              # 15x15 ve üstü ayrıştırılamayan çekirdekler
+SEPARABLE_FFT_MIN_SIZE = 65     # ayrıştırılabilir çekirdeklerde eksen boyu
+OVERLAP_ADD_MIN_PIXELS = 1_000_000
+
+# (düzeltme, türev) çiftleri
+GRADIENT_OPERATORS = {
+    "sobel": (np.array([1.0, 2.0, 1.0]), np.array([1.0, 0.0, -1.0])),
+    "prewitt": (np.array([1.0, 1.0, 1.0]), np.array([1.0, 0.0, -1.0])),
+    "scharr": (np.array([3.0, 10.0, 3.0]), np.array([1.0, 0.0, -1.0])),
+}
+
+METHODS = ("auto", "box", "separable", "fft", "direct")
+
+
+def _readonly(array):
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=32)
+def gaussian_kernel_1d(sigma, radius=None):
+    # scipy.ndimage.gaussian_filter ile aynı yarıçap: 4 sigma
+    if radius is None:
+        radius = int(4.0 * sigma + 0.5)
+    x = np.arange(-radius, radius + 1, dtype=np.float64)
+    kernel = np.exp(-0.5 * (x / sigma) ** 2)
+    return _readonly(kernel / kernel.sum())
+
+
+@lru_cache(maxsize=32)
+def gaussian_kernel(sigma, radius=None):
+    kernel = gaussian_kernel_1d(sigma, radius)
+    return _readonly(np.outer(kernel, kernel))
+
+
+def separate(kernel):
+    # Rank-1 çekirdek için (sütun, satır) vektörleri; değilse None
+    u, s, vt = np.linalg.svd(kernel)
+    if s.size > 1 and s[1] > 1e-9 * s[0]:
+        return None
+    scale = np.sqrt(s[0])
+    return u[:, 0] * scale, vt[0] * scale
+
+
+def choose_method(kernel):
+    if np.all(kernel == kernel.flat[0]):
+        return "box"
+    if separate(kernel) is not None:
+        return "fft" if max(kernel.shape) >= SEPARABLE_FFT_MIN_SIZE else "separable"
+    return "fft" if kernel.size >= FFT_MIN_TAPS else "direct"
+
+
+def _pad_widths(kernel_shape, ndim, axes=(0, 1)):
+    # ndimage.convolve hizalaması: çıktı[i] = sum_j k[j] * x[i + k//2 - j]
+    widths = [(0, 0)] * ndim
+    for axis, k in zip(axes, kernel_shape):
+        widths[axis] = (k - 1 - k // 2, k // 2)
+    return widths
+
+
+def _expand(kernel, ndim, axes=(0, 1)):
+    # Çekirdek boyutları axes eksenlerine, diğer eksenler 1 (yayınlama için)
+    shape = [1] * ndim
+    for axis, k in zip(axes, kernel.shape):
+        shape[axis] = k
+    return kernel.reshape(shape)
+
+
+def _float_output(shape, out):
+    if out is None:
+        return np.empty(shape, dtype=WORK_DTYPE)
+    return out
+
+
+def box_mean(image_array, shape, out=None, axes=(0, 1)):
+    # Her eksende kayan toplam (running sum); çift boyutlarda ndimage.convolve hizalaması
+    output = _float_output(image_array.shape, out)
+    result = image_array
+    for index, (axis, size) in enumerate(zip(axes, shape)):
+        target = output if index == len(shape) - 1 else scratch("pass", image_array.shape)
+        result = uniform_filter1d(result, size, axis=axis, output=target, mode="reflect",
+                                  origin=-1 if size % 2 == 0 else 0)
+    return output
+
+
+def box_filter(image_array, size, out=None, axes=(0, 1)):
+    # Ortalama filtresi: çekirdek oluşturulmaz, maliyet boyuttan bağımsız
+    shape = (size, size) if np.isscalar(size) else tuple(size)
+    return to_uint8(box_mean(image_array, shape, scratch("result", image_array.shape), axes), out)
+
+
+def convolve_image(image_array, kernel, method="auto", out=None, axes=(0, 1)):
+    # float32 sonuç; out verilirse (aynı şekil, float32) sonuç oraya yazılır
+    kernel = np.asarray(kernel, dtype=np.float64)
+    if method == "auto":
+        method = choose_method(kernel)
+    if method not in METHODS:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+
+    if method == "box":
+        output = box_mean(image_array, kernel.shape, out, axes)
+        output *= np.float32(kernel.flat[0] * kernel.size)
+        return output
+
+    if method == "separable":
+        factors = separate(kernel)
+        if factors is None:
+            raise ValueError("Çekirdek ayrıştırılabilir değil")
+        column, row = factors
+        # İlk geçiş de float32'de tutulur; ikinci geçiş çıktı tamponuna yazar
+        first = convolve1d(image_array, column, axis=axes[0], output=scratch("pass", image_array.shape),
+                           mode="reflect")
+        output = _float_output(image_array.shape, out)
+        convolve1d(first, row, axis=axes[1], output=output, mode="reflect")
+        return output
+
+    if method == "fft":
+        padded = np.pad(image_array.astype(WORK_DTYPE),
+                        _pad_widths(kernel.shape, image_array.ndim, axes), mode="symmetric")
+        taps = _expand(kernel.astype(WORK_DTYPE), image_array.ndim, axes)
+        frame_pixels = image_array.shape[axes[0]] * image_array.shape[axes[1]]
+        engine = oaconvolve if frame_pixels >= OVERLAP_ADD_MIN_PIXELS else fftconvolve
+        result = engine(padded, taps, mode="valid", axes=axes)
+        if out is None:
+            return result.astype(WORK_DTYPE, copy=False)
+        out[...] = result
+        return out
+
+    output = _float_output(image_array.shape, out)
+    convolve(image_array, _expand(kernel, image_array.ndim, axes), output=output, mode="reflect")
+    return output
+
+
+
+def filter_image(image_array, kernel, method="auto", out=None, axes=(0, 1)):
+    result = scratch("result", image_array.shape)
+    return to_uint8(convolve_image(image_array, kernel, method, result, axes), out)
+
+
+def gradient_magnitude(image_array, operator="sobel", out=None, axes=(0, 1)):
+    if operator not in GRADIENT_OPERATORS:
+        raise ValueError(f"Bilinmeyen operatör: {operator}")
+    smooth, derivative = GRADIENT_OPERATORS[operator]
+    rows, cols = axes
+    first = scratch("pass", image_array.shape)
+    gx, gy = scratch("result", image_array.shape), scratch("gradient_y", image_array.shape)
+    convolve1d(image_array, smooth, axis=rows, output=first, mode="reflect")
+    convolve1d(first, derivative, axis=cols, output=gx, mode="reflect")
+    convolve1d(image_array, derivative, axis=rows, output=first, mode="reflect")
+    convolve1d(first, smooth, axis=cols, output=gy, mode="reflect")
+    np.hypot(gx, gy, out=gx)
+    return to_uint8(gx, out)
@@ -0,0 +1,116 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from filters.dtypes import output_array
+
+# Ortanca filtresi motoru.
+# Küçük çekirdeklerde pencere görünümü + np.partition, büyük çekirdeklerde
+# (uint8) Perreault'nun sütun histogramları kullanılır; satır başına maliyet
+# çekirdek boyutundan bağımsızdır. Sonuç girdiyle aynı tiptedir; out verilirse oraya yazılır.
+
+HISTOGRAM_MIN_KERNEL = 13
+_CHUNK_ELEMENTS = 1 << 22
+
+
+def median_filter(image_array, kernel_size=3, method="auto", out=None):
+    if kernel_size < 1:
+        raise ValueError("kernel_size pozitif olmalı")
+
+    if method == "auto":
+        use_histogram = (image_array.dtype == np.uint8
+                         and kernel_size % 2 == 1
+                         and kernel_size >= HISTOGRAM_MIN_KERNEL)
+        method = "histogram" if use_histogram else "partition"
+
+    if method == "histogram":
+        if image_array.ndim == 3:
+            # Sütun histogramları kanal başına tutulur
+            output = output_array(image_array.shape, out, image_array.dtype)
+            for c in range(image_array.shape[2]):
+                _median_histogram(image_array[:, :, c], kernel_size, output[:, :, c])
+            return output
+        return _median_histogram(image_array, kernel_size, out)
+    if method == "partition":
+        return _median_partition(image_array, kernel_size, out)
+    raise ValueError(f"Bilinmeyen yöntem: {method}")
+
+
+def _median_partition(image_array, kernel_size, out=None):
+    # (H, W, C) girdilerde pencereler yalnızca ilk iki eksende; kanallar tek geçişte
+    pad = [(kernel_size // 2, kernel_size // 2)] * 2 + [(0, 0)] * (image_array.ndim - 2)
+    padded = np.pad(image_array, pad, mode='reflect')
+    h, w = image_array.shape[:2]
+    output = output_array(image_array.shape, out, image_array.dtype)
+    if h == 0 or w == 0:
+        return output
+
+    area = kernel_size * kernel_size
+    mid = area // 2
+    windows = sliding_window_view(padded, (kernel_size, kernel_size), axis=(0, 1))[:h, :w]
+    rows = max(1, _CHUNK_ELEMENTS // (image_array[0].size * area))
+
+    for start in range(0, h, rows):
+        block = windows[start:start + rows]
+        block = block.reshape(block.shape[:-2] + (area,))
+        if not block.flags.writeable:
+            block = block.copy()
+        if area % 2:
+            block.partition(mid, axis=-1)
+            output[start:start + rows] = block[..., mid]
+        else:
+            # Çift çekirdekte np.median iki ortanca değerin ortalamasını alır
+            block.partition((mid - 1, mid), axis=-1)
+            pair = block[..., mid - 1:mid + 1].astype(np.float64)
+            output[start:start + rows] = (pair[..., 0] + pair[..., 1]) / 2
+    return output
+
+
+def _median_histogram(image_array, kernel_size, out=None):
+    if image_array.dtype != np.uint8 or kernel_size % 2 == 0:
+        raise ValueError("Histogram yöntemi yalnızca uint8 ve tek çekirdek boyutu destekler")
+
+    r = kernel_size // 2
+    padded = np.pad(image_array, r, mode='reflect')
+    h, w = image_array.shape
+    output = output_array(image_array.shape, out, image_array.dtype)
+    if h == 0 or w == 0:
+        return output
+
+    wp = padded.shape[1]
+    cols = np.arange(wp)
+    out_cols = np.arange(w)
+    rank = (kernel_size * kernel_size) // 2
+
+    # Her sütun için kaba (16 kutu) ve ince (256 kutu) histogram
+    fine = np.zeros((wp, 256), dtype=np.int32)
+    coarse = np.zeros((wp, 16), dtype=np.int32)
+    fine_cum = np.zeros((wp + 1, 256), dtype=np.int32)
+    coarse_cum = np.zeros((wp + 1, 16), dtype=np.int32)
+
+    for row in padded[:kernel_size]:
+        fine[cols, row] += 1
+        coarse[cols, row >> 4] += 1
+
+    for i in range(h):
+        if i > 0:
+            old, new = padded[i - 1], padded[i + kernel_size - 1]
+            fine[cols, old] -= 1
+            coarse[cols, old >> 4] -= 1
+            fine[cols, new] += 1
+            coarse[cols, new >> 4] += 1
+
+        # Sütun histogramlarının kümülatif toplamı ile pencere histogramı
+        np.cumsum(coarse, axis=0, out=coarse_cum[1:])
+        win_coarse = coarse_cum[kernel_size:kernel_size + w] - coarse_cum[:w]
+        acc = np.cumsum(win_coarse, axis=1)
+        cbin = (acc <= rank).sum(axis=1)
+        below = acc[out_cols, cbin] - win_coarse[out_cols, cbin]
+
+        np.cumsum(fine, axis=0, out=fine_cum[1:])
+        hi = fine_cum[kernel_size:kernel_size + w].reshape(w, 16, 16)[out_cols, cbin]
+        lo = fine_cum[:w].reshape(w, 16, 16)[out_cols, cbin]
+        fine_acc = np.cumsum(hi - lo, axis=1)
+        fbin = (fine_acc <= (rank - below)[:, None]).sum(axis=1)
+
+        output[i] = cbin * 16 + fbin
+    return output
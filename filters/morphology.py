@@ -1,26 +1,272 @@
 import numpy as np
 
-# 3x3 Yapısal Eleman ile
-def dilation(binary_image):
-    kernel = np.ones((3, 3), dtype=np.uint8)
-    padded = np.pad(binary_image, pad_width=1, mode='constant', constant_values=0)
-    result = np.zeros_like(binary_image)
-
-    for i in range(result.shape[0]):
-        for j in range(result.shape[1]):
-            region = padded[i:i+3, j:j+3]
-            if np.any(region & kernel):
-                result[i, j] = 255
+from filters.dtypes import output_array
+
+# İkili işlemler bit paketli satırlar (np.packbits) üzerinde kaydırma + OR/AND ile,
+# gri seviye işlemler van Herk/Gil-Werman kayan max/min ile yapılır.
+# İkili girdide ön plan, önceki 3x3 döngüsüyle aynı şekilde (piksel & 1) kabul edilir.
+# İkili işlemler (N, H, W) kare yığını da alır: kareler aralarında boş satırlarla alt alta
+# tek bir bit düzlemine dizilir ve hepsi aynı kaydırma/OR/AND çağrılarıyla işlenir.
+# Sonuç girdiyle aynı tiptedir; out verilirse yalnızca son sonuç oraya yazılır.
+
+
+def structuring_element(shape="rect", size=3):
+    if isinstance(shape, np.ndarray):
+        return shape.astype(bool)
+
+    r = size // 2
+    if shape == "rect":
+        return np.ones((size, size), dtype=bool)
+    if shape == "cross":
+        footprint = np.zeros((size, size), dtype=bool)
+        footprint[r, :] = True
+        footprint[:, r] = True
+        return footprint
+    if shape == "disk":
+        y, x = np.ogrid[-r:size - r, -r:size - r]
+        return x * x + y * y <= r * r
+    raise ValueError(f"Bilinmeyen yapısal eleman: {shape}")
+
+
+def _reflected(footprint):
+    # Genişletme yansıtılmış elemanla yapılır (scipy.ndimage/skimage tanımı); çift boyutta
+    # merkez aynı pikselde kalsın diye başa boş satır/sütun eklenir
+    reflected = footprint[::-1, ::-1]
+    return np.pad(reflected, [(1 - n % 2, 0) for n in reflected.shape])
+
+
+def _row_runs(row, center):
+    runs = []
+    cols = np.flatnonzero(row)
+    if cols.size == 0:
+        return tuple(runs)
+    breaks = np.flatnonzero(np.diff(cols) != 1)
+    starts = np.concatenate(([cols[0]], cols[breaks + 1]))
+    ends = np.concatenate((cols[breaks], [cols[-1]]))
+    for s, e in zip(starts, ends):
+        runs.append((int(s) - center, int(e - s) + 1))
+    return tuple(runs)
+
+
+def _segments(footprint):
+    # Aynı yatay desene sahip ardışık satırlar tek bir dikey koşu olarak işlenir
+    ch, cw = footprint.shape[0] // 2, footprint.shape[1] // 2
+    segments = []
+    for i, row in enumerate(footprint):
+        runs = _row_runs(row, cw)
+        if not runs:
+            continue
+        dy = i - ch
+        last = segments[-1] if segments else None
+        if last and last[2] == runs and last[0] + last[1] == dy:
+            segments[-1] = (last[0], last[1] + 1, runs)
+        else:
+            segments.append((dy, 1, runs))
+    return segments
+
+
+def _shift(arr, d, axis, fill):
+    # out[x] = arr[x + d], dışarıdan gelenler fill
+    if d == 0:
+        return arr
+    out = np.full_like(arr, fill)
+    n = arr.shape[axis]
+    if abs(d) >= n:
+        return out
+    dst = [slice(None)] * arr.ndim
+    src = [slice(None)] * arr.ndim
+    if d > 0:
+        dst[axis], src[axis] = slice(0, n - d), slice(d, n)
+    else:
+        dst[axis], src[axis] = slice(-d, n), slice(0, n + d)
+    out[tuple(dst)] = arr[tuple(src)]
+    return out
+
+
+def _bit_shift(packed, d):
+    # Bit düzeyinde sütun kaydırma (big-endian paketleme): out[:, x] = in[:, x + d]
+    if d == 0:
+        return packed
+    n = packed.shape[1]
+    q, b = divmod(abs(d), 8)
+    out = np.zeros_like(packed)
+    if q >= n:
+        return out
+    if d > 0:
+        src = packed[:, q:]
+        out[:, :n - q] = src << b
+        if b:
+            out[:, :n - q - 1] |= src[:, 1:] >> (8 - b)
+    else:
+        src = packed[:, :n - q]
+        out[:, q:] = src >> b
+        if b:
+            out[:, q + 1:] |= src[:, :-1] << (8 - b)
+    return out
+
+
+def _doubling_run(arr, length, shift, combine):
+    # out[x] = combine(arr[x], ..., arr[x + length - 1]), log2(length) adımda
+    result = arr
+    span = 1
+    while span < length:
+        step = min(span, length - span)
+        result = combine(result, shift(result, step))
+        span += step
+    return result
+
+
+def _vhgw_run(arr, length, axis, func, fill):
+    # van Herk/Gil-Werman: blok içi ileri/geri birikimli max/min, piksel başına O(1)
+    if length == 1:
+        return arr
+    moved = np.moveaxis(arr, axis, -1)
+    n = moved.shape[-1]
+    blocks = -(-(n + length - 1) // length)
+    buf = np.full(moved.shape[:-1] + (blocks * length,), fill, dtype=arr.dtype)
+    buf[..., :n] = moved
+    shaped = buf.reshape(moved.shape[:-1] + (blocks, length))
+    forward = func.accumulate(shaped, axis=-1).reshape(buf.shape)
+    backward = func.accumulate(shaped[..., ::-1], axis=-1)[..., ::-1].reshape(buf.shape)
+    out = func(backward[..., :n], forward[..., length - 1:length - 1 + n])
+    return np.moveaxis(out, -1, axis)
+
+
+def _apply_footprint(arr, footprint, run_cols, run_rows, shift_cols, shift_rows, combine, fill):
+    result = None
+    for dy, rows, runs in _segments(footprint):
+        horizontal = None
+        for dx, length in runs:
+            part = shift_cols(run_cols(arr, length), dx)
+            horizontal = part if horizontal is None else combine(horizontal, part)
+        part = shift_rows(run_rows(horizontal, rows), dy)
+        result = part if result is None else combine(result, part)
+    if result is None:
+        return np.full_like(arr, fill)
     return result
 
-def erosion(binary_image):
-    kernel = np.ones((3, 3), dtype=np.uint8)
-    padded = np.pad(binary_image, pad_width=1, mode='constant', constant_values=0)
-    result = np.zeros_like(binary_image)
 
-    for i in range(result.shape[0]):
-        for j in range(result.shape[1]):
-            region = padded[i:i+3, j:j+3]
-            if np.all(region & kernel):
-                result[i, j] = 255
+def _reach(footprint):
+    kh, kw = footprint.shape
+    return max(kh // 2, kh - 1 - kh // 2), max(kw // 2, kw - 1 - kw // 2)
+
+
+def _binary_result(mask, like, out):
+    result = output_array(like.shape, out, like.dtype)
+    result[...] = 0
+    result[mask] = 255
     return result
+
+
+def _binary_morph(binary_image, size, shape, iterations, combine, out=None):
+    footprint = structuring_element(shape, size)
+    if combine is np.bitwise_or:
+        footprint = _reflected(footprint)
+    foreground = (binary_image & 1).astype(bool)
+    frames, (h, w) = foreground.shape[:-2], foreground.shape[-2:]
+
+    # Koşu önce, kaydırma sonra uygulandığından her iki eksende de kenar boşluğu gerekir.
+    # Yığında iki kare arasında 2 * pad_y boş satır kalır; erişim pad_y'yi aşmadığından ve
+    # boşluk her adımda temizlendiğinden kareler birbirini etkilemez.
+    pad_y, pad_x = _reach(footprint)
+    margin = -(-pad_x // 8) * 8
+    width = margin + w + margin
+    padded = np.zeros(frames + (pad_y + h + pad_y, width), dtype=bool)
+    inner = (..., slice(pad_y, pad_y + h), slice(margin, margin + w))
+    padded[inner] = foreground
+    packed = np.packbits(padded.reshape(-1, width), axis=1)
+
+    valid = np.zeros(padded.shape, dtype=bool)
+    valid[inner] = True
+    valid = np.packbits(valid.reshape(-1, width), axis=1)
+
+    def run_cols(arr, length):
+        return _doubling_run(arr, length, _bit_shift, combine)
+
+    def run_rows(arr, length):
+        return _doubling_run(arr, length, lambda a, d: _shift(a, d, 0, 0), combine)
+
+    for _ in range(iterations):
+        packed = _apply_footprint(packed, footprint, run_cols, run_rows,
+                                  _bit_shift, lambda a, d: _shift(a, d, 0, 0), combine, 0)
+        packed &= valid  # kenar boşluğunu temizle: görüntü dışı her adımda arka plan
+
+    packed = packed.reshape(frames + (pad_y + h + pad_y, packed.shape[1]))[..., pad_y:pad_y + h, :]
+    mask = np.unpackbits(packed, axis=-1, count=width)[..., margin:margin + w].astype(bool)
+    return _binary_result(mask, binary_image, out)
+
+
+def _gray_morph(image_array, size, shape, iterations, func, out=None):
+    footprint = structuring_element(shape, size)
+    if func is np.maximum:
+        footprint = _reflected(footprint)
+    if np.issubdtype(image_array.dtype, np.integer):
+        info = np.iinfo(image_array.dtype)
+        fill = info.min if func is np.maximum else info.max
+    else:
+        fill = -np.inf if func is np.maximum else np.inf
+
+    def run_cols(arr, length):
+        return _vhgw_run(arr, length, 1, func, fill)
+
+    def run_rows(arr, length):
+        return _vhgw_run(arr, length, 0, func, fill)
+
+    h, w = image_array.shape[:2]
+    pad_y, pad_x = _reach(footprint)
+    result = np.full((pad_y + h + pad_y, pad_x + w + pad_x) + image_array.shape[2:], fill,
+                     dtype=image_array.dtype)
+    inner = (slice(pad_y, pad_y + h), slice(pad_x, pad_x + w))
+    result[inner] = image_array
+    for i in range(iterations):
+        if i:
+            border = np.full_like(result, fill)
+            border[inner] = result[inner]
+            result = border
+        result = _apply_footprint(result, footprint, run_cols, run_rows,
+                                  lambda a, d: _shift(a, d, 1, fill),
+                                  lambda a, d: _shift(a, d, 0, fill), func, fill)
+    if out is None:
+        return np.ascontiguousarray(result[inner])
+    output_array(image_array.shape, out, image_array.dtype)[...] = result[inner]
+    return out
+
+
+# Varsayılan: 3x3 Yapısal Eleman ile
+def dilation(binary_image, size=3, shape="rect", iterations=1, out=None):
+    return _binary_morph(binary_image, size, shape, iterations, np.bitwise_or, out)
+
+def erosion(binary_image, size=3, shape="rect", iterations=1, out=None):
+    return _binary_morph(binary_image, size, shape, iterations, np.bitwise_and, out)
+
+def gray_dilation(image_array, size=3, shape="rect", iterations=1, out=None):
+    return _gray_morph(image_array, size, shape, iterations, np.maximum, out)
+
+def gray_erosion(image_array, size=3, shape="rect", iterations=1, out=None):
+    return _gray_morph(image_array, size, shape, iterations, np.minimum, out)
+
+
+def _ops(grayscale):
+    return (gray_dilation, gray_erosion) if grayscale else (dilation, erosion)
+
+def opening(image_array, size=3, shape="rect", iterations=1, grayscale=False, out=None):
+    dilate, erode = _ops(grayscale)
+    return dilate(erode(image_array, size, shape, iterations), size, shape, iterations, out)
+
+def closing(image_array, size=3, shape="rect", iterations=1, grayscale=False, out=None):
+    dilate, erode = _ops(grayscale)
+    return erode(dilate(image_array, size, shape, iterations), size, shape, iterations, out)
+
+def morphological_gradient(image_array, size=3, shape="rect", grayscale=False, out=None):
+    dilate, erode = _ops(grayscale)
+    dilated = dilate(image_array, size, shape)
+    eroded = erode(image_array, size, shape)
+    if grayscale:
+        return np.subtract(dilated, eroded, out=output_array(image_array.shape, out, image_array.dtype))
+    return _binary_result((dilated != 0) & (eroded == 0), image_array, out)
+
+def top_hat(image_array, size=3, shape="rect", grayscale=False, out=None):
+    opened = opening(image_array, size, shape, grayscale=grayscale)
+    if grayscale:
+        return np.subtract(image_array, opened, out=output_array(image_array.shape, out, image_array.dtype))
+    return _binary_result(((image_array & 1) != 0) & (opened == 0), image_array, out)
@@ -0,0 +1,195 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image
+
+from filters.convolution import (apply_mean_filter, apply_median_filter, apply_edge_filter,
+                                 apply_smoothing_filter, apply_sharpen_filter, apply_gaussian_filter,
+                                 apply_sobel_filter, apply_prewitt_filter, apply_scharr_filter)
+from filters.geometry import (PIL_RESAMPLE, output_bounds, signed_permutation, skeletonize, warp_affine,
+                              warp_image, warp_rows, warp_source)
+from filters.histogram import histogram_equalization, contrast_stretching
+from filters.morphology import dilation, erosion
+from filters.thinning import thin, medial_axis, distance_map
+from filters.thresholding import otsu_threshold, kapur_threshold
+from filters.tiling import process_region
+
+# Tek büyük görüntü için çok çekirdekli bant zamanlayıcı. Görüntü tam genişlikte satır
+# bantlarına bölünür; her bant filtreye özgü halo (komşu satırlar) ile iş parçacığı
+# havuzunda işlenir ve yalnızca merkez satırlar önceden ayrılmış ortak çıktıya yazılır.
+# NumPy, SciPy ve PIL çekirdekleri GIL'i bıraktığından bantlar gerçekten paralel çalışır.
+# Bant yüksekliği, bir bandın çalışma kümesi L2 önbelleğe sığacak şekilde seçilir.
+# Karolanamayan işlemler (global histogram gerektiren eşikleme/eşitleme, bağlantılılığı
+# tüm görüntüye bağlı iskelet/inceltme, uzaklık dönüşümü) kendiliğinden tek çağrıya düşer.
+# Tek çekirdekte (ya da küçük görüntüde) bantlama yapılmaz: halo ek yükü kazanç getirmez.
+# Bant kenarı görüntü kenarıysa filtre kendi dolgusunu yapar; sonuç tek çağrıyla aynıdır.
+# İstisna: FFT konvolüsyonlarında (büyük sigma) yuvarlama bant boyuna bağlıdır, pikselin
+# çok küçük bir kısmı ±1 farklı olabilir.
+# Çarpıtmada yalnızca scipy yolu (float girdiler, PIL'in desteklemediği dereceler) bantlanır:
+# spline ön süzgeci bir kez uygulanır, bantlar aynı katsayılardan okur. Bant başındaki ofset
+# yuvarlaması yüzünden sonuç tek warp_affine çağrısından en fazla 1 ulp (tamsayı çıktıda ±1)
+# sapabilir; bant yüksekliği makineden ve çekirdek sayısından bağımsız olduğundan aynı girdi
+# her makinede aynı çıktıyı verir. PIL yolu (uint8 L/RGB/RGBA, derece 0/1/3) tek çağrıdır:
+# PIL kaynak koordinatlarını satır satır biriktirdiğinden bantlı sonuç belirgin biçimde farklı olurdu.
+
+DEFAULT_L2_BYTES = 1024 * 1024
+WORKING_SET_BYTES = 10        # piksel (ve kanal) başına: uint8 girdi + iki float32 ara sonuç + çıktı
+MIN_BAND_HALO_RATIO = 8       # bant en az 8 * halo satır: halo ek yükü en fazla %25
+PARALLEL_MIN_PIXELS = 1_000_000
+
+# ad: (fonksiyon, halo(parametreler)); halo None ise işlem karolanamaz
+PARALLEL_FILTERS = {
+    "mean": (apply_mean_filter, lambda kernel_size=3: kernel_size // 2),
+    "median": (apply_median_filter, lambda kernel_size=3: kernel_size // 2),
+    "edge": (apply_edge_filter, lambda: 1),
+    "smoothing": (apply_smoothing_filter, lambda: 1),
+    "sharpen": (apply_sharpen_filter, lambda: 1),
+    "gaussian": (apply_gaussian_filter, lambda sigma=1.0: int(4.0 * float(sigma) + 0.5)),
+    "sobel": (apply_sobel_filter, lambda: 1),
+    "prewitt": (apply_prewitt_filter, lambda: 1),
+    "scharr": (apply_scharr_filter, lambda: 1),
+    "dilation": (dilation, lambda size=3, shape="rect", iterations=1: size // 2 * iterations),
+    "erosion": (erosion, lambda size=3, shape="rect", iterations=1: size // 2 * iterations),
+    "equalize": (histogram_equalization, None),
+    "stretch": (contrast_stretching, None),
+    "otsu": (otsu_threshold, None),
+    "kapur": (kapur_threshold, None),
+    "skeleton": (skeletonize, None),
+    "thin": (thin, None),
+    "medial_axis": (medial_axis, None),
+    "distance": (distance_map, None),
+}
+
+
+def cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+@lru_cache(maxsize=1)
+def l2_cache_bytes():
+    # Linux sysfs'ten çekirdek başına L2 boyutu; okunamazsa varsayılan
+    base = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        for entry in sorted(os.listdir(base)):
+            path = os.path.join(base, entry)
+            with open(os.path.join(path, "level")) as level, open(os.path.join(path, "type")) as kind:
+                if level.read().strip() != "2" or kind.read().strip() == "Instruction":
+                    continue
+            with open(os.path.join(path, "size")) as size:
+                text = size.read().strip().upper()
+            units = {"K": 1024, "M": 1024 * 1024}
+            return int(text[:-1]) * units[text[-1]] if text[-1] in units else int(text)
+    except (OSError, ValueError):
+        pass
+    return DEFAULT_L2_BYTES
+
+
+def band_height(shape, halo=0, workers=1):
+    # L2'ye sığan satır sayısı; her işçiye en az bir bant düşecek kadar küçük
+    row_bytes = int(np.prod(shape[1:])) * WORKING_SET_BYTES
+    rows = min(l2_cache_bytes() // max(row_bytes, 1), -(-shape[0] // workers))
+    return max(rows, MIN_BAND_HALO_RATIO * halo, 1)
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def thread_pool(workers):
+    with _pools_lock:
+        if workers not in _pools:
+            _pools[workers] = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bant")
+        return _pools[workers]
+
+
+def run_bands(height, band, work, workers=None):
+    # work(r0, r1) her bant için; tek işçide ya da tek bantta havuz kullanılmaz.
+    # Bir bantta hata olursa kalan bantlar beklenir, ilk hata yükseltilir.
+    workers = workers or cpu_count()
+    bands = [(r0, min(r0 + band, height)) for r0 in range(0, height, band)]
+    if workers == 1 or len(bands) == 1:
+        for r0, r1 in bands:
+            work(r0, r1)
+        return
+    futures = [thread_pool(workers).submit(work, r0, r1) for r0, r1 in bands]
+    for future in futures:
+        future.exception()
+    for future in futures:
+        future.result()
+
+
+def _fallback(func, image_array, params, out):
+    result = func(image_array, *params)
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+
+def parallel_filter(name, image_array, *params, workers=None, out=None):
+    # uint8 sonuç; out verilirse (aynı şekil) bantlar doğrudan oraya yazılır
+    if name not in PARALLEL_FILTERS:
+        raise ValueError(f"Bilinmeyen filtre: {name}")
+    func, halo = PARALLEL_FILTERS[name]
+    h, w = image_array.shape[:2]
+    workers = workers or cpu_count()
+    if halo is None or h * w < PARALLEL_MIN_PIXELS or workers == 1:
+        return _fallback(func, image_array, params, out)
+
+    halo = halo(*params)
+    if out is None:
+        out = np.empty(image_array.shape, dtype=np.uint8)
+
+    def work(r0, r1):
+        out[r0:r1] = process_region(image_array, lambda block: func(block, *params), (0, r0, w, r1), halo)
+
+    run_bands(h, band_height(image_array.shape, halo, workers), work, workers)
+    return out
+
+
+def _warp_band_height(shape):
+    # Çarpıtma bantları için sabit yükseklik: sysfs L2 boyutu ve işçi sayısı kullanılmaz
+    row_bytes = int(np.prod(shape[1:])) * WORKING_SET_BYTES
+    return max(DEFAULT_L2_BYTES // max(row_bytes, 1), 1)
+
+
+def _warp_bands(source, shape, dtype, matrix, order, cval, workers):
+    # Çıktı bantları birbirinden bağımsız okunur (halo gerekmez)
+    _, output_shape = output_bounds(shape, matrix)
+    out = np.empty(output_shape + shape[2:], dtype=dtype)
+
+    def work(r0, r1):
+        out[r0:r1] = warp_rows(source, matrix, order, cval, (r0, r1))
+
+    run_bands(output_shape[0], _warp_band_height(out.shape), work, workers)
+    return out
+
+
+def _warp_parallel(shape, matrix):
+    # İşçi sayısına bakılmaz: tek çekirdekte de aynı bantlar sırayla işlenir (aynı çıktı)
+    return signed_permutation(matrix) is None and shape[0] * shape[1] >= PARALLEL_MIN_PIXELS
+
+
+def parallel_warp(image_array, matrix, order=1, cval=0, workers=None):
+    # warp_affine karşılığı; PIL yolu tek çağrı
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if not _warp_parallel(image_array.shape, matrix):
+        return warp_affine(image_array, matrix, order, cval)
+    source = warp_source(image_array, order)
+    if isinstance(source, Image.Image):
+        return warp_rows(source, matrix, order, cval)
+    return _warp_bands(source, image_array.shape, image_array.dtype, matrix, order, cval, workers or cpu_count())
+
+
+def parallel_warp_image(pil_image, matrix, order=1, cval=0, workers=None):
+    # warp_image karşılığı; PIL'in çarpıtabildiği görüntüler tek çağrıda, diğerleri dizi olarak bantlanır
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if order in PIL_RESAMPLE and pil_image.mode in ("L", "RGB", "RGBA"):
+        return warp_image(pil_image, matrix, order, cval)
+    return Image.fromarray(np.ascontiguousarray(parallel_warp(np.asarray(pil_image), matrix, order, cval, workers)))
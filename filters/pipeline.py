@@ -0,0 +1,86 @@
+import numpy as np
+from PIL import Image
+
+from filters.convolution import (apply_mean_filter, apply_median_filter, apply_edge_filter,
+                                 apply_smoothing_filter, apply_sharpen_filter, apply_gaussian_filter,
+                                 apply_sobel_filter, apply_prewitt_filter, apply_scharr_filter)
+from filters.histogram import histogram_equalization, contrast_stretching, adjust_contrast
+from filters.thresholding import manual_threshold, otsu_threshold, kapur_threshold
+from filters.morphology import dilation, erosion, opening, closing
+from filters.geometry import skeletonize, rotate_image, shear_image, affine_image, flip_array
+
+# Metin tabanlı işlem hattı: "equalize | otsu | dilate:3 | skeletonize"
+# Her adım "ad[:arg1,arg2...]" biçimindedir ve numpy dizisi alıp numpy dizisi döndürür.
+
+
+def _pil_step(func):
+    def step(image_array, *args):
+        return np.array(func(Image.fromarray(image_array), *args))
+    return step
+
+
+PIPELINE_STEPS = {
+    "mean": apply_mean_filter,
+    "median": apply_median_filter,
+    "edge": apply_edge_filter,
+    "smooth": apply_smoothing_filter,
+    "sharpen": apply_sharpen_filter,
+    "gaussian": apply_gaussian_filter,
+    "sobel": apply_sobel_filter,
+    "prewitt": apply_prewitt_filter,
+    "scharr": apply_scharr_filter,
+    "equalize": histogram_equalization,
+    "stretch": contrast_stretching,
+    "contrast": adjust_contrast,  # contrast:kazanç[,merkez]
+    "threshold": manual_threshold,
+    "otsu": otsu_threshold,
+    "kapur": kapur_threshold,
+    "dilate": dilation,
+    "erode": erosion,
+    "open": opening,
+    "close": closing,
+    "skeletonize": skeletonize,
+    "rotate": _pil_step(rotate_image),
+    "shear": _pil_step(shear_image),
+    "affine": _pil_step(affine_image),  # affine:açı,shear_x,shear_y,ölçek
+    "flip_h": lambda image_array: np.ascontiguousarray(flip_array(image_array, 1)),
+    "flip_v": lambda image_array: np.ascontiguousarray(flip_array(image_array, 0)),
+    "rot90": lambda image_array, k=1: np.ascontiguousarray(np.rot90(image_array, k)),
+}
+
+
+def _parse_value(text):
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_pipeline(spec):
+    steps = []
+    for part in spec.split("|"):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, arg_text = part.partition(":")
+        name = name.strip()
+        if name not in PIPELINE_STEPS:
+            raise ValueError(f"Bilinmeyen adım: {name}")
+        args = tuple(_parse_value(a.strip()) for a in arg_text.split(",") if a.strip())
+        steps.append((name, args))
+    return steps
+
+
+def format_pipeline(steps):
+    parts = []
+    for name, args in steps:
+        parts.append(name + (":" + ",".join(str(a) for a in args) if args else ""))
+    return " | ".join(parts)
+
+
+def run_pipeline(steps, image_array):
+    for name, args in steps:
+        image_array = PIPELINE_STEPS[name](image_array, *args)
+    return image_array
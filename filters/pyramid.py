@@ -0,0 +1,46 @@
+import numpy as np
+
+from filters.tiling import process_region
+
+# Mipmap piramidi: her seviye bir öncekinin 2x2 blok ortalamasıdır.
+# Önizleme, etiket boyutuna uyan seviyede hesaplanır; yakınlaştırıldığında yalnızca
+# görünen bölge (komşuluk payıyla) işlenir.
+
+PREVIEW_HALO = 8
+
+
+def downsample(image_array):
+    h, w = image_array.shape[0] // 2, image_array.shape[1] // 2
+    blocks = image_array[:2 * h, :2 * w].reshape((h, 2, w, 2) + image_array.shape[2:])
+    total = blocks.sum(axis=(1, 3), dtype=np.uint16)
+    return ((total + 2) // 4).astype(np.uint8)
+
+
+class ImagePyramid:
+    def __init__(self, base, min_size=128):
+        self.levels = [base]
+        while min(self.levels[-1].shape[:2]) >= 2 * min_size:
+            self.levels.append(downsample(self.levels[-1]))
+
+    def scale(self, index):
+        return self.levels[0].shape[1] / self.levels[index].shape[1]
+
+    def level_for(self, width, height):
+        # Hedef boyuttan küçük olmayan en küçük seviye
+        for index in range(len(self.levels) - 1, -1, -1):
+            h, w = self.levels[index].shape[:2]
+            if w >= width and h >= height:
+                return index
+        return 0
+
+    def render(self, func, region, width, height, halo=PREVIEW_HALO):
+        # region tam çözünürlük koordinatlarında (x0, y0, x1, y1)
+        x0, y0, x1, y1 = region
+        index = self.level_for(self.levels[0].shape[1] * width / max(x1 - x0, 1),
+                               self.levels[0].shape[0] * height / max(y1 - y0, 1))
+        level = self.levels[index]
+        s = self.scale(index)
+        scaled = (int(x0 / s), int(y0 / s),
+                  max(int(x0 / s) + 1, min(int(np.ceil(x1 / s)), level.shape[1])),
+                  max(int(y0 / s) + 1, min(int(np.ceil(y1 / s)), level.shape[0])))
+        return process_region(level, func, scaled, halo)
@@ -0,0 +1,219 @@
+import numpy as np
+
+from filters.convolution import EDGE_KERNEL, SHARPEN_KERNEL
+from filters.dtypes import to_gray
+from filters.histogram import histogram_percentile
+from filters.linear import box_filter, filter_image, gaussian_kernel, gradient_magnitude
+from filters.pipeline import PIPELINE_STEPS, parse_pipeline
+from filters.thresholding import kapur_level, manual_threshold, otsu_level, stack_histograms
+
+# Kare yığınları (video kareleri, görüntü dizileri): (N, H, W) gri ya da (N, H, W, C) renkli.
+# İşlem hattı adımları tüm yığına tek çağrıda uygulanır:
+# - konvolüsyonlar doğrusal motorla yalnızca (H, W) eksenlerinde (axes=(1, 2))
+# - histogramlar kare başına 256'lık kaydırmalı bincount; eşitleme/germe LUT'ları ve
+#   Otsu/Kapur eşikleri (N, 256) histogram matrisinden satır satır
+# - ikili morfoloji kareler alt alta dizilmiş bit düzlemlerinde
+# Vektörleştirilemeyen adımlar (ortanca, iskelet, döndürme...) kare kare çalışır.
+# Kareler bir üreteçten de gelebilir; bellekte aynı anda yalnızca bir parça (chunk) tutulur.
+# Her adımın sonucu, kareleri tek tek işleyen PIPELINE_STEPS ile birebir aynıdır.
+
+FRAME_AXES = (1, 2)
+# Parça başına girdi boyutu: tüm adımlar parça önbellekteyken art arda çalışır (ara float32
+# sonuçlar 4 katı); küçük kareler yüzlercesi bir arada, HD ve üstü kareler tek tek
+CHUNK_BYTES = 1024 * 1024
+# Kaydırmalı bincount/gather, kare kare çağrı yükünü kaldırır ama intp ara dizisi (piksel
+# başına 8 bayt) önbellekten taşarsa kare kare döngüden yavaşlar; yığın bu boyda alt
+# gruplarla işlenir (büyük kareler tek tek)
+OFFSET_BATCH_PIXELS = 1 << 16
+
+
+def chunk_frames_for(frame):
+    return max(1, CHUNK_BYTES // max(frame.nbytes, 1))
+
+
+def iter_chunks(frames, chunk_frames=None):
+    # Dizi / bellek eşlemeli dizi: kopyasız dilimler. Diğer yinelenebilirler (üreteç, liste)
+    # en fazla chunk_frames karelik yeni tamponlara toplanır.
+    if isinstance(frames, np.ndarray):
+        if len(frames) == 0:
+            return
+        size = chunk_frames or chunk_frames_for(frames[0])
+        for start in range(0, len(frames), size):
+            yield np.asarray(frames[start:start + size])
+        return
+
+    buffer, count = None, 0
+    for frame in frames:
+        frame = np.asarray(frame)
+        if buffer is None:
+            size = chunk_frames or chunk_frames_for(frame)
+        elif frame.shape != buffer.shape[1:]:
+            raise ValueError(f"Kare boyutu farklı: {frame.shape} != {buffer.shape[1:]}")
+        if count == 0:
+            # Önceki parça tüketiciye verildiğinden üzerine yazılmaz; yeni tampon açılır
+            buffer = np.empty((size,) + frame.shape, dtype=frame.dtype)
+        buffer[count] = frame
+        count += 1
+        if count == size:
+            yield buffer
+            count = 0
+    if count:
+        yield buffer[:count]
+
+
+def _frame_offsets(stack, step=256):
+    n = stack.shape[0]
+    return (np.arange(n, dtype=np.intp) * step).reshape((n,) + (1,) * (stack.ndim - 1))
+
+
+def _batches(stack):
+    size = max(1, OFFSET_BATCH_PIXELS // max(stack[0].size, 1))
+    return [slice(start, start + size) for start in range(0, len(stack), size)]
+
+
+def _luma(stack):
+    return stack if stack.ndim == 3 else to_gray(stack)
+
+
+def stack_histograms_batched(stack):
+    # (N, H, W) -> (N, 256); thresholding.stack_histograms'ın önbellek boyu alt gruplarla hali
+    return np.concatenate([stack_histograms(stack[batch]) for batch in _batches(stack)])
+
+
+def frame_histograms(stack):
+    # (N, 256): gri yığında piksel, renkli yığında parlaklık (Y) histogramları
+    return stack_histograms_batched(_luma(stack))
+
+
+def apply_frame_luts(stack, luts):
+    # luts (N, 256): her kare kendi LUT'uyla, kaydırmalı tek gather. Renkli yığında
+    # apply_luma_lut gibi Y farkı üç kanala birden eklenir.
+    luma = _luma(stack)
+    mapped = np.empty_like(luma)
+    for batch in _batches(luma):
+        mapped[batch] = luts[batch].reshape(-1)[luma[batch] + _frame_offsets(luma[batch])]
+    if stack.ndim == 3:
+        return mapped
+    delta = mapped.astype(np.int16) - luma
+    return np.clip(stack + delta[..., None], 0, 255).astype(np.uint8)
+
+
+def _per_frame(name):
+    step = PIPELINE_STEPS[name]
+
+    def run(stack, *args):
+        return np.stack([step(frame, *args) for frame in stack])
+    return run
+
+
+def equalization_luts(histograms):
+    # equalization_lut'un satır satır karşılığı; tek renkli karede birim LUT (görüntü aynen kalır)
+    cdf = np.cumsum(histograms, axis=-1)
+    low = cdf.min(axis=-1, keepdims=True)
+    span = cdf.max(axis=-1, keepdims=True) - low
+    luts = ((cdf - low) * 255 / np.maximum(span, 1)).astype(np.uint8)
+    return np.where(span > 0, luts, np.arange(256, dtype=np.uint8))
+
+
+def stretching_luts(histograms):
+    # contrast_stretching'in %1-%99 LUT'ları; yüzdelikler 256 kutuluk histogramdan (ucuz)
+    bounds = np.array([histogram_percentile(h, (1, 99)) for h in histograms]).reshape(-1, 2)
+    p1, p99 = bounds[:, :1], bounds[:, 1:]
+    span = np.where(p99 == p1, 1, p99 - p1)
+    luts = np.clip((np.arange(256) - p1) * 255 / span, 0, 255).astype(np.uint8)
+    return np.where(p99 == p1, np.arange(256, dtype=np.uint8), luts)
+
+
+def stack_equalization(stack):
+    if stack.dtype != np.uint8:
+        return _per_frame("equalize")(stack)
+    return apply_frame_luts(stack, equalization_luts(frame_histograms(stack)))
+
+
+def stack_stretching(stack):
+    if stack.dtype != np.uint8:
+        return _per_frame("stretch")(stack)
+    return apply_frame_luts(stack, stretching_luts(frame_histograms(stack)))
+
+
+THRESHOLD_LEVELS = {"otsu": otsu_level, "kapur": kapur_level}
+
+
+def stack_threshold(stack, method="otsu"):
+    # Kare başına eşik; renkli karelerde otsu_threshold gibi kanal başına
+    if method not in THRESHOLD_LEVELS:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+    if stack.dtype != np.uint8:
+        return _per_frame(method)(stack)
+    n, h, w = stack.shape[:3]
+    planes = stack if stack.ndim == 3 else np.moveaxis(stack, -1, 1).reshape(-1, h, w)
+    levels = THRESHOLD_LEVELS[method](stack_histograms_batched(planes))
+    levels = levels.reshape((n, 1, 1) + stack.shape[3:])
+    return manual_threshold(stack, levels)
+
+
+def _binary_morphology(name):
+    step, fallback = PIPELINE_STEPS[name], _per_frame(name)
+
+    def run(stack, *args):
+        # İkili işlemler bit düzlemlerinde tüm yığına tek çağrı; gri seviye (grayscale=True)
+        # işlemler kanal eksenini yığın ekseninden ayıramadığından kare kare
+        grayscale = len(args) > 3 and args[3]
+        return fallback(stack, *args) if grayscale or stack.ndim != 3 else step(stack, *args)
+    return run
+
+
+STACK_STEPS = {
+    "mean": lambda stack, kernel_size=3: box_filter(stack, kernel_size, axes=FRAME_AXES),
+    "edge": lambda stack: filter_image(stack, EDGE_KERNEL, axes=FRAME_AXES),
+    "smooth": lambda stack: box_filter(stack, 3, axes=FRAME_AXES),
+    "sharpen": lambda stack: filter_image(stack, SHARPEN_KERNEL, axes=FRAME_AXES),
+    "gaussian": lambda stack, sigma=1.0: filter_image(stack, gaussian_kernel(float(sigma)), axes=FRAME_AXES),
+    "sobel": lambda stack: gradient_magnitude(stack, "sobel", axes=FRAME_AXES),
+    "prewitt": lambda stack: gradient_magnitude(stack, "prewitt", axes=FRAME_AXES),
+    "scharr": lambda stack: gradient_magnitude(stack, "scharr", axes=FRAME_AXES),
+    "equalize": stack_equalization,
+    "stretch": stack_stretching,
+    "contrast": PIPELINE_STEPS["contrast"],    # nokta işlemleri her şekilde çalışır
+    "threshold": PIPELINE_STEPS["threshold"],
+    "otsu": lambda stack: stack_threshold(stack, "otsu"),
+    "kapur": lambda stack: stack_threshold(stack, "kapur"),
+    "dilate": _binary_morphology("dilate"),
+    "erode": _binary_morphology("erode"),
+    "open": _binary_morphology("open"),
+    "close": _binary_morphology("close"),
+    "flip_h": lambda stack: np.ascontiguousarray(stack[:, :, ::-1]),
+    "flip_v": lambda stack: np.ascontiguousarray(stack[:, ::-1]),
+    "rot90": lambda stack, k=1: np.ascontiguousarray(np.rot90(stack, k, axes=FRAME_AXES)),
+}
+# Geri kalanlar (median, skeletonize, rotate, shear, affine) kare kare
+for _name in PIPELINE_STEPS:
+    STACK_STEPS.setdefault(_name, _per_frame(_name))
+
+
+def run_stack_steps(steps, stack):
+    for name, args in steps:
+        stack = STACK_STEPS[name](stack, *args)
+    return stack
+
+
+def process_stack(steps, frames, chunk_frames=None):
+    # Sonuç parçaları sırayla (üreteç); steps metin ya da parse_pipeline çıktısı olabilir
+    if isinstance(steps, str):
+        steps = parse_pipeline(steps)
+    for chunk in iter_chunks(frames, chunk_frames):
+        yield run_stack_steps(steps, chunk)
+
+
+def run_stack(steps, frames, chunk_frames=None, out=None):
+    # Tüm sonuç tek dizide; out verilirse (örn. np.lib.format.open_memmap) parçalar oraya yazılır
+    if out is None:
+        chunks = list(process_stack(steps, frames, chunk_frames))
+        return np.concatenate(chunks) if chunks else np.empty((0,), dtype=np.uint8)
+    start = 0
+    for result in process_stack(steps, frames, chunk_frames):
+        if start + len(result) > len(out):
+            raise ValueError(f"Çıktı dizisi küçük: {len(out)} kare")
+        out[start:start + len(result)] = result
+        start += len(result)
+    return out
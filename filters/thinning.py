@@ -0,0 +1,156 @@
+import numpy as np
+from scipy import ndimage
+from skimage.morphology import medial_axis as ski_medial_axis
+
+from filters.dtypes import to_uint8
+
+# İkili inceltme (iskelet), Öklid uzaklık dönüşümü ve medial eksen.
+# İnceltme 8 komşunun bir bayta kodlanmasıyla (P2 = kuzey, saat yönünde P9 = kuzeybatı)
+# 256'lık silme tablolarından vektörel yapılır. Komşuluk kodları yalnızca etkin
+# piksellerde (ön plan kutusundaki sınır pikselleri, sonra silinenlerin ön plan komşuları)
+# hesaplanır; silinecek aday kalmadığında durur. Ön plan 255 değerli piksellerdir.
+
+# (satır, sütun) kaydırmaları: P2, P3, ..., P9 -> bit 0..7
+NEIGHBORS = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+def _bits(code):
+    return [(code >> i) & 1 for i in range(8)]
+
+
+def _zhang_suen(code, step):
+    p2, p3, p4, p5, p6, p7, p8, p9 = _bits(code)
+    ring = (p2, p3, p4, p5, p6, p7, p8, p9, p2)
+    transitions = sum(a == 0 and b == 1 for a, b in zip(ring, ring[1:]))
+    if not (2 <= sum(ring[:8]) <= 6 and transitions == 1):
+        return False
+    if step == 0:
+        return p2 * p4 * p6 == 0 and p4 * p6 * p8 == 0
+    return p2 * p4 * p8 == 0 and p2 * p6 * p8 == 0
+
+
+def _guo_hall(code, step):
+    p2, p3, p4, p5, p6, p7, p8, p9 = _bits(code)
+    c = ((not p2) and (p3 or p4)) + ((not p4) and (p5 or p6)) + \
+        ((not p6) and (p7 or p8)) + ((not p8) and (p9 or p2))
+    n1 = (p9 or p2) + (p3 or p4) + (p5 or p6) + (p7 or p8)
+    n2 = (p2 or p3) + (p4 or p5) + (p6 or p7) + (p8 or p9)
+    m = ((p6 or p7 or not p9) and p8) if step == 0 else ((p2 or p3 or not p5) and p4)
+    return c == 1 and 2 <= min(n1, n2) <= 3 and not m
+
+
+def _tables(rule):
+    return tuple(np.array([rule(code, step) for code in range(256)], dtype=bool) for step in (0, 1))
+
+
+THINNING_TABLES = {
+    "zhang_suen": _tables(_zhang_suen),
+    "guo_hall": _tables(_guo_hall),
+}
+
+
+def foreground_box(mask, margin=0):
+    # Ön planın sınırlayıcı kutusu (y0, y1, x0, x1), görüntü sınırına kırpılmış; boşsa None
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(mask[rows[0]:rows[-1] + 1].any(axis=0))
+    h, w = mask.shape
+    return (max(rows[0] - margin, 0), min(rows[-1] + 1 + margin, h),
+            max(cols[0] - margin, 0), min(cols[-1] + 1 + margin, w))
+
+
+def _neighbor_codes(padded, y0, y1, x0, x1):
+    # padded görüntünün (1 piksel sıfır kenarlı) [y0:y1, x0:x1] bölgesi için komşuluk kodu
+    code = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+    for bit, (dy, dx) in enumerate(NEIGHBORS):
+        code |= padded[1 + y0 + dy:1 + y1 + dy, 1 + x0 + dx:1 + x1 + dx] << bit
+    return code
+
+
+def _unique(indices, scratch):
+    # Sıralamadan tekilleştirme: aynı indise yazılan son sıra numarası tek bir kopyayı seçer
+    order = np.arange(indices.size)
+    scratch[indices] = order
+    return indices[scratch[indices] == order]
+
+
+def thin(binary_image, method="zhang_suen", max_iterations=None):
+    if method not in THINNING_TABLES:
+        raise ValueError(f"Bilinmeyen inceltme yöntemi: {method}")
+    tables = THINNING_TABLES[method]
+    h, w = binary_image.shape
+    padded = np.zeros((h + 2, w + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = binary_image == 255
+    flat = padded.ravel()
+    offsets = np.array([dy * (w + 2) + dx for dy, dx in NEIGHBORS], dtype=np.intp)
+
+    # Yalnızca en az bir arka plan komşusu olan ön plan pikselleri silinebilir; etkin küme
+    # bu sınır pikselleridir ve yalnızca silinen piksellerin komşularıyla büyür
+    box = foreground_box(padded[1:-1, 1:-1])
+    if box is None:
+        return padded[1:-1, 1:-1] * np.uint8(255)
+    y0, y1, x0, x1 = box
+    codes = _neighbor_codes(padded, y0, y1, x0, x1)
+    rows, cols = np.nonzero(padded[1 + y0:1 + y1, 1 + x0:1 + x1] & (codes != 255))
+    active = (rows + 1 + y0) * (w + 2) + cols + 1 + x0
+
+    # Bir pikselin alt geçiş kararı yalnızca 3x3 komşuluğuna bağlıdır: her alt geçiş için
+    # son değerlendirmesinden beri komşusu silinmiş pikseller bekletilir, diğerleri atlanır
+    scratch = np.empty(flat.size, dtype=np.intp)
+    pending = [active, active]
+    iteration = 0
+    while (pending[0].size or pending[1].size) and (max_iterations is None or iteration < max_iterations):
+        for step, table in enumerate(tables):
+            candidates = pending[step]
+            candidates = candidates[flat[candidates] == 1]
+            # Alt geçişteki tüm kararlar silmeden önceki komşuluktan verilir (paralel inceltme)
+            codes = np.zeros(candidates.size, dtype=np.uint8)
+            for bit, offset in enumerate(offsets):
+                codes |= flat[candidates + offset] << bit
+            removed = candidates[table[codes]]
+            flat[removed] = 0
+            exposed = (removed[:, None] + offsets).ravel()
+            exposed = _unique(exposed[flat[exposed] == 1], scratch)
+            pending[step] = exposed
+            pending[1 - step] = _unique(np.concatenate((pending[1 - step], exposed)), scratch)
+        iteration += 1
+    return padded[1:-1, 1:-1] * np.uint8(255)
+
+
+def distance_transform(binary_image):
+    # Her ön plan pikselinin en yakın arka plan pikseline Öklid uzaklığı (float32).
+    # scipy'nin doğrusal zamanlı (Maurer) algoritması yalnızca ön plan kutusu + 1 piksel
+    # arka plan çerçevesi üzerinde çalışır; kutu dışındaki en yakın arka plan hiçbir zaman
+    # çerçevedeki en yakın pikselden daha yakın olamayacağından sonuç tam görüntüyle aynıdır.
+    mask = binary_image == 255
+    distance = np.zeros(mask.shape, dtype=np.float32)
+    box = foreground_box(mask, margin=1)
+    if box is not None:
+        y0, y1, x0, x1 = box
+        distance[y0:y1, x0:x1] = ndimage.distance_transform_edt(mask[y0:y1, x0:x1])
+    return distance
+
+
+def medial_axis(binary_image, return_distance=False):
+    # Medial eksen ve (istenirse) eksen üzerindeki piksellerin sınıra uzaklığı.
+    # skimage eşit uzaklıkları rastgele sırayla işler; sabit tohumla sonuç tekrarlanabilir.
+    mask = binary_image == 255
+    skeleton = np.zeros(mask.shape, dtype=np.uint8)
+    distance = np.zeros(mask.shape, dtype=np.float32)
+    box = foreground_box(mask, margin=1)
+    if box is not None:
+        y0, y1, x0, x1 = box
+        axis, radius = ski_medial_axis(mask[y0:y1, x0:x1], return_distance=True, rng=0)
+        skeleton[y0:y1, x0:x1][axis] = 255
+        distance[y0:y1, x0:x1] = np.where(axis, radius, 0)
+    return (skeleton, distance) if return_distance else skeleton
+
+
+def distance_map(binary_image):
+    # Gösterim için: uzaklık dönüşümü en büyük değere göre 0-255 aralığına ölçeklenir
+    distance = distance_transform(binary_image)
+    peak = distance.max(initial=0)
+    if peak > 0:
+        distance *= 255 / peak
+    return to_uint8(distance)
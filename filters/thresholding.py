@@ -1,67 +1,182 @@
 import numpy as np
 
-def manual_threshold(image_array, threshold):
-    binary = np.where(image_array > threshold, 255, 0)
-    return binary.astype(np.uint8)
-
-def otsu_threshold(image_array):
-    histogram, _ = np.histogram(image_array, bins=256, range=(0, 256))
-    total = image_array.size
-
-    current_max, threshold = 0, 0
-    sum_total, sum_foreground = 0, 0
-    weight_background, weight_foreground = 0, 0
-
-    for i in range(256):
-        sum_total += i * histogram[i]
-
-    for t in range(256):
-        weight_background += histogram[t]
-        if weight_background == 0:
-            continue
-
-        weight_foreground = total - weight_background
-        if weight_foreground == 0:
-            break
-
-        sum_foreground += t * histogram[t]
-
+from filters.dtypes import apply_lut, output_array
+from filters.histogram import calculate_histogram
+
+# Eşik seçimleri kümülatif toplamlarla tüm t değerleri için tek geçişte hesaplanır.
+# *_level fonksiyonları (..., 256) şeklindeki histogramlar üzerinde çalışır; böylece
+# bir görüntü yığını için tüm eşikler aynı anda bulunur.
+# İkili sonuçlar karşılaştırmanın doğrudan uint8 çıktı üzerine yazılmasıyla üretilir
+# (bool görünümü * 255); out verilirse çağrı başına yeni dizi açılmaz.
+
+def threshold_lut(threshold):
+    return np.where(np.arange(256) > threshold, 255, 0).astype(np.uint8)
+
+def manual_threshold(image_array, threshold, out=None):
+    # Karşılaştırma sonucu (bool) çıktı dizisine yazılır ve yerinde 255 ile çarpılır;
+    # int64 ya da ayrı bool ara dizi yok. threshold yayınlanabilir bir dizi de olabilir.
+    out = output_array(image_array.shape, out)
+    np.greater(image_array, threshold, out=out.view(np.bool_))
+    out *= np.uint8(255)
+    return out
+
+def _histogram(image_array, histogram):
+    if histogram is not None:
+        return histogram
+    if image_array.dtype == np.uint8:
+        return calculate_histogram(image_array)
+    return np.histogram(image_array, bins=256, range=(0, 256))[0]
+
+def stack_histograms(stack):
+    # (N, H, W) -> (N, 256); kare başına 256'lık kaydırma ile tek bincount
+    n = stack.shape[0]
+    offsets = (np.arange(n) * 256).reshape((n,) + (1,) * (stack.ndim - 1))
+    flat = (stack + offsets).ravel()
+    return np.bincount(flat, minlength=n * 256).reshape(n, 256)
+
+def otsu_level(histogram):
+    histogram = np.asarray(histogram, dtype=np.int64)
+    bins = np.arange(histogram.shape[-1])
+    total = histogram.sum(axis=-1, keepdims=True)
+
+    weight_background = np.cumsum(histogram, axis=-1)
+    weight_foreground = total - weight_background
+    sum_foreground = np.cumsum(histogram * bins, axis=-1)
+    sum_total = sum_foreground[..., -1:]
+
+    valid = (weight_background > 0) & (weight_foreground > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
         mean_b = sum_foreground / weight_background
         mean_f = (sum_total - sum_foreground) / weight_foreground
-
         between_var = weight_background * weight_foreground * (mean_b - mean_f) ** 2
-
-        if between_var > current_max:
-            current_max = between_var
-            threshold = t
-
-    return np.where(image_array > threshold, 255, 0).astype(np.uint8)
-
-def kapur_threshold(image_array):
-    hist, _ = np.histogram(image_array, bins=256, range=(0, 256))
-    hist = hist.astype(np.float64)
-    hist = hist / hist.sum()  # normalize et
-
-    max_entropy = -np.inf
-    threshold = 0
-
-    for t in range(1, 255):
-        p1 = hist[:t]
-        p2 = hist[t:]
-
-        w1 = p1.sum()
-        w2 = p2.sum()
-
-        if w1 == 0 or w2 == 0:
-            continue
-
-        H1 = -np.sum(p1 / w1 * np.log(p1 / w1 + 1e-12)) # 0'a bölmeyi engelle
-        H2 = -np.sum(p2 / w2 * np.log(p2 / w2 + 1e-12))
-
-        total_entropy = H1 + H2
-
-        if total_entropy > max_entropy:
-            max_entropy = total_entropy
-            threshold = t
-
-    return np.where(image_array > threshold, 255, 0).astype(np.uint8)
+    between_var = np.where(valid, between_var, 0)
+
+    # Döngüdeki gibi: kesin olarak 0'dan büyük ilk maksimum, yoksa 0
+    threshold = np.argmax(between_var, axis=-1)
+    best = np.take_along_axis(between_var, threshold[..., None], axis=-1)[..., 0]
+    return np.where(best > 0, threshold, 0)
+
+def kapur_level(histogram):
+    counts = np.asarray(histogram, dtype=np.float64)
+    total = counts.sum(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = counts / total
+        plogp = np.where(p > 0, p * np.log(np.where(p > 0, p, 1)), 0)
+
+        # t için arka plan hist[:t], ön plan hist[t:]
+        count_b = np.cumsum(counts, axis=-1)[..., :-1]
+        count_f = total - count_b
+        w1 = np.cumsum(p, axis=-1)[..., :-1]
+        w2 = 1 - w1
+        s1 = np.cumsum(plogp, axis=-1)[..., :-1]
+        s2 = plogp.sum(axis=-1, keepdims=True) - s1
+
+        entropy = (np.log(w1) - s1 / w1) + (np.log(w2) - s2 / w2)
+
+    t = np.arange(1, counts.shape[-1])
+    valid = (count_b > 0) & (count_f > 0) & (t < 255)
+    entropy = np.where(valid, entropy, -np.inf)
+    # Boş kutular matematiksel eşitlik yaratır; yuvarlama yerine ilk eşit t seçilir
+    best = entropy.max(axis=-1, keepdims=True)
+    tolerance = 1e-12 * np.maximum(1, np.abs(np.where(np.isfinite(best), best, 0)))
+    threshold = np.argmax(entropy >= best - tolerance, axis=-1) + 1
+    return np.where(valid.any(axis=-1), threshold, 0)
+
+def otsu_threshold(image_array, histogram=None, out=None):
+    return manual_threshold(image_array, otsu_level(_histogram(image_array, histogram)), out)
+
+def kapur_threshold(image_array, histogram=None, out=None):
+    return manual_threshold(image_array, kapur_level(_histogram(image_array, histogram)), out)
+
+
+# Çok seviyeli Otsu: tüm [u, v] aralıkları için S²/P tablosu önceden hesaplanır,
+# sınıf varyansı toplamı dinamik programlama ile maksimize edilir.
+def multi_otsu_levels(histogram, thresholds=2):
+    if not 1 <= thresholds <= 4:
+        raise ValueError("Eşik sayısı 1 ile 4 arasında olmalı")
+
+    hist = np.asarray(histogram, dtype=np.float64)
+    bins = hist.size
+    p = hist / hist.sum()
+    P = np.concatenate(([0.0], np.cumsum(p)))
+    S = np.concatenate(([0.0], np.cumsum(p * np.arange(bins))))
+
+    # table[u, v] = [u, v] aralığının S²/P değeri (u <= v)
+    weight = P[None, 1:] - P[:-1, None]
+    moment = S[None, 1:] - S[:-1, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        table = np.where(weight > 0, moment ** 2 / weight, 0.0)
+    table = np.where(np.triu(np.ones((bins, bins), dtype=bool)), table, -np.inf)
+
+    # best[v]: [0, v] aralığını j+1 sınıfa bölmenin en iyi değeri
+    best = table[0].copy()
+    choices = []
+    for _ in range(thresholds):
+        candidates = best[:, None] + np.vstack((table[1:], np.full((1, bins), -np.inf)))
+        choices.append(np.argmax(candidates, axis=0))
+        best = candidates[choices[-1], np.arange(bins)]
+
+    levels = []
+    v = bins - 1
+    for choice in reversed(choices):
+        v = int(choice[v])
+        levels.append(v)
+    return levels[::-1]
+
+def multi_otsu_threshold(image_array, thresholds=2, histogram=None, out=None):
+    levels = multi_otsu_levels(_histogram(image_array, histogram), thresholds)
+    lut = (np.arange(thresholds + 1) * 255 // thresholds).astype(np.uint8)
+    if image_array.dtype == np.uint8:
+        # Sınıflar 256'lık tabloda bir kez; görüntüye tek LUT geçişi
+        return apply_lut(image_array, lut[np.digitize(np.arange(256), levels, right=True)], out)
+    result = lut[np.digitize(image_array, levels, right=True)]
+    if out is None:
+        return result
+    output_array(image_array.shape, out)[...] = result
+    return out
+
+
+# Yerel eşikleme: pencere ortalaması ve standart sapması integral görüntülerden.
+# İntegral toplamlar float32'de birikirken hassasiyet kaybeder; burada float64 kalır.
+def _local_mean_std(image_array, window_size):
+    r = window_size // 2
+    padded = np.pad(image_array.astype(np.float64), r, mode='reflect')
+    h, w = image_array.shape
+    area = window_size * window_size
+
+    def window_sum(values):
+        integral = np.zeros((values.shape[0] + 1, values.shape[1] + 1))
+        np.cumsum(np.cumsum(values, axis=0), axis=1, out=integral[1:, 1:])
+        k = window_size
+        return (integral[k:k + h, k:k + w] - integral[:h, k:k + w]
+                - integral[k:k + h, :w] + integral[:h, :w])
+
+    mean = window_sum(padded) / area
+    variance = window_sum(padded * padded) / area - mean * mean
+    return mean, np.sqrt(np.maximum(variance, 0))
+
+def niblack_threshold(image_array, window_size=15, k=-0.2, out=None):
+    mean, std = _local_mean_std(image_array, window_size)
+    std *= k
+    mean += std
+    return manual_threshold(image_array, mean, out)
+
+def sauvola_threshold(image_array, window_size=15, k=0.2, r=128, out=None):
+    mean, std = _local_mean_std(image_array, window_size)
+    std /= r
+    std -= 1
+    std *= k
+    std += 1
+    mean *= std
+    return manual_threshold(image_array, mean, out)
+
+
+# Yığın API: (N, H, W) uint8 kareler tek seferde eşiklenir
+def batch_threshold(stack, method="otsu", out=None):
+    stack = np.asarray(stack)
+    levels = {"otsu": otsu_level, "kapur": kapur_level}
+    if method not in levels:
+        raise ValueError(f"Bilinmeyen yöntem: {method}")
+    thresholds = levels[method](stack_histograms(stack))
+    thresholds = thresholds.reshape((-1,) + (1,) * (stack.ndim - 1))
+    return manual_threshold(stack, thresholds, out)
@@ -0,0 +1,103 @@
+import os
+
+import numpy as np
+
+from filters.convolution import (apply_mean_filter, apply_median_filter, apply_edge_filter,
+                                 apply_smoothing_filter, apply_sharpen_filter, apply_gaussian_filter,
+                                 apply_sobel_filter, apply_prewitt_filter, apply_scharr_filter)
+from filters.dtypes import to_gray
+from filters.morphology import dilation, erosion
+
+# Bellekten büyük görüntüler için karo karo işleme.
+# Kaynak bellek eşlemeli (npy/raw/tiff) okunur; her karo, filtre yarıçapı kadar komşu
+# piksel (halo) ile birlikte işlenir ve yalnızca merkez bölge bellek eşlemeli çıktıya
+# yazılır. Görüntü kenarındaki karolarda filtre kendi dolgusunu yaptığından sonuç,
+# tüm görüntü üzerinde çalıştırılan filtreyle birebir aynıdır.
+
+DEFAULT_TILE_SIZE = 1024
+
+# ad: (fonksiyon, halo)
+TILED_FILTERS = {
+    "mean": (apply_mean_filter, 1),
+    "median": (apply_median_filter, 1),
+    "edge": (apply_edge_filter, 1),
+    "smoothing": (apply_smoothing_filter, 1),
+    "sharpen": (apply_sharpen_filter, 1),
+    "gaussian": (apply_gaussian_filter, 4),  # sigma=1, yarıçap 4 sigma
+    "sobel": (apply_sobel_filter, 1),
+    "prewitt": (apply_prewitt_filter, 1),
+    "scharr": (apply_scharr_filter, 1),
+    "dilation": (dilation, 1),
+    "erosion": (erosion, 1),
+}
+
+
+def open_image_memmap(path, shape=None, dtype=np.uint8):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        return np.load(path, mmap_mode='r')
+    if ext in (".tif", ".tiff"):
+        try:
+            import tifffile
+        except ImportError as exc:
+            raise ImportError("TIFF bellek eşlemesi için tifffile gereklidir") from exc
+        return tifffile.memmap(path, mode='r')
+    if shape is None:
+        raise ValueError("Ham (raw) veri için shape verilmelidir")
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape)
+
+
+def iter_tiles(shape, tile_size=DEFAULT_TILE_SIZE):
+    h, w = shape[:2]
+    for top in range(0, h, tile_size):
+        for left in range(0, w, tile_size):
+            yield top, left, min(top + tile_size, h), min(left + tile_size, w)
+
+
+def process_region(source, func, region, halo, gray=False):
+    # region = (x0, y0, x1, y1); filtre bölgenin halo kadar genişletilmiş hali üzerinde çalışır
+    left, top, right, bottom = region
+    h, w = source.shape[:2]
+    y0, x0 = max(top - halo, 0), max(left - halo, 0)
+    y1, x1 = min(bottom + halo, h), min(right + halo, w)
+    block = np.asarray(source[y0:y1, x0:x1])
+    if gray:
+        block = to_gray(block)
+    result = func(block)
+    return result[top - y0:bottom - y0, left - x0:right - x0]
+
+
+def process_tiled(source, func, halo, output=None, tile_size=DEFAULT_TILE_SIZE,
+                  gray=True, progress=None):
+    h, w = source.shape[:2]
+    if output is None:
+        output = np.empty((h, w), dtype=np.uint8)
+    elif isinstance(output, str):
+        output = np.lib.format.open_memmap(output, mode='w+', dtype=np.uint8, shape=(h, w))
+
+    tiles = list(iter_tiles(source.shape, tile_size))
+    for index, (top, left, bottom, right) in enumerate(tiles):
+        output[top:bottom, left:right] = process_region(source, func, (left, top, right, bottom), halo, gray)
+        if progress:
+            progress(index + 1, len(tiles))
+
+    if isinstance(output, np.memmap):
+        output.flush()
+    return output
+
+
+def apply_tiled_filter(source, name, output=None, tile_size=DEFAULT_TILE_SIZE,
+                       kernel_size=3, progress=None):
+    func, halo = TILED_FILTERS[name]
+    if name == "median":
+        halo = kernel_size // 2
+        return process_tiled(source, lambda block: func(block, kernel_size), halo,
+                             output, tile_size, progress=progress)
+    return process_tiled(source, func, halo, output, tile_size, progress=progress)
+
+
+def overview(source, max_size=1024):
+    # Adımlı örnekleme: bellek eşlemeli kaynaktan yalnızca gerekli satırlar okunur
+    h, w = source.shape[:2]
+    step = max(1, -(-max(h, w) // max_size))
+    return np.ascontiguousarray(source[::step, ::step])
@@ -0,0 +1,125 @@
+import zlib
+
+import numpy as np
+from PIL import Image
+
+# Bellek sınırlı geri al / ileri al geçmişi.
+# Her kayıt, bir durumu komşu durumdan yeniden üretmek için gereken bilgiyi tutar:
+# - "op": ters çevrilebilir işlemler (aynalama, 90° döndürme) piksel tutmaz
+# - "delta": aynı boyut/kiptaki durumlar için XOR farkı (simetrik, zlib ile sıkıştırılmış)
+# - "snapshot": diğer durumlarda zlib ile sıkıştırılmış tam görüntü
+# Toplam bayt bütçesi aşıldığında en eski kayıtlar atılır.
+
+INVERSE_OPS = {
+    "flip_horizontal": "flip_horizontal",
+    "flip_vertical": "flip_vertical",
+    "rotate_90": "rotate_270",
+    "rotate_180": "rotate_180",
+    "rotate_270": "rotate_90",
+}
+
+_TRANSPOSE = {
+    "flip_horizontal": Image.FLIP_LEFT_RIGHT,
+    "flip_vertical": Image.FLIP_TOP_BOTTOM,
+    "rotate_90": Image.ROTATE_90,  # saat yönünün tersine 90°
+    "rotate_180": Image.ROTATE_180,
+    "rotate_270": Image.ROTATE_270,
+}
+
+DEFAULT_BUDGET = 256 * 1024 * 1024
+OP_RECORD_BYTES = 64
+
+
+class EditHistory:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET, compress_level=1):
+        self.budget_bytes = budget_bytes
+        self.compress_level = compress_level
+        self.undo_stack = []
+        self.redo_stack = []
+        self.current = None
+        self.evicted = 0
+
+    def clear(self):
+        self.undo_stack = []
+        self.redo_stack = []
+        self.current = None
+
+    def can_undo(self):
+        return bool(self.undo_stack)
+
+    def can_redo(self):
+        return bool(self.redo_stack)
+
+    def memory_usage(self):
+        return sum(entry["nbytes"] for entry in self.undo_stack + self.redo_stack)
+
+    def push(self, previous, current, op=None):
+        # op: previous -> current dönüşümü ters çevrilebilir bir işlemse adı.
+        # previous geçmişin bildiği son durum değilse (kayıt dışı değişiklik) önce o duruma
+        # dönüş kaydı eklenir; aksi halde farklar yanlış tabana uygulanırdı
+        if self.current is not None and previous is not self.current:
+            self.undo_stack.append(self.make_entry(self.current, previous))
+        if op in INVERSE_OPS:
+            entry = self.op_entry(INVERSE_OPS[op])
+        else:
+            entry = self.make_entry(previous, current)
+        self.undo_stack.append(entry)
+        self.redo_stack = []
+        self.current = current
+        self.evict()
+
+    def undo(self):
+        return self.step(self.undo_stack, self.redo_stack)
+
+    def redo(self):
+        return self.step(self.redo_stack, self.undo_stack)
+
+    def step(self, source, target):
+        if not source:
+            return None
+        entry = source.pop()
+        restored = self.apply(entry, self.current)
+        target.append(self.reverse(entry, restored, self.current))
+        self.current = restored
+        self.evict()
+        return restored
+
+    def op_entry(self, op):
+        return {"kind": "op", "op": op, "nbytes": OP_RECORD_BYTES}
+
+    def make_entry(self, target, base):
+        # base'den target'ı yeniden üretecek kayıt
+        data = target.tobytes()
+        if base is not None and base.mode == target.mode and base.size == target.size:
+            diff = np.frombuffer(data, np.uint8) ^ np.frombuffer(base.tobytes(), np.uint8)
+            payload = zlib.compress(diff.tobytes(), self.compress_level)
+            kind = "delta"
+        else:
+            payload = zlib.compress(data, self.compress_level)
+            kind = "snapshot"
+        return {"kind": kind, "mode": target.mode, "size": target.size,
+                "payload": payload, "nbytes": len(payload)}
+
+    def apply(self, entry, base):
+        if entry["kind"] == "op":
+            return base.transpose(_TRANSPOSE[entry["op"]])
+        data = zlib.decompress(entry["payload"])
+        if entry["kind"] == "delta":
+            data = (np.frombuffer(data, np.uint8) ^ np.frombuffer(base.tobytes(), np.uint8)).tobytes()
+        return Image.frombytes(entry["mode"], entry["size"], data)
+
+    def reverse(self, entry, restored, base):
+        # restored'dan base'i geri getirecek kayıt; XOR farkı iki yönde de geçerli
+        if entry["kind"] == "op":
+            return self.op_entry(INVERSE_OPS[entry["op"]])
+        if entry["kind"] == "delta":
+            return entry
+        return self.make_entry(base, restored)
+
+    def evict(self):
+        # En eski kayıtlar önce atılır; en son geri alma adımı her zaman korunur
+        total = self.memory_usage()
+        while total > self.budget_bytes and len(self.undo_stack) + len(self.redo_stack) > 1:
+            stack = self.undo_stack if len(self.undo_stack) > 1 or not self.redo_stack else self.redo_stack
+            total -= stack.pop(0)["nbytes"]
+            self.evicted += 1
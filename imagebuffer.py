@@ -0,0 +1,126 @@
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+import numpy as np
+from PIL import Image
+from PyQt5.QtGui import QImage, QPixmap
+
+from filters.dtypes import to_gray
+
+# Tek bir bitişik numpy dizisine sahip görüntü tamponu.
+# QImage görünümleri (Grayscale8 / RGB888, satır adımı dizinin stride'ı) ve gri seviye
+# PIL görünümleri kopyasız oluşturulur; gri düzlem bir kez hesaplanıp saklanır.
+# Kaçınılmaz kopyalar (PIL -> numpy, RGB PIL görünümü, QPixmap) işlem adına göre sayılır.
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+copy_stats = defaultdict(int)
+
+
+@contextmanager
+def track_copies(name):
+    previous = getattr(_local, "operation", None)
+    _local.operation = name
+    try:
+        yield
+    finally:
+        _local.operation = previous
+
+
+def record_copy(nbytes):
+    name = getattr(_local, "operation", None) or "diğer"
+    with _stats_lock:
+        copy_stats[name] += nbytes
+
+
+def take_copy_stats(name):
+    with _stats_lock:
+        return copy_stats.pop(name, 0)
+
+
+def gray_color_table(lut):
+    # qRgb(v, v, v) değerleri
+    return (np.uint32(0xFF000000) | np.asarray(lut, dtype=np.uint32) * np.uint32(0x010101)).tolist()
+
+
+class ImageBuffer:
+    def __init__(self, array):
+        array = np.asarray(array)
+        if array.dtype != np.uint8:
+            array = np.clip(array, 0, 255).astype(np.uint8)
+            record_copy(array.nbytes)
+        if not array.flags.c_contiguous:
+            array = np.ascontiguousarray(array)
+            record_copy(array.nbytes)
+        if array.ndim == 3 and array.shape[2] == 1:
+            array = array[:, :, 0]
+        self.array = array
+        self.gray_plane = array if array.ndim == 2 else None
+        self.binary_flag = None
+        self.qimage_view = None
+        self.indexed_view = None
+
+    @classmethod
+    def from_pil(cls, image):
+        if image.mode not in ("L", "RGB"):
+            image = image.convert("RGB")
+        array = np.asarray(image)
+        record_copy(array.nbytes)
+        return cls(array)
+
+    @property
+    def height(self):
+        return self.array.shape[0]
+
+    @property
+    def width(self):
+        return self.array.shape[1]
+
+    @property
+    def is_gray(self):
+        return self.array.ndim == 2
+
+    def gray(self):
+        if self.gray_plane is None:
+            self.gray_plane = to_gray(self.array)
+            self.gray_plane.setflags(write=False)
+        return self.gray_plane
+
+    def is_binary(self):
+        # Gri düzlemde yalnızca 0 ve 255 var mı (ikisi de bulunmalı); tek histogram geçişi,
+        # sonuç tampon yaşadıkça saklanır (np.unique gibi sıralama yapılmaz)
+        if self.binary_flag is None:
+            histogram = np.bincount(self.gray().ravel(), minlength=256)
+            self.binary_flag = bool(histogram[0] and histogram[255] and
+                                    histogram[0] + histogram[255] == self.gray().size)
+        return self.binary_flag
+
+    def qimage(self):
+        # QImage doğrudan dizinin belleğini gösterir; tampon yaşadıkça geçerlidir
+        if self.qimage_view is None:
+            fmt = QImage.Format_Grayscale8 if self.is_gray else QImage.Format_RGB888
+            self.qimage_view = QImage(self.array.data, self.width, self.height,
+                                      self.array.strides[0], fmt)
+        return self.qimage_view
+
+    def lut_qimage(self, lut):
+        # Gri düzlemin Indexed8 görünümü: piksel değeri renk tablosunda indistir; LUT
+        # değiştiğinde piksellere dokunulmaz, yalnızca 256 girişlik tablo yenilenir
+        if self.indexed_view is None:
+            plane = self.gray()
+            self.indexed_view = QImage(plane.data, self.width, self.height, plane.strides[0],
+                                       QImage.Format_Indexed8)
+        self.indexed_view.setColorTable(gray_color_table(lut))
+        return self.indexed_view
+
+    def pixmap(self):
+        record_copy(self.array.nbytes)
+        return QPixmap.fromImage(self.qimage())
+
+    def pil(self):
+        if self.is_gray:
+            return Image.frombuffer("L", (self.width, self.height), self.array, "raw", "L", 0, 1)
+        # PIL RGB görüntüleri piksel başına 4 bayt saklar; paylaşım mümkün değil
+        record_copy(self.array.nbytes)
+        return Image.fromarray(self.array)
@@ -0,0 +1,165 @@
+import os
+import shutil
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from filters.dtypes import to_gray
+
+# Görüntü dosyası okuma/yazma katmanı (PyQt5 içe aktarılmaz; toplu işlemede de kullanılır).
+# - probe: yalnızca dosya başlığı okunur (boyut, kip, biçim); pikseller çözülmez
+# - preview_image: JPEG'de PIL draft() ile DCT ölçeklemeli (1/2, 1/4, 1/8) küçük çözme
+# - .npy dosyaları bellek eşlemeli açılır, .npy çıktısı ham dizi olarak yazılır
+# - encode: PNG sıkıştırma düzeyi ve JPEG kalitesi ayarlanabilir (varsayılanlar PIL'inkiler)
+# - AsyncWriter: arka plan yazıcı kuyruğu; prefetch: sıralı, önden okumalı çözme
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".pnm", ".tif", ".tiff", ".npy")
+GRAY_MODES = ("1", "L", "I", "I;16")
+PNG_COMPRESS_LEVEL = 6
+JPEG_QUALITY = 75
+PREFETCH_DEPTH = 4
+
+
+def extension(path):
+    return os.path.splitext(path)[1].lower()
+
+
+def _npy_header(path):
+    with open(path, "rb") as handle:
+        version = np.lib.format.read_magic(handle)
+        if version == (1, 0):
+            shape, _, dtype = np.lib.format.read_array_header_1_0(handle)
+        else:
+            shape, _, dtype = np.lib.format.read_array_header_2_0(handle)
+    return shape, dtype
+
+
+def probe(path):
+    # Başlıktan (genişlik, yükseklik, kip, biçim)
+    if extension(path) == ".npy":
+        shape, dtype = _npy_header(path)
+        mode = "L" if len(shape) == 2 else "RGB"
+        return shape[1], shape[0], mode, f"npy:{dtype}"
+    with Image.open(path) as img:
+        return img.width, img.height, img.mode, img.format
+
+
+def output_mode(mode, color):
+    # Gri dosyalar tek kanal kalır; renkli dosyalar color=False ise griye çevrilir
+    return "RGB" if color and mode not in GRAY_MODES else "L"
+
+
+def preview_image(path, max_size):
+    # Tam çözmeden önce gösterilecek küçük görüntü; JPEG dışı biçimlerde kısa yol yok (None)
+    if extension(path) == ".npy":
+        return None
+    with Image.open(path) as img:
+        if img.format != "JPEG" or img.width <= 2 * max_size[0] and img.height <= 2 * max_size[1]:
+            return None
+        mode = output_mode(img.mode, True)
+        img.draft(mode, max_size)
+        return img.convert(mode)
+
+
+def decode(path, color=False, max_size=None):
+    # uint8 (H, W) ya da (H, W, 3) dizi. max_size verilirse JPEG küçültülerek çözülür
+    # (sonuç max_size'dan küçük olmaz); .npy bellek eşlemeli açılır, kopyası yapılmaz.
+    if extension(path) == ".npy":
+        array = np.load(path, mmap_mode="r")
+        if not (array.ndim == 2 or array.ndim == 3 and array.shape[2] in (3, 4)):
+            raise ValueError(f"(H, W) ya da (H, W, 3/4) görüntü bekleniyordu: {array.shape} "
+                             f"(kare yığınları batch.py --stack ile işlenir)")
+        return array if color or array.ndim == 2 else to_gray(array)
+    with Image.open(path) as img:
+        mode = output_mode(img.mode, color)
+        if max_size is not None:
+            img.draft(mode, max_size)
+        return np.asarray(img.convert(mode))
+
+
+def open_image(path):
+    # Arayüz için PIL görüntüsü: gri dosyalar "L", diğerleri "RGB"
+    if extension(path) == ".npy":
+        return Image.fromarray(np.asarray(decode(path, color=True)))
+    with Image.open(path) as img:
+        return img.convert(output_mode(img.mode, True))
+
+
+def save_options(path, png_level=None, jpeg_quality=None):
+    ext = extension(path)
+    if ext == ".png":
+        return {"compress_level": PNG_COMPRESS_LEVEL if png_level is None else png_level}
+    if ext in (".jpg", ".jpeg"):
+        return {"quality": JPEG_QUALITY if jpeg_quality is None else jpeg_quality}
+    return {}
+
+
+def encode(image, path, png_level=None, jpeg_quality=None):
+    # PIL görüntüsü ya da dizi; yazılan bayt sayısını döndürür
+    if extension(path) == ".npy":
+        np.save(path, np.asarray(image))
+        return os.path.getsize(path)
+    if isinstance(image, np.ndarray):
+        if image.dtype != np.uint8:
+            image = np.clip(image, 0, 255).astype(np.uint8)
+        image = Image.fromarray(image)
+    image.save(path, **save_options(path, png_level, jpeg_quality))
+    return os.path.getsize(path)
+
+
+def prefetch(paths, load, depth=PREFETCH_DEPTH, workers=2):
+    # (yol, Future) çiftleri sırayla; her an en fazla depth dosya önden okunur.
+    # Hata Future içinde kalır, result() çağrısında yükseltilir.
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="okuyucu") as pool:
+        queue = deque()
+        for path in paths:
+            queue.append((path, pool.submit(load, path)))
+            if len(queue) >= depth:
+                yield queue.popleft()
+        while queue:
+            yield queue.popleft()
+
+
+class AsyncWriter:
+    # Kodlama/yazma tek bir arka plan iş parçacığında sırayla yapılır. max_pending aşılınca
+    # submit en eski yazmanın bitmesini bekler (bellekte sınırsız sonuç birikmez).
+    def __init__(self, max_pending=None, png_level=None, jpeg_quality=None):
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yazıcı")
+        self.max_pending = max_pending
+        self.png_level = png_level
+        self.jpeg_quality = jpeg_quality
+        self.lock = threading.Lock()
+        self.pending = deque()
+
+    def _track(self, future):
+        with self.lock:
+            self.pending.append(future)
+            while self.pending and self.pending[0].done():
+                self.pending.popleft()
+            oldest = self.pending[0] if self.max_pending and len(self.pending) > self.max_pending else None
+        if oldest is not None:
+            oldest.exception()
+        return future
+
+    def submit(self, image, path, png_level=None, jpeg_quality=None):
+        png_level = self.png_level if png_level is None else png_level
+        jpeg_quality = self.jpeg_quality if jpeg_quality is None else jpeg_quality
+        return self._track(self.pool.submit(encode, image, path, png_level, jpeg_quality))
+
+    def copy(self, source, path):
+        return self._track(self.pool.submit(shutil.copyfile, source, path))
+
+    def flush(self):
+        # Bekleyen tüm yazmalar bitene kadar bekler; Future listesini döndürür
+        with self.lock:
+            futures, self.pending = list(self.pending), deque()
+        for future in futures:
+            future.exception()
+        return futures
+
+    def close(self):
+        self.flush()
+        self.pool.shutdown(wait=True)
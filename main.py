@@ -1,23 +1,52 @@
+import os
 import sys
+import tempfile
+import time
+from functools import partial
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QLabel, QPushButton,
-    QFileDialog, QVBoxLayout, QHBoxLayout, QWidget, QMenu, QAction, QMessageBox
+    QFileDialog, QVBoxLayout, QHBoxLayout, QWidget, QMenu, QAction, QMessageBox,
+    QProgressBar
 )
-from PyQt5.QtWidgets import QInputDialog, QGroupBox, QScrollArea
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import QInputDialog, QGroupBox, QScrollArea, QDockWidget
+from PyQt5.QtGui import QPixmap, QPainter, QPen
+from PyQt5.QtCore import Qt, QTimer, QPointF, QRectF, pyqtSignal
 import numpy as np
 from PIL import Image
 
-from filters.convolution import apply_mean_filter, apply_median_filter, apply_edge_filter, apply_smoothing_filter, apply_sharpen_filter
-from filters.histogram import calculate_histogram, plot_histogram, histogram_equalization, contrast_stretching
-from filters.thresholding import manual_threshold, otsu_threshold, kapur_threshold
+from filters.convolution import (apply_mean_filter, apply_median_filter, apply_edge_filter, apply_smoothing_filter, apply_sharpen_filter,
+                                 apply_gaussian_filter, apply_sobel_filter, apply_prewitt_filter, apply_scharr_filter)
+from filters.histogram import (calculate_histogram, plot_histogram, histogram_equalization, contrast_stretching,
+                               adjust_contrast, contrast_lut)
+from filters.thresholding import manual_threshold, threshold_lut, otsu_threshold, kapur_threshold
 from filters.morphology import dilation, erosion
+from filters.cache import ResultCache
+from filters.tiling import open_image_memmap, apply_tiled_filter, overview
+from filters.pyramid import ImagePyramid
+from filters.regions import find_regions
+from filters.thinning import thin, medial_axis, distance_map
 from filters.geometry import compute_centroid, skeletonize, rotate_image, shear_image, flip_horizontal, flip_vertical
+from filters.parallel import PARALLEL_FILTERS, parallel_filter
+from adjustpanel import AdjustPanel
+from history import EditHistory
+from imagebuffer import ImageBuffer, track_copies, take_copy_stats
+from imagefile import JPEG_QUALITY, AsyncWriter, open_image, preview_image
+from session import SessionLog
+from statspanel import StatsPanel
+from telemetry import Telemetry
+from viewer import ZoomableLabel
+from workers import OperationExecutor
 
 #TO-DO: geri al ve kaydet ekle
 
+# Bu piksel sayısının üzerindeki TIFF dosyaları bellek eşlemeli karo modunda açılır
+TILED_PIXEL_LIMIT = 50_000_000
+# Bu piksel sayısının üzerindeki görüntülerde filtre önce piramit seviyesinde önizlenir
+PREVIEW_PIXEL_LIMIT = 2_000_000
+
 class ImageProcessor(QMainWindow):
+    save_finished = pyqtSignal(str, str, float)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Görüntü İşleme Uygulaması")
@@ -25,13 +54,32 @@ class ImageProcessor(QMainWindow):
 
         self.original_image = None
         self.processed_image = None
-        self.history_stack = []
+        self.history = EditHistory()
+        self.results = ResultCache()
+        self.telemetry = Telemetry()
+        self.session = SessionLog()
+        self.image_path = None
+        self.tiled_source = None
+        self.tiled_output = None
+        self.tiled_dir = None
+        self.image_version = 0
+        self.analysis_cache = {}
+        self.display_image = None
+        self.preview_func = None
+        self.preview_color = False
+        self.regions = None
+        self.centroid = None
+        self.processed_cache = None
+        self.live_buffer = None
+        self.live_active = False
+        self.loading = False
 
         self.original_image_label = QLabel("Orijinal Görüntü", self)
         self.original_image_label.setAlignment(Qt.AlignCenter)
 
-        self.processed_image_label = QLabel("İşlenmiş Görüntü", self)
+        self.processed_image_label = ZoomableLabel("İşlenmiş Görüntü", self)
         self.processed_image_label.setAlignment(Qt.AlignCenter)
+        self.processed_image_label.viewport_changed.connect(self.render_processed)
 
         self.processed_image_label.setContextMenuPolicy(Qt.CustomContextMenu)
         self.processed_image_label.customContextMenuRequested.connect(self.show_context_menu_processed)
@@ -41,6 +89,21 @@ class ImageProcessor(QMainWindow):
         self.flash_label.setAlignment(Qt.AlignCenter)
         self.flash_label.hide()
 
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)  # süresi bilinmeyen işlem: meşgul göstergesi
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.hide()
+
+        self.executor = OperationExecutor(self)
+        self.executor.started.connect(self.on_operation_started)
+        self.executor.finished.connect(self.on_operation_finished)
+        self.executor.failed.connect(self.on_operation_failed)
+        self.writer = AsyncWriter()
+        self.save_finished.connect(self.on_save_finished)
+        self.executor.busy_changed.connect(self.on_busy_changed)
+        # Önizleme piramitleri ayrı yürütücüde kurulur: filtre istekleri kurulumu iptal etmez
+        self.pyramid_executor = OperationExecutor(self, coalesce_ms=0)
+
         # Butonlar
         self.open_button = QPushButton("Görüntü Aç")
         self.open_button.clicked.connect(self.load_image)
@@ -58,6 +121,8 @@ class ImageProcessor(QMainWindow):
         self.stretch_button.clicked.connect(self.stretch_contrast)
         self.manual_thresh_button = QPushButton("Manuel Eşikleme")
         self.manual_thresh_button.clicked.connect(self.apply_manual_threshold)
+        self.contrast_button = QPushButton("Kontrast Ayarı")
+        self.contrast_button.clicked.connect(self.apply_contrast)
         self.otsu_button = QPushButton("Otsu Eşikleme")
         self.otsu_button.clicked.connect(self.apply_otsu)
         self.kapur_button = QPushButton("Kapur Eşikleme")
@@ -70,10 +135,26 @@ class ImageProcessor(QMainWindow):
         self.centroid_button.clicked.connect(self.show_centroid)
         self.skeleton_button = QPushButton("İskelet Çıkar")
         self.skeleton_button.clicked.connect(self.apply_skeleton)
+        self.zhang_suen_button = QPushButton("İnceltme (Zhang-Suen)")
+        self.zhang_suen_button.clicked.connect(lambda: self.apply_thinning("zhang_suen"))
+        self.guo_hall_button = QPushButton("İnceltme (Guo-Hall)")
+        self.guo_hall_button.clicked.connect(lambda: self.apply_thinning("guo_hall"))
+        self.medial_axis_button = QPushButton("Medial Eksen")
+        self.medial_axis_button.clicked.connect(self.apply_medial_axis)
+        self.distance_button = QPushButton("Uzaklık Dönüşümü")
+        self.distance_button.clicked.connect(self.apply_distance_transform)
         self.smooth_button = QPushButton("Yumuşatma Filtresi")
         self.smooth_button.clicked.connect(self.apply_smoothing)
         self.sharpen_button = QPushButton("Keskinleştirme Filtresi")
         self.sharpen_button.clicked.connect(self.apply_sharpening)
+        self.gaussian_button = QPushButton("Gauss Filtresi")
+        self.gaussian_button.clicked.connect(self.apply_gaussian)
+        self.sobel_button = QPushButton("Sobel Kenar")
+        self.sobel_button.clicked.connect(self.apply_sobel)
+        self.prewitt_button = QPushButton("Prewitt Kenar")
+        self.prewitt_button.clicked.connect(self.apply_prewitt)
+        self.scharr_button = QPushButton("Scharr Kenar")
+        self.scharr_button.clicked.connect(self.apply_scharr)
         self.rotate_button = QPushButton("90° Döndür")
         self.rotate_button.clicked.connect(self.apply_rotation)
         self.shear_button = QPushButton("X Yönünde Shearing")
@@ -84,8 +165,14 @@ class ImageProcessor(QMainWindow):
         self.flip_v_button.clicked.connect(self.apply_flip_vertical)
         self.undo_button = QPushButton("Geri Al")
         self.undo_button.clicked.connect(self.undo_last_operation)
+        self.redo_button = QPushButton("İleri Al")
+        self.redo_button.clicked.connect(self.redo_last_operation)
+        self.history_label = QLabel("")
+        self.history_label.setAlignment(Qt.AlignCenter)
         self.commit_button = QPushButton("Değişikliği Kaydet")
         self.commit_button.clicked.connect(self.commit_changes)
+        self.session_button = QPushButton("Oturumu Kaydet")
+        self.session_button.clicked.connect(self.save_session)
 
         image_column = QVBoxLayout()
         image_column.addWidget(self.original_image_label)
@@ -98,6 +185,10 @@ class ImageProcessor(QMainWindow):
         filter_layout.addWidget(self.edge_button)
         filter_layout.addWidget(self.smooth_button)
         filter_layout.addWidget(self.sharpen_button)
+        filter_layout.addWidget(self.gaussian_button)
+        filter_layout.addWidget(self.sobel_button)
+        filter_layout.addWidget(self.prewitt_button)
+        filter_layout.addWidget(self.scharr_button)
         filter_group.setLayout(filter_layout)
 
         hist_group = QGroupBox("Histogram")
@@ -105,6 +196,7 @@ class ImageProcessor(QMainWindow):
         hist_layout.addWidget(self.hist_button)
         hist_layout.addWidget(self.equalize_button)
         hist_layout.addWidget(self.stretch_button)
+        hist_layout.addWidget(self.contrast_button)
         hist_group.setLayout(hist_layout)
 
         thresh_group = QGroupBox("Eşikleme")
@@ -132,14 +224,22 @@ class ImageProcessor(QMainWindow):
         censke_layout = QVBoxLayout()
         censke_layout.addWidget(self.centroid_button)
         censke_layout.addWidget(self.skeleton_button)
+        censke_layout.addWidget(self.zhang_suen_button)
+        censke_layout.addWidget(self.guo_hall_button)
+        censke_layout.addWidget(self.medial_axis_button)
+        censke_layout.addWidget(self.distance_button)
         censke_group.setLayout(censke_layout)
 
         control_group = QGroupBox("Genel")
         control_layout = QVBoxLayout()
         control_layout.addWidget(self.open_button)
         control_layout.addWidget(self.undo_button)
+        control_layout.addWidget(self.redo_button)
         control_layout.addWidget(self.commit_button)
+        control_layout.addWidget(self.session_button)
         control_layout.addWidget(self.flash_label)
+        control_layout.addWidget(self.progress_bar)
+        control_layout.addWidget(self.history_label)
         control_group.setLayout(control_layout)
 
         scroll_content = QWidget()
@@ -164,6 +264,22 @@ class ImageProcessor(QMainWindow):
         container.setLayout(main_layout)
         self.setCentralWidget(container)
 
+        self.stats_panel = StatsPanel(self.telemetry, self)
+        self.stats_panel.setFeatures(QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable |
+                                     QDockWidget.DockWidgetClosable)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.stats_panel)
+        self.stats_panel.hide()
+
+        self.adjust_panel = AdjustPanel(self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.adjust_panel)
+        self.adjust_panel.hide()
+        self.adjust_panel.preview_requested.connect(self.render_live_adjust)
+        self.adjust_panel.commit_requested.connect(self.commit_live_adjust)
+        self.adjust_panel.visibilityChanged.connect(self.on_adjust_visibility)
+        self.stats_button = QPushButton("Performans Paneli")
+        self.stats_button.clicked.connect(self.stats_panel.toggleViewAction().trigger)
+        control_layout.addWidget(self.stats_button)
+
         self.setStyleSheet("""
             QWidget {
                 background-color: #F5EBE0;  /* Daha sıcak, açık bej ton */
@@ -212,28 +328,198 @@ class ImageProcessor(QMainWindow):
 
 
     def load_image(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Görüntü Seç", "", "Image Files (*.png *.jpg *.bmp *.pnm)")
+        path, _ = QFileDialog.getOpenFileName(self, "Görüntü Seç", "", "Image Files (*.png *.jpg *.bmp *.pnm *.tif *.tiff *.npy)")
         if path:
-            self.original_image = Image.open(path).convert("RGB")
+            self.executor.cancel()
+            self.pyramid_executor.cancel()
+            self.image_path = path
+            # Tam çözme arka planda yapılır; bitene kadar işlemler görüntü yokmuş gibi davranır.
+            # JPEG'de önce panel boyutunda küçültülmüş (draft) çözme gösterilir.
+            self.original_image = None
             self.processed_image = None
-            self.show_original_image(self.original_image)
+            self.display_image = None
+            self.regions = None
+            self.preview_func = None
+            self.live_active = False
+            self.live_buffer = None
+            self.processed_image_label.reset_view()
             self.processed_image_label.clear()
+            # Eski görüntünün geçmişi atılır; çözme bitene kadar geri al / ileri al / kaydet kapalı
+            # (aksi halde yürütücüyü iptal edip çözmeyi kaybederlerdi)
+            self.history.clear()
+            self.update_history_label()
+            self.set_loading(True)
+            label = self.original_image_label
+            with self.telemetry.operation("Görüntü Aç"), self.telemetry.phase("önizleme", path=path):
+                preview = preview_image(path, (label.width(), label.height()))
+            if preview is not None:
+                self.show_original_image(preview)
+            else:
+                label.clear()
+            self.run_operation("Görüntü Aç", lambda: self.decode_image(path), self.on_image_loaded)
+
+    def decode_image(self, path):
+        # İş parçacığında çalışır: (karo kaynağı ya da None, PIL görüntüsü)
+        with self.telemetry.phase("çözme", path=path):
+            tiled_source = self.open_tiled_source(path)
+            if tiled_source is not None:
+                # Büyük görüntü: arayüzde yalnızca küçültülmüş önizleme tutulur
+                return tiled_source, Image.fromarray(overview(tiled_source)).convert("RGB")
+            # Gri dosyalar tek kanal kalır; renkli filtre yolu yalnızca renkli görüntüde çalışır
+            return None, open_image(path)
+
+    def set_loading(self, loading):
+        self.loading = loading
+        for button in (self.undo_button, self.redo_button, self.commit_button):
+            button.setEnabled(not loading)
+
+    def on_image_loaded(self, loaded):
+        self.set_loading(False)
+        self.tiled_source, self.original_image = loaded
+        self.tiled_output = None
+        self.bump_image_version()
+        self.build_pyramids()
+        self.history.clear()
+        self.session.start(os.path.basename(self.image_path or ""), self.original_buffer().array)
+        self.update_history_label()
+        self.show_original_image(self.original_image)
+
+    def open_tiled_source(self, path):
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in (".npy", ".tif", ".tiff"):
+            return None
+        try:
+            source = open_image_memmap(path)
+        except (ImportError, ValueError):
+            if ext == ".npy":
+                raise
+            return None
+        if ext == ".npy" or source.shape[0] * source.shape[1] > TILED_PIXEL_LIMIT:
+            return source
+        return None
+
+    def tiled_output_path(self):
+        if self.tiled_dir is None:
+            self.tiled_dir = tempfile.TemporaryDirectory(prefix="tiled_")
+        handle, path = tempfile.mkstemp(suffix=".npy", dir=self.tiled_dir.name)
+        os.close(handle)
+        return path
+
+    def bump_image_version(self):
+        # Orijinal görüntü değiştiğinde önbelleğe alınmış analizler geçersiz olur
+        self.image_version += 1
+        self.analysis_cache = {}
+
+    def cached(self, key, compute):
+        if key not in self.analysis_cache:
+            with self.telemetry.phase(f"girdi:{key[0] if isinstance(key, tuple) else key}"):
+                self.analysis_cache[key] = compute()
+        return self.analysis_cache[key]
+
+    def original_buffer(self):
+        return self.cached("buffer", lambda: ImageBuffer.from_pil(self.original_image))
+
+    def gray_array(self):
+        # ImageBuffer gri düzlemi salt okunurdur; convert("L") + np.array kopyaları yapılmaz
+        return self.cached("gray", lambda: self.original_buffer().gray())
+
+    def freeze_array(self, array):
+        # content_hash özeti yalnızca verisinin sahibi olan salt okunur dizilerde saklar: görünümler
+        # kopyalanır (küçük analiz sonuçları için; büyük görüntü dizilerinde kullanılmaz)
+        if array.base is not None:
+            array = array.copy()
+        array.setflags(write=False)
+        return array
+
+    def source_array(self, color=False):
+        # color: renkli görüntüde (H, W, 3) dizi, gri görüntüde zaten tek kanal
+        return self.original_buffer().array if color else self.gray_array()
+
+    def build_pyramids(self):
+        # Görüntü yüklenince / değişiklik kaydedilince arka planda; renkli görüntüde gri ve renkli
+        buffer, version = self.original_buffer(), self.image_version
+        colors = (False,) if buffer.is_gray else (False, True)
+
+        def compute():
+            with self.telemetry.operation("Piramit"), self.telemetry.phase("girdi:pyramid"):
+                return {color: ImagePyramid(buffer.array if color else buffer.gray()) for color in colors}
+
+        self.pyramid_executor.submit("Piramit", compute, lambda pyramids: self.on_pyramids_built(pyramids, version))
+
+    def on_pyramids_built(self, pyramids, version):
+        if version != self.image_version:
+            return
+        for color, pyramid in pyramids.items():
+            self.analysis_cache[("pyramid", color)] = pyramid
+
+    def pyramid(self, color=False):
+        # Arka planda kurulan piramit; hazır değilse None (önizleme yapılmaz, tam çözünürlük beklenir)
+        return self.analysis_cache.get(("pyramid", color))
+
+    def processed_buffer(self):
+        # İşlenmiş görüntü değişene kadar aynı tampon (gri düzlem, ikili kontrolü) kullanılır
+        if self.processed_cache is None or self.processed_cache[0] is not self.processed_image:
+            self.processed_cache = (self.processed_image, ImageBuffer.from_pil(self.processed_image))
+        return self.processed_cache[1]
+
+    def binary_input(self):
+        buffer = self.processed_buffer()
+        if not buffer.is_binary():
+            QMessageBox.warning(self, "Uyarı", "İkili görüntü gereklidir.")
+            return None
+        return buffer.gray()
+
+    def gray_histogram(self):
+        return self.cached("histogram", lambda: self.freeze_array(calculate_histogram(self.gray_array())))
 
     def pil_to_pixmap(self, pil_image):
-        img = pil_image.convert("RGB")
-        data = img.tobytes("raw", "RGB")
-        qimage = QImage(data, img.width, img.height, QImage.Format_RGB888)
-        return QPixmap.fromImage(qimage)
+        return ImageBuffer.from_pil(pil_image).pixmap()
 
     def show_original_image(self, pil_image):
-        pixmap = self.pil_to_pixmap(pil_image)
+        if pil_image is self.original_image:
+            pixmap = self.original_buffer().pixmap()
+        else:
+            pixmap = self.pil_to_pixmap(pil_image)
         self.original_image_label.setPixmap(pixmap.scaled(
             self.original_image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
     def show_processed_image(self, pil_image):
-        pixmap = self.pil_to_pixmap(pil_image)
-        self.processed_image_label.setPixmap(pixmap.scaled(
-            self.processed_image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        # Tam çözünürlüklü sonuç geldiğinde önizleme, canlı ayar görünümü ve nesne çizimleri bırakılır
+        self.preview_func = None
+        self.live_active = False
+        self.regions = None
+        self.display_image = pil_image
+        self.render_processed()
+
+    def show_preview(self, func, color=False):
+        self.preview_func = func
+        self.preview_color = color
+        self.render_processed()
+        self.statusBar().showMessage("Önizleme gösteriliyor, tam çözünürlük hesaplanıyor...")
+
+    def render_processed(self):
+        # Yalnızca görünen bölge çizilir; önizlemede bölge etiket boyutundaki piramit
+        # seviyesinde işlenir
+        if self.live_active:
+            self.render_live_adjust(self.adjust_panel.mode, self.adjust_panel.value())
+            return
+        label = self.processed_image_label
+        pyramid = self.pyramid(self.preview_color) if self.preview_func is not None else None
+        if pyramid is not None:
+            base = pyramid.levels[0]
+            region = label.viewport(base.shape[1], base.shape[0])
+            array = pyramid.render(self.preview_func, region, label.width(), label.height())
+            pixmap = ImageBuffer(array).pixmap()
+        elif self.display_image is not None:
+            region = label.viewport(*self.display_image.size)
+            image = self.display_image if label.zoom == 1.0 else self.display_image.crop(region)
+            pixmap = self.pil_to_pixmap(image)
+            if self.regions is not None:
+                self.paint_regions(pixmap, region[:2])
+        else:
+            return
+        with self.telemetry.phase("ölçekleme"):
+            label.setPixmap(pixmap.scaled(label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
 
     def show_context_menu_processed(self, pos):
@@ -246,225 +532,472 @@ class ImageProcessor(QMainWindow):
 
 
     def save_processed_image(self):
-        path, _ = QFileDialog.getSaveFileName(self, "Görüntüyü Kaydet", "", "PNG Files (*.png);;JPG Files (*.jpg)")
-        if path and self.processed_image:
-            self.processed_image.save(path)
-
+        filters = "PNG Files (*.png);;JPG Files (*.jpg)"
+        if self.tiled_output:
+            filters += ";;NumPy (*.npy)"
+        path, _ = QFileDialog.getSaveFileName(self, "Görüntüyü Kaydet", "", filters)
+        if path and self.tiled_output and path.lower().endswith(".npy"):
+            self.track_save(path, self.writer.copy(self.tiled_output, path))
+        elif path and self.processed_image:
+            jpeg_quality = None
+            if path.lower().endswith((".jpg", ".jpeg")):
+                jpeg_quality, ok = QInputDialog.getInt(self, "JPEG Kalitesi", "1–95:", value=JPEG_QUALITY,
+                                                       min=1, max=95)
+                if not ok:
+                    return
+            self.track_save(path, self.writer.submit(self.processed_image, path, jpeg_quality=jpeg_quality))
+
+    def track_save(self, path, future):
+        # Kodlama ve yazma arka plan kuyruğunda; sonuç sinyalle GUI iş parçacığına döner
+        start = time.perf_counter()
+        future.add_done_callback(lambda done: self.save_finished.emit(
+            path, str(done.exception() or ""), time.perf_counter() - start))
+        self.statusBar().showMessage(f"Kaydediliyor: {os.path.basename(path)}")
+
+    def on_save_finished(self, path, error, elapsed):
+        if error:
+            self.statusBar().clearMessage()
+            QMessageBox.warning(self, "Hata", f"Kaydetme başarısız oldu: {error}")
+            return
+        self.telemetry.record("Kaydet", elapsed)
+        self.stats_panel.refresh(self.history.memory_usage(), self.results.summary()["bytes"])
+        self.statusBar().showMessage(f"Kaydedildi: {os.path.basename(path)} ({elapsed * 1000:.0f} ms)", 3000)
+
+
+    def run_operation(self, name, compute, on_result=None, op=None, step=None, base=None, key=None):
+        # compute iş parçacığında çalışır; sonuç GUI iş parçacığında işlenir.
+        # step: oturum kaydı için (adım adı, parametreler); yalnızca sonuç gelirse kaydedilir.
+        # base: op'un uygulandığı (tıklama anındaki) görüntü.
+        # key: aynı anahtarlı iş çalışıyorsa istek yok sayılır; yoksa çalışan işin yerini alır
+        on_result = on_result or (lambda out: self.push_result(out, op, step, base))
+        # Canlı ayar önizlemesi yalnızca kaydırıcı hareket ederken; başka bir işlem istenince
+        # görünüm yeniden işlenmiş görüntüye (ya da işlemin önizlemesine) döner
+        self.live_active = False
+
+        telemetry = self.telemetry
+
+        def tracked_compute():
+            with telemetry.operation(name), telemetry.profiled(name), telemetry.phase("hesaplama"), \
+                    track_copies(name):
+                return compute()
+
+        def tracked_result(out):
+            with telemetry.operation(name), telemetry.phase("sonuç"), track_copies(name):
+                on_result(out)
+
+        self.executor.submit(name, tracked_compute, tracked_result, key)
+
+    def push_result(self, out, op=None, step=None, base=None, tiled_output=None):
+        # tiled_output: sonuç karo modunda üretildiyse tam çözünürlüklü .npy yolu; diğer
+        # sonuçlar önceki karo çıktısını geçersiz kılar
+        self.tiled_output = tiled_output
+        previous = self.processed_image or self.original_image
+        if op is not None and base is not previous:
+            # Tıklamadan sonra başka bir sonuç geldi: op kaydı bu duruma uymaz, piksel farkı tutulur
+            op = None
+        with self.telemetry.phase("gösterim"):
+            self.show_processed_image(out)
+        with self.telemetry.phase("geçmiş"):
+            self.history.push(previous, out, op)
+        self.processed_image = out
+        if step is not None:
+            self.session.record(*step, result=self.processed_buffer().array)
+        self.update_history_label()
+
+    def update_history_label(self):
+        usage = self.history.memory_usage() / (1024 * 1024)
+        stats = self.results.summary()
+        self.history_label.setText(
+            f"Geçmiş: {len(self.history.undo_stack)} adım, {usage:.1f} MB\n"
+            f"Önbellek: {stats['hits']} isabet, {stats['misses']} ıska, {stats['evictions']} atılan")
+
+    def run_filter(self, name, func, tiled=None, params=(), color=False, step=None):
+        # color=True: filtre tüm kanallara tek çağrıda uygulanır (H, W, C).
+        # Karolanabilen filtreler bellekteki büyük görüntüde satır bantlarıyla çok çekirdekte çalışır.
+        step = (step, params) if step else None
+        # Girdi orijinal görüntü: işlem + parametreler + görüntü sürümü aynı isteği tanımlar
+        key = (name, params, color, self.image_version)
+        if self.tiled_source is not None and tiled:
+            self.run_tiled_filter(name, tiled, step, key)
+        elif self.original_image:
+            if tiled in PARALLEL_FILTERS:
+                func = partial(parallel_filter, tiled)
+            source = self.source_array(color)
+            if source.shape[0] * source.shape[1] > PREVIEW_PIXEL_LIMIT and self.pyramid(color) is not None:
+                self.show_preview(lambda block: func(block, *params), color)
+            telemetry = self.telemetry
+
+            def compute():
+                with telemetry.phase("filtre"):
+                    result = self.results.call(name, func, source, *params)
+                with telemetry.phase("dönüştürme"):
+                    return Image.fromarray(result)
+
+            self.run_operation(name, compute, step=step, key=key)
+
+    def run_cached(self, name, func, *args):
+        return Image.fromarray(self.results.call(name, func, *args))
+
+    def run_tiled_filter(self, name, tiled, step=None, key=None):
+        # Tam çözünürlüklü sonuç diske yazılır, arayüzde önizlemesi gösterilir
+        source, output = self.tiled_source, self.tiled_output_path()
+
+        def compute():
+            result = apply_tiled_filter(source, tiled, output=output)
+            return Image.fromarray(overview(result))
+
+        self.run_operation(name, compute, lambda out: self.push_result(out, step=step, tiled_output=output), key=key)
+
+    def on_operation_started(self, name):
+        self.statusBar().showMessage(f"İşleniyor: {name}")
+
+    def on_operation_finished(self, name, elapsed):
+        copied_bytes = take_copy_stats(name)
+        self.telemetry.record(name, elapsed, copied_bytes)
+        self.stats_panel.refresh(self.history.memory_usage(), self.results.summary()["bytes"])
+        self.statusBar().showMessage(f"{name}: {elapsed * 1000:.0f} ms, {copied_bytes / (1024 * 1024):.1f} MB kopya",
+                                     3000)
+
+    def on_operation_failed(self, name, message):
+        self.statusBar().clearMessage()
+        if self.loading:
+            self.set_loading(False)
+        self.drop_preview()
+        QMessageBox.warning(self, "Hata", f"{name} başarısız oldu: {message}")
+
+    def drop_preview(self):
+        # İptal ya da hata: önizleme yerine son kesin sonuç gösterilir
+        if self.preview_func is not None:
+            self.preview_func = None
+            if self.display_image is not None:
+                self.render_processed()
+            else:
+                self.processed_image_label.clear()
+
+    def on_busy_changed(self, busy):
+        self.progress_bar.setVisible(busy)
 
     def apply_mean(self):
-        if self.original_image:
-            gray = self.original_image.convert("L")
-            result = apply_mean_filter(np.array(gray))
-            img = Image.fromarray(result)
-            self.show_processed_image(img)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = img
+        self.run_filter("Ortalama Filtresi", apply_mean_filter, tiled="mean", color=True, step="mean")
 
     def apply_median(self):
-        if self.original_image:
-            gray = self.original_image.convert("L")
-            result = apply_median_filter(np.array(gray))
-            img = Image.fromarray(result)
-            self.show_processed_image(img)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = img
+        self.run_filter("Ortanca Filtresi", apply_median_filter, tiled="median", color=True, step="median")
 
     def apply_edge(self):
-        if self.original_image:
-            gray = self.original_image.convert("L")
-            result = apply_edge_filter(np.array(gray))
-            img = Image.fromarray(result)
-            self.show_processed_image(img)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = img
+        self.run_filter("Kenar Tespiti", apply_edge_filter, tiled="edge", step="edge")
 
     def show_histogram(self):
         if not self.original_image:
             return
-       
-        gray = self.original_image.convert("L")
-        histogram = calculate_histogram(np.array(gray))
-        plot_histogram(histogram)
+
+        plot_histogram(self.gray_histogram())
 
     def equalize_histogram(self):
         if not self.original_image:
             return
-        
-        gray = self.original_image.convert("L")
-        result = histogram_equalization(np.array(gray))
-        out = Image.fromarray(result)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+
+        # Renkli görüntüde parlaklık (Y) histogramıyla eşitlenir, renkler korunur
+        image, histogram = self.source_array(color=True), self.gray_histogram()
+        self.run_operation("Histogram Eşitleme",
+                           lambda: self.run_cached("equalize", histogram_equalization, image, histogram),
+                           step=("equalize", ()))
 
     def stretch_contrast(self):
         if not self.original_image:
             return
 
-        gray = self.original_image.convert("L")
-        result = contrast_stretching(np.array(gray))
-        out = Image.fromarray(result)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+        image, histogram = self.source_array(color=True), self.gray_histogram()
+        self.run_operation("Kontrast Germe",
+                           lambda: self.run_cached("stretch", contrast_stretching, image, histogram),
+                           step=("stretch", ()))
 
     def apply_manual_threshold(self):
+        if self.original_image:
+            self.adjust_panel.start("threshold")
+
+    def apply_contrast(self):
+        if self.original_image:
+            self.adjust_panel.start("contrast")
+
+    def live_display_buffer(self, color):
+        # Görünen bölgenin etiket boyutundaki piramit seviyesinden bir kez kopyası; kaydırıcı
+        # hareketlerinde yalnızca LUT değişir. Renkli kontrastta LUT önceden ayrılmış çıktıya yazılır.
+        label = self.processed_image_label
+        pyramid = self.pyramid(color)
+        if pyramid is None:
+            # Piramit henüz kurulmadı: yalnızca tam çözünürlük seviyesi (kopyasız)
+            source = self.source_array(color)
+            pyramid = ImagePyramid(source, min_size=max(source.shape[:2]))
+        base = pyramid.levels[0]
+        region = label.viewport(base.shape[1], base.shape[0])
+        key = (color, region, label.width(), label.height(), self.image_version, len(pyramid.levels))
+        if self.live_buffer is None or self.live_buffer[0] != key:
+            array = pyramid.render(lambda block: block, region, label.width(), label.height(), halo=0)
+            source = ImageBuffer(np.ascontiguousarray(array))
+            output = ImageBuffer(np.empty_like(source.array)) if color else None
+            self.live_buffer = (key, source, output)
+        return self.live_buffer[1], self.live_buffer[2]
+
+    def render_live_adjust(self, mode, value):
         if not self.original_image:
             return
+        start = time.perf_counter()
+        self.live_active = True
+        color = mode == "contrast" and not self.original_buffer().is_gray
+        source, output = self.live_display_buffer(color)
+        lut = threshold_lut(value) if mode == "threshold" else contrast_lut(value / 100)
+        if output is None:
+            image = source.lut_qimage(lut)
+        else:
+            np.take(lut, source.array, out=output.array)
+            image = output.qimage()
+        label = self.processed_image_label
+        label.setPixmap(QPixmap.fromImage(image).scaled(label.size(), Qt.KeepAspectRatio, Qt.FastTransformation))
+        elapsed = (time.perf_counter() - start) * 1000
+        if mode == "threshold":
+            # Ön plan oranı tam çözünürlüklü histogramdan (bir kez hesaplanır)
+            histogram = self.gray_histogram()
+            share = histogram[value + 1:].sum() / max(histogram.sum(), 1) * 100
+            self.adjust_panel.set_info(f"Ön plan: %{share:.1f}\nGüncelleme: {elapsed:.1f} ms")
+        else:
+            self.adjust_panel.set_info(f"Güncelleme: {elapsed:.1f} ms")
 
-        gray = self.original_image.convert("L")
-        value, ok = QInputDialog.getInt(self, "Eşik Değeri", "0–255:", min=0, max=255)
-        if ok:
-            binary = manual_threshold(np.array(gray), value)
-            out = Image.fromarray(binary)
-            self.show_processed_image(out)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = out
+    def commit_live_adjust(self, mode, value):
+        # Tam çözünürlüklü sonuç ve tek geçmiş kaydı yalnızca kaydırıcı bırakılınca
+        if not self.original_image:
+            return
+        self.live_active = False
+        if mode == "threshold":
+            self.run_filter("Manuel Eşikleme", manual_threshold, params=(value,), step="threshold")
+        else:
+            self.run_filter("Kontrast Ayarı", adjust_contrast, params=(value / 100,), color=True,
+                            step="contrast")
+
+    def on_adjust_visibility(self, visible):
+        if not visible and self.live_active:
+            self.live_active = False
+            self.live_buffer = None
+            if self.display_image is None and self.preview_func is None:
+                self.processed_image_label.clear()
+            else:
+                self.render_processed()
 
     def apply_otsu(self):
         if not self.original_image:
             return
 
-        gray = self.original_image.convert("L")
-        binary = otsu_threshold(np.array(gray))
-        out = Image.fromarray(binary)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+        gray, histogram = self.gray_array(), self.gray_histogram()
+        self.run_operation("Otsu Eşikleme", lambda: self.run_cached("otsu", otsu_threshold, gray, histogram),
+                           step=("otsu", ()))
 
     def apply_kapur(self):
         if not self.original_image:
             return
-        
-        gray = self.original_image.convert("L")
-        binary = kapur_threshold(np.array(gray))
-        out = Image.fromarray(binary)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+
+        gray, histogram = self.gray_array(), self.gray_histogram()
+        self.run_operation("Kapur Eşikleme", lambda: self.run_cached("kapur", kapur_threshold, gray, histogram),
+                           step=("kapur", ()))
 
     def apply_dilation(self):
-        if not self.original_image:
-            return
-        
-        binary = np.array(self.original_image.convert("L"))
-        result = dilation(binary)
-        out = Image.fromarray(result)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+        self.run_filter("Dilation", dilation, tiled="dilation", step="dilate")
 
     def apply_erosion(self):
-        if not self.original_image:
-            return
-        
-        binary = np.array(self.original_image.convert("L"))
-        result = erosion(binary)
-        out = Image.fromarray(result)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+        self.run_filter("Erosion", erosion, tiled="erosion", step="erode")
 
     def show_centroid(self):
         if self.processed_image:
-            binary = np.array(self.processed_image.convert("L"))
-            if not np.array_equal(np.unique(binary), [0, 255]):
-                QMessageBox.warning(self, "Uyarı", "İkili görüntü gereklidir.")
+            binary = self.binary_input()
+            if binary is None:
                 return
             result_img = self.processed_image.convert("RGB")
-            centroid = compute_centroid(binary)
-            if centroid:
-                img = result_img.copy()
-                pixmap = QPixmap.fromImage(self.pil_to_pixmap(img).toImage())
-                painter = QPainter()
-                painter.begin(pixmap)
-                pen = QPen(Qt.red)
-                pen.setWidth(6)
-                painter.setPen(pen)
-                painter.drawPoint(*centroid)
-                painter.end()
-                self.processed_image_label.setPixmap(pixmap.scaled(self.processed_image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                self.processed_image = img
+            self.run_operation("Ağırlık Merkezi", lambda: (compute_centroid(binary), find_regions(binary)),
+                               lambda out: self.draw_centroid(result_img, *out))
+
+    def draw_centroid(self, result_img, centroid, regions):
+        # Çizimler görüntüye yazılmaz; render_processed her yakınlaştırma/kaydırmada
+        # self.regions'tan yeniden çizer. RGB kopya geçmişe normal bir sonuç olarak girer.
+        if centroid:
+            self.push_result(result_img.copy(), step=("centroid", ()))
+            self.regions, self.centroid = regions, centroid
+            self.render_processed()
+
+    def paint_regions(self, pixmap, origin):
+        # Nesne başına kutu, merkez ve ana eksen; tüm görüntünün merkezi büyük kırmızı nokta.
+        # origin: görünen bölgenin sol üst köşesi (görüntü koordinatı)
+        regions = self.regions
+        width = max(1, min(self.display_image.size) // 400)
+        painter = QPainter()
+        painter.begin(pixmap)
+        painter.translate(-origin[0], -origin[1])
+        painter.setPen(QPen(Qt.green, width))
+        for x0, y0, x1, y1 in zip(*(regions[k].tolist() for k in ("x0", "y0", "x1", "y1"))):
+            painter.drawRect(QRectF(x0, y0, x1 - x0 - 1, y1 - y0 - 1))
+        angle = np.radians(regions["orientation"])
+        half = regions["major_axis"] / 2
+        centers = list(zip(regions["centroid_x"].tolist(), regions["centroid_y"].tolist()))
+        painter.setPen(QPen(Qt.yellow, width))
+        for (x, y), ex, ey in zip(centers, (half * np.cos(angle)).tolist(), (-half * np.sin(angle)).tolist()):
+            painter.drawLine(QPointF(x - ex, y - ey), QPointF(x + ex, y + ey))
+        painter.setPen(QPen(Qt.red, 3 * width))
+        for x, y in centers:
+            painter.drawPoint(QPointF(x, y))
+        pen = QPen(Qt.red)
+        pen.setWidth(6)
+        painter.setPen(pen)
+        painter.drawPoint(*self.centroid)
+        painter.resetTransform()
+        painter.drawText(10, 20, f"{len(regions)} nesne")
+        painter.end()
 
     def apply_skeleton(self):
         if self.processed_image:
-            binary = np.array(self.processed_image.convert("L"))
-            if not np.array_equal(np.unique(binary), [0, 255]):
-                QMessageBox.warning(self, "Uyarı", "İkili görüntü gereklidir.")
+            binary = self.binary_input()
+            if binary is None:
                 return
-            result = skeletonize(binary)
-            out = Image.fromarray(result)
-            self.show_processed_image(out)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = out
+            self.run_operation("İskelet Çıkarma", lambda: self.run_cached("skeleton", skeletonize, binary),
+                               step=("skeletonize", ()))
+
+    def apply_thinning(self, method):
+        if self.processed_image:
+            binary = self.binary_input()
+            if binary is None:
+                return
+            self.run_operation(f"İnceltme ({method})", lambda: self.run_cached("thin", thin, binary, method),
+                               step=("thin", (method,)))
+
+    def apply_medial_axis(self):
+        if self.processed_image:
+            binary = self.binary_input()
+            if binary is None:
+                return
+            self.run_operation("Medial Eksen", lambda: self.run_cached("medial_axis", medial_axis, binary),
+                               step=("medial_axis", ()))
+
+    def apply_distance_transform(self):
+        if self.processed_image:
+            binary = self.binary_input()
+            if binary is None:
+                return
+            self.run_operation("Uzaklık Dönüşümü", lambda: self.run_cached("distance", distance_map, binary),
+                               step=("distance", ()))
 
     def apply_smoothing(self):
-        if not self.original_image:
-            return
-          
-        gray = self.original_image.convert("L")
-        result = apply_smoothing_filter(np.array(gray))
-        out = Image.fromarray(result)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+        self.run_filter("Yumuşatma Filtresi", apply_smoothing_filter, tiled="smoothing", color=True, step="smooth")
 
     def apply_sharpening(self):
-        if not self.original_image:
-            return
-        
-        gray = self.original_image.convert("L")
-        result = apply_sharpen_filter(np.array(gray))
-        out = Image.fromarray(result)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+        self.run_filter("Keskinleştirme Filtresi", apply_sharpen_filter, tiled="sharpen", color=True,
+                        step="sharpen")
+
+    def apply_gaussian(self):
+        self.run_filter("Gauss Filtresi", apply_gaussian_filter, tiled="gaussian", color=True, step="gaussian")
+
+    def apply_sobel(self):
+        self.run_filter("Sobel Kenar", apply_sobel_filter, tiled="sobel", step="sobel")
+
+    def apply_prewitt(self):
+        self.run_filter("Prewitt Kenar", apply_prewitt_filter, tiled="prewitt", step="prewitt")
+
+    def apply_scharr(self):
+        self.run_filter("Scharr Kenar", apply_scharr_filter, tiled="scharr", step="scharr")
 
     def apply_rotation(self):
         img = self.processed_image or self.original_image
         if img:
-            out = rotate_image(img, angle_deg=90)
-            self.show_processed_image(out)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = out
+            # Saat yönünde 90°: yeniden örneklemesiz transpose; geçmişte piksel tutulmaz
+            self.run_operation("90° Döndürme", lambda: rotate_image(img, angle_deg=90), op="rotate_270", base=img,
+                               step=("rotate", ()))
 
     def apply_shearing(self):
         if not self.original_image:
             return
-        
-        out = shear_image(self.original_image, shear_x=0.2, shear_y=0)
-        self.show_processed_image(out)
-        self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-        self.processed_image = out
+
+        img = self.original_image
+        # Bikübik PIL çarpıtması tek çağrı: bantlı sonuç makineye göre değişirdi
+        self.run_operation("Shearing", lambda: shear_image(img, shear_x=0.2, shear_y=0), step=("shear", ()))
 
     def apply_flip_horizontal(self):
         img = self.processed_image or self.original_image
         if img:
-            out = flip_horizontal(img)
-            self.show_processed_image(out)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = out
+            self.run_operation("Yatay Aynalama", lambda: flip_horizontal(img), op="flip_horizontal", base=img,
+                               step=("flip_h", ()))
 
     def apply_flip_vertical(self):
         img = self.processed_image or self.original_image
         if img:
-            out = flip_vertical(img)
-            self.show_processed_image(out)
-            self.history_stack.append(self.processed_image.copy() if self.processed_image else self.original_image.copy())
-            self.processed_image = out
+            self.run_operation("Dikey Aynalama", lambda: flip_vertical(img), op="flip_vertical", base=img,
+                               step=("flip_v", ()))
 
     def undo_last_operation(self):
-        if self.history_stack:
-            last_image = self.history_stack.pop()
+        if self.loading:
+            return
+        self.executor.cancel()
+        self.drop_preview()
+        if self.history.can_undo():
+            last_image = self.history.undo()
             self.processed_image = last_image
+            self.tiled_output = None  # geçmişte karo çıktısı tutulmaz
+            self.session.record("undo")
             self.show_processed_image(last_image)
+            self.update_history_label()
         else:
             QMessageBox.information(self, "Geri Al", "Geri alınacak işlem yok.")
 
+    def redo_last_operation(self):
+        if self.loading:
+            return
+        self.executor.cancel()
+        self.drop_preview()
+        if self.history.can_redo():
+            next_image = self.history.redo()
+            self.processed_image = next_image
+            self.tiled_output = None  # geçmişte karo çıktısı tutulmaz
+            self.session.record("redo")
+            self.show_processed_image(next_image)
+            self.update_history_label()
+        else:
+            QMessageBox.information(self, "İleri Al", "İleri alınacak işlem yok.")
+
     def commit_changes(self):
-        if self.processed_image:
+        if self.processed_image and not self.loading:
             self.original_image = self.processed_image.copy()
-            self.show_flash_message("Değişiklik kaydedildi.")
+            message = "Değişiklik kaydedildi."
+            if self.tiled_output:
+                self.tiled_source = np.load(self.tiled_output, mmap_mode='r')
+            elif self.tiled_source is not None:
+                # Karo dışı sonuç (döndürme, aynalama, önizleme üzerinde eşitleme...) tam
+                # çözünürlüklü kaynağa yansımaz; eski kaynakla devam etmek değişikliği kaybederdi.
+                # Bundan sonra işlemler kaydedilen görüntü üzerinde çalışır.
+                self.tiled_source = None
+                message = "Değişiklik önizleme çözünürlüğünde kaydedildi."
+            self.bump_image_version()
+            self.build_pyramids()
+            self.session.record("commit")
+            self.show_flash_message(message)
+
+    def save_session(self):
+        # Yeniden oynatma: python session.py oturum.json girdi/ -o cikti/
+        if not self.session.steps:
+            QMessageBox.information(self, "Oturumu Kaydet", "Kaydedilecek adım yok.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Oturumu Kaydet", "oturum.json",
+                                              "JSON (*.json);;YAML (*.yaml *.yml)")
+        if not path:
+            return
+        try:
+            self.session.save(path)
+        except (OSError, ValueError) as exc:
+            QMessageBox.warning(self, "Hata", f"Oturum kaydedilemedi: {exc}")
+            return
+        self.show_flash_message("Oturum kaydedildi.")
+
+    def closeEvent(self, event):
+        self.executor.shutdown()
+        self.pyramid_executor.shutdown()
+        self.writer.close()
+        if self.tiled_dir is not None:
+            self.tiled_source = None
+            self.tiled_dir.cleanup()
+        super().closeEvent(event)
 
     def show_flash_message(self, message, duration=2000): 
         self.flash_label.setText(message)
@@ -0,0 +1,317 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+import numpy as np
+from PIL import Image
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from batch import collect_inputs, output_path
+from filters.cache import ResultCache, content_hash, make_key
+from filters.convolution import (apply_mean_filter, apply_median_filter, apply_edge_filter,
+                                 apply_smoothing_filter, apply_sharpen_filter, apply_gaussian_filter,
+                                 apply_sobel_filter, apply_prewitt_filter, apply_scharr_filter)
+from filters.dtypes import to_gray
+from filters.geometry import compute_centroid, flip_horizontal, flip_vertical, rotate_image, shear_matrix, skeletonize
+from filters.histogram import histogram_equalization, contrast_stretching, adjust_contrast
+from filters.morphology import dilation, erosion
+from filters.parallel import parallel_warp
+from filters.regions import find_regions
+from filters.thinning import thin, medial_axis, distance_map
+from filters.thresholding import manual_threshold, otsu_threshold, kapur_threshold
+from imagefile import PREFETCH_DEPTH, AsyncWriter, open_image, prefetch
+
+# Arayüz oturumu kaydı ve başsız yeniden oynatma. ImageProcessor her tamamlanan işlemi
+# (adım adı, parametreler, sonucun içerik özeti), geri al / ileri al ve "Değişikliği Kaydet"
+# adımlarını sırayla kaydeder; kayıt JSON (PyYAML kuruluysa YAML) olarak saklanır.
+# Yeniden oynatmada arayüzün durum modeli aynen izlenir: filtreler orijinal görüntüye,
+# iskelet/inceltme işlenmiş ikili görüntüye, döndürme/aynalama işlenmiş (yoksa orijinal)
+# görüntüye uygulanır; geri al / ileri al işlenmiş görüntüyü önceki durumlara döndürür.
+# Her adım sonuç önbelleğinden geçer (anahtar: adım + parametreler + girdi içerik özeti);
+# --cache-dir ile önceki çalıştırmalarda hesaplanmış adımlar yeniden hesaplanmaz.
+# Girdi, kaydın alındığı görüntüyle aynıysa her adımın sonucu kayıttaki özetle karşılaştırılır.
+# Örnek:
+#   python session.py oturum.json girdi/ -o cikti/ --cache-dir onbellek/
+
+SESSION_VERSION = 1
+HISTORY_OPS = ("undo", "redo", "commit")
+
+
+def _pil_step(func, **kwargs):
+    def step(image_array):
+        return np.asarray(func(Image.fromarray(image_array), **kwargs))
+    return step
+
+
+def _shear(image_array):
+    # Arayüzdeki shear ile aynı dönüşüm (uint8 girdide tek PIL çağrısı, makineden bağımsız)
+    return parallel_warp(image_array, shear_matrix(shear_x=0.2, shear_y=0), order=3)
+
+
+def _centroid(binary):
+    return compute_centroid(binary), find_regions(binary)
+
+
+# ad: (fonksiyon, girdi). Girdi: "color" orijinal görüntü (renkliyse RGB), "gray" orijinalin
+# gri düzlemi, "binary" işlenmiş görüntünün gri düzlemi (ikili olmalı), "current" işlenmiş
+# görüntü (yoksa orijinal). Parametreler kayıttaki "args" ile fonksiyona aynen geçer.
+SESSION_STEPS = {
+    "mean": (apply_mean_filter, "color"),
+    "median": (apply_median_filter, "color"),
+    "edge": (apply_edge_filter, "gray"),
+    "smooth": (apply_smoothing_filter, "color"),
+    "sharpen": (apply_sharpen_filter, "color"),
+    "gaussian": (apply_gaussian_filter, "color"),
+    "sobel": (apply_sobel_filter, "gray"),
+    "prewitt": (apply_prewitt_filter, "gray"),
+    "scharr": (apply_scharr_filter, "gray"),
+    "equalize": (histogram_equalization, "color"),
+    "stretch": (contrast_stretching, "color"),
+    "contrast": (adjust_contrast, "color"),
+    "threshold": (manual_threshold, "gray"),
+    "otsu": (otsu_threshold, "gray"),
+    "kapur": (kapur_threshold, "gray"),
+    "dilate": (dilation, "gray"),
+    "erode": (erosion, "gray"),
+    "skeletonize": (skeletonize, "binary"),
+    "thin": (thin, "binary"),
+    "medial_axis": (medial_axis, "binary"),
+    "distance": (distance_map, "binary"),
+    "rotate": (_pil_step(rotate_image, angle_deg=90), "current"),
+    "shear": (_shear, "color"),
+    "flip_h": (_pil_step(flip_horizontal), "current"),
+    "flip_v": (_pil_step(flip_vertical), "current"),
+    # Görüntü üretmez: arayüz işlenmiş görüntüyü RGB'ye çevirir, geçmişe yazmaz
+    "centroid": (_centroid, "binary"),
+}
+
+
+def _is_yaml(path):
+    return path.lower().endswith((".yaml", ".yml"))
+
+
+class SessionLog:
+    def __init__(self):
+        self.source = None
+        self.steps = []
+
+    def start(self, name, image_array):
+        # Yeni görüntü: önceki adımlar atılır
+        self.source = {"name": name, "hash": content_hash(image_array), "shape": list(image_array.shape)}
+        self.steps = []
+
+    def record(self, op, args=(), result=None):
+        if op not in SESSION_STEPS and op not in HISTORY_OPS:
+            raise ValueError(f"Bilinmeyen adım: {op}")
+        entry = {"op": op}
+        if args:
+            entry["args"] = list(args)
+        if result is not None:
+            entry["result"] = content_hash(result)
+        self.steps.append(entry)
+
+    def to_dict(self):
+        return {"version": SESSION_VERSION, "source": self.source, "steps": self.steps}
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != SESSION_VERSION:
+            raise ValueError(f"Desteklenmeyen oturum sürümü: {data.get('version')}")
+        log = cls()
+        log.source = data.get("source")
+        for entry in data.get("steps", []):
+            if entry["op"] not in SESSION_STEPS and entry["op"] not in HISTORY_OPS:
+                raise ValueError(f"Bilinmeyen adım: {entry['op']}")
+            log.steps.append(dict(entry))
+        return log
+
+    def save(self, path):
+        if _is_yaml(path) and yaml is None:
+            raise ValueError("YAML için PyYAML gerekli (pip install pyyaml)")
+        with open(path, "w", encoding="utf-8") as handle:
+            if _is_yaml(path):
+                yaml.safe_dump(self.to_dict(), handle, allow_unicode=True, sort_keys=False)
+            else:
+                json.dump(self.to_dict(), handle, ensure_ascii=False, indent=1)
+
+    @classmethod
+    def load(cls, path):
+        if _is_yaml(path) and yaml is None:
+            raise ValueError("YAML için PyYAML gerekli (pip install pyyaml)")
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_dict(yaml.safe_load(handle) if _is_yaml(path) else json.load(handle))
+
+
+def step_label(entry):
+    args = entry.get("args")
+    return entry["op"] + (":" + ",".join(str(a) for a in args) if args else "")
+
+
+def _step_input(kind, original, processed, planes):
+    # planes: orijinalin gri düzlemi, orijinal değişene kadar (arayüzdeki gibi) bir kez
+    if kind == "color":
+        return original
+    if kind == "gray":
+        if planes.get("original") is not original:
+            planes.update(original=original, gray=to_gray(original))
+        return planes["gray"]
+    if kind == "current":
+        return original if processed is None else processed
+    if processed is None:
+        raise ValueError("İşlenmiş görüntü yok")
+    binary = to_gray(processed)
+    histogram = np.bincount(binary.ravel(), minlength=256)
+    if not (histogram[0] and histogram[255] and histogram[0] + histogram[255] == binary.size):
+        raise ValueError("İkili görüntü gereklidir")
+    return binary
+
+
+def _cached(cache, op, func, source, args):
+    if cache is None:
+        return func(source, *args), False
+    key = make_key(op, (source,) + args, {})
+    found, result = cache.get(key)
+    if not found:
+        result = func(source, *args)
+        cache.put(key, result)
+    return result, found
+
+
+def replay_session(log, image_array, cache=None):
+    # (son görüntü, adım satırları); satır: adım, süre (s), önbellekten mi, kayıtla aynı mı
+    # (None: girdi kayıttaki görüntü değil, karşılaştırılmadı)
+    verify = log.source is not None and content_hash(image_array) == log.source.get("hash")
+    # current: geçmişin bildiği son durum (EditHistory.current); ağırlık merkezi işlenmiş
+    # görüntüyü geçmişe yazmadan değiştirdiğinden processed ondan ayrılabilir
+    original, processed, current = image_array, None, None
+    undo_stack, redo_stack = [], []
+    planes, rows = {}, []
+    for entry in log.steps:
+        op, args = entry["op"], tuple(entry.get("args", ()))
+        start = time.perf_counter()
+        cached, result = False, None
+        if op == "undo" or op == "redo":
+            source, target = (undo_stack, redo_stack) if op == "undo" else (redo_stack, undo_stack)
+            if source:
+                target.append(current)
+                processed = current = source.pop()
+        elif op == "commit":
+            if processed is not None:
+                original = processed
+        elif op == "centroid":
+            func, kind = SESSION_STEPS[op]
+            (centroid, _), cached = _cached(cache, op, func, _step_input(kind, original, processed, planes), args)
+            if centroid and processed.ndim == 2:
+                processed = np.repeat(processed[..., None], 3, axis=2)
+            result = processed
+        else:
+            func, kind = SESSION_STEPS[op]
+            result, cached = _cached(cache, op, func, _step_input(kind, original, processed, planes), args)
+            undo_stack.append(original if processed is None else processed)
+            redo_stack = []
+            processed = current = result
+        seconds = time.perf_counter() - start
+        match = None
+        if verify and "result" in entry and result is not None:
+            match = content_hash(result) == entry["result"]
+        rows.append({"step": step_label(entry), "op": op, "seconds": seconds, "cached": cached, "match": match})
+    return (original if processed is None else processed), rows
+
+
+def replay_folder(log, paths, output_dir, cache_dir=None, extension=".png", verbose=False):
+    # Girdiler önden okunur, sonuçlar arka planda yazılır; adım süreleri okuma/yazmadan ayrı
+    os.makedirs(output_dir, exist_ok=True)
+    cache = ResultCache(spill_dir=cache_dir)
+    writer = AsyncWriter(max_pending=PREFETCH_DEPTH)
+    totals = {"images": 0, "errors": [], "mismatches": [], "rows": []}
+    start = time.perf_counter()
+    writes = []
+    try:
+        for path, loading in prefetch(paths, lambda p: np.asarray(open_image(p))):
+            try:
+                result, rows = replay_session(log, loading.result(), cache)
+            except Exception as exc:
+                totals["errors"].append(f"{path}: {exc}")
+                continue
+            totals["images"] += 1
+            totals["rows"].extend(rows)
+            totals["mismatches"].extend(f"{path}: {row['step']}" for row in rows if row["match"] is False)
+            if verbose:
+                print(f"{os.path.basename(path)}: " + ", ".join(
+                    f"{row['step']} {row['seconds'] * 1000:.1f} ms{' (önbellek)' if row['cached'] else ''}"
+                    for row in rows))
+            target = output_path(path, output_dir, extension)
+            writes.append((target, writer.submit(result, target)))
+    finally:
+        writer.close()
+    for target, future in writes:
+        try:
+            future.result()
+        except Exception as exc:
+            totals["errors"].append(f"{target}: {exc}")
+    if cache_dir:
+        cache.flush()
+    totals["seconds"] = time.perf_counter() - start
+    return totals
+
+
+def step_timings(rows):
+    # Adım başına toplam süre, en pahalıdan ucuza
+    table = defaultdict(lambda: {"count": 0, "cached": 0, "seconds": 0.0})
+    for row in rows:
+        item = table[row["step"]]
+        item["count"] += 1
+        item["cached"] += row["cached"]
+        item["seconds"] += row["seconds"]
+    return sorted(table.items(), key=lambda item: -item[1]["seconds"])
+
+
+def format_report(totals):
+    timings = step_timings(totals["rows"])
+    spent = max(sum(item["seconds"] for _, item in timings), 1e-9)
+    lines = [f"{totals['images']} görüntü, {totals['seconds']:.2f} s (adımlar {spent:.2f} s)",
+             f"{'adım':>16} {'çağrı':>6} {'önbellek':>9} {'toplam (ms)':>12} {'ort. (ms)':>10} {'pay':>6}"]
+    for label, item in timings:
+        lines.append(f"{label:>16} {item['count']:>6} {item['cached']:>9} {item['seconds'] * 1000:>12.1f} "
+                     f"{item['seconds'] * 1000 / item['count']:>10.2f} {item['seconds'] / spent * 100:>5.1f}%")
+    if totals["mismatches"]:
+        lines.append(f"{len(totals['mismatches'])} adım kayıttaki sonuçtan farklı:")
+        lines.extend("  " + m for m in totals["mismatches"])
+    if totals["errors"]:
+        lines.append(f"{len(totals['errors'])} hata:")
+        lines.extend("  " + e for e in totals["errors"])
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kaydedilmiş arayüz oturumunu bir klasördeki görüntülere uygular.")
+    parser.add_argument("session", help="oturum kaydı (.json, .yaml)")
+    parser.add_argument("inputs", nargs="+", help="klasör veya glob deseni")
+    parser.add_argument("-o", "--output", required=True, help="çıktı klasörü")
+    parser.add_argument("--format", default="png", help="çıktı biçimi (png, jpg, bmp, npy...)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="sonuç önbelleği klasörü; yeniden çalıştırmalarda hesaplanmış adımlar atlanır")
+    parser.add_argument("-v", "--verbose", action="store_true", help="görüntü başına adım sürelerini yazdır")
+    args = parser.parse_args(argv)
+
+    try:
+        log = SessionLog.load(args.session)
+    except (OSError, ValueError, KeyError) as exc:
+        parser.error(str(exc))
+    paths = collect_inputs(args.inputs)
+    if not paths:
+        parser.error("Girdi görüntüsü bulunamadı")
+    totals = replay_folder(log, paths, args.output, args.cache_dir, "." + args.format.lstrip("."), args.verbose)
+    print(format_report(totals))
+    return 1 if totals["errors"] or totals["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (
+    QCheckBox, QComboBox, QDockWidget, QFileDialog, QHBoxLayout, QHeaderView, QLabel, QPushButton,
+    QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
+)
+
+# Yerleştirilebilir performans paneli: işlem başına gecikme istatistikleri, son
+# çalıştırmanın aşama dökümü (bellek ölçümü açıksa aşama başına ayrılan tepe bellek),
+# geçmiş belleği; iz dışa aktarma ve profil düğmeleri.
+
+COLUMNS = ("İşlem", "Sayı", "Son (ms)", "Ort. (ms)", "p95 (ms)", "Kopya (MB)", "Ayrılan (MB)",
+           "Aşamalar (ms / MB)")
+
+
+class StatsPanel(QDockWidget):
+    def __init__(self, telemetry, parent=None):
+        super().__init__("Performans", parent)
+        self.telemetry = telemetry
+        self.setObjectName("stats_panel")
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table.horizontalHeader().setStretchLastSection(True)
+
+        self.memory_label = QLabel("")
+        self.profile_label = QLabel("")
+        self.profile_label.setWordWrap(True)
+
+        self.export_button = QPushButton("İzi Dışa Aktar")
+        self.export_button.clicked.connect(self.export_trace)
+        self.clear_button = QPushButton("Sıfırla")
+        self.clear_button.clicked.connect(self.clear)
+        self.profile_choice = QComboBox()
+        self.profile_choice.setEditable(True)
+        self.profile_button = QPushButton("Sonrakini Profille")
+        self.profile_button.clicked.connect(self.arm_profile)
+        self.memory_check = QCheckBox("Bellek ölçümü (tracemalloc, yavaşlatır)")
+        self.memory_check.toggled.connect(self.telemetry.set_memory_tracking)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.export_button)
+        buttons.addWidget(self.clear_button)
+        profile_row = QHBoxLayout()
+        profile_row.addWidget(self.profile_choice, 1)
+        profile_row.addWidget(self.profile_button)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.table)
+        layout.addWidget(self.memory_label)
+        layout.addLayout(buttons)
+        layout.addLayout(profile_row)
+        layout.addWidget(self.memory_check)
+        layout.addWidget(self.profile_label)
+        content = QWidget()
+        content.setLayout(layout)
+        self.setWidget(content)
+
+    def refresh(self, history_bytes=0, cache_bytes=0):
+        rows = sorted(self.telemetry.summary(), key=lambda row: -row["mean"])
+        self.table.setRowCount(len(rows))
+        for index, row in enumerate(rows):
+            memory = row["phase_memory"]
+            phases = ", ".join(f"{name} {seconds * 1000:.1f}" +
+                               (f" / {memory[name] / (1024 * 1024):.1f}" if name in memory else "")
+                               for name, seconds in row["phases"].items())
+            allocated = row["allocated_bytes"]
+            cells = (row["operation"], str(row["count"]), f"{row['last'] * 1000:.1f}",
+                     f"{row['mean'] * 1000:.1f}", f"{row['p95'] * 1000:.1f}",
+                     f"{row['copied_bytes'] / (1024 * 1024):.1f}",
+                     "-" if allocated is None else f"{allocated / (1024 * 1024):.1f}", phases)
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                if 0 < column < len(cells) - 1:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(index, column, item)
+
+        known = {self.profile_choice.itemText(i) for i in range(self.profile_choice.count())}
+        for row in rows:
+            if row["operation"] not in known:
+                self.profile_choice.addItem(row["operation"])
+        self.memory_label.setText(f"Geçmiş belleği: {history_bytes / (1024 * 1024):.1f} MB, "
+                                  f"önbellek: {cache_bytes / (1024 * 1024):.1f} MB")
+        if self.telemetry.last_profile:
+            self.profile_label.setText(f"Son profil: {self.telemetry.last_profile}")
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "İzi Kaydet", "iz.json", "Chrome Trace (*.json)")
+        if path:
+            self.telemetry.export_chrome_trace(path)
+
+    def clear(self):
+        self.telemetry.clear()
+        self.table.setRowCount(0)
+
+    def arm_profile(self):
+        operation = self.profile_choice.currentText().strip()
+        if operation:
+            self.telemetry.profile_next(operation)
+            self.profile_label.setText(f"Bir sonraki '{operation}' çalıştırması profillenecek")
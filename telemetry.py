@@ -0,0 +1,201 @@
+import cProfile
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# İşlem telemetrisi. Her işlemin aşamaları (girdi hazırlama, filtre, dönüştürme, geçmiş,
+# gösterim) zamanlanır; işlem başına son / ortalama / p95 gecikme, kopyalanan bayt ve
+# son çalıştırmanın aşama süreleri tutulur. Olaylar Chrome trace-event JSON olarak
+# dışa aktarılır (chrome://tracing, Perfetto). tid olarak işletim sistemi iş parçacığı
+# kimliği yazılır; py-spy gibi dış örnekleyicilerin çıktısıyla eşleştirilebilir.
+# İstenirse seçilen işlemin bir sonraki çalıştırması cProfile ile .prof dosyasına kaydedilir.
+# Bellek ölçümü açıkken (tracemalloc, numpy dizileri dahil) her aşamanın başından bu yana
+# ayrılan tepe bellek de tutulur. tracemalloc süreç genelidir: aynı anda çalışan iş
+# parçacıklarının ayırmaları birbirine karışabilir, değerler üst sınır olarak okunmalı.
+
+HISTORY_LENGTH = 200
+MAX_EVENTS = 100_000
+GUI_OPERATION = "arayüz"
+
+
+class Telemetry:
+    def __init__(self, history_length=HISTORY_LENGTH, profile_dir=None):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.origin = time.perf_counter()
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.latencies = defaultdict(lambda: deque(maxlen=history_length))
+        self.phases = defaultdict(dict)
+        self.copied = defaultdict(int)
+        self.phase_memory = defaultdict(dict)
+        self.memory_tracking = False
+        self.started_tracing = False
+        self.memory_frames = []
+        self.thread_names = {}
+        self.profile_target = None
+        self.profile_dir = profile_dir or tempfile.gettempdir()
+        self.last_profile = None
+
+    def current_operation(self):
+        return getattr(self.local, "operation", None) or GUI_OPERATION
+
+    @contextmanager
+    def operation(self, name):
+        # Bu blokta açılan aşamalar name işlemine yazılır (iş parçacığına özel)
+        previous = getattr(self.local, "operation", None)
+        self.local.operation = name
+        try:
+            yield
+        finally:
+            self.local.operation = previous
+
+    @contextmanager
+    def phase(self, name, **args):
+        operation = self.current_operation()
+        frame = self.enter_memory_frame() if self.memory_tracking else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            if frame is not None:
+                args = dict(args, allocated_bytes=self.exit_memory_frame(frame))
+            self.add_event(name, operation, start, end, args)
+            with self.lock:
+                self.phases[operation][name] = end - start
+                if frame is not None:
+                    self.phase_memory[operation][name] = args["allocated_bytes"]
+                else:
+                    self.phase_memory[operation].pop(name, None)
+
+    def set_memory_tracking(self, enabled):
+        # tracemalloc Python ayırmalarını belirgin biçimde yavaşlatır; yalnızca istenince açılır
+        with self.lock:
+            self.memory_tracking = enabled
+            self.memory_frames = []
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        elif not enabled and self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def fold_peak(self):
+        # Son sıfırlamadan bu yana görülen tepe, açık tüm aşamalara işlenir (kilit altında);
+        # böylece iç içe aşamalar ve diğer iş parçacıkları tepe sıfırlamasında değer kaybetmez
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in self.memory_frames:
+            frame["peak"] = max(frame["peak"], peak)
+
+    def enter_memory_frame(self):
+        with self.lock:
+            if not tracemalloc.is_tracing():
+                return None
+            self.fold_peak()
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            frame = {"start": current, "peak": current}
+            self.memory_frames.append(frame)
+        return frame
+
+    def exit_memory_frame(self, frame):
+        with self.lock:
+            if tracemalloc.is_tracing():
+                self.fold_peak()
+            self.memory_frames = [f for f in self.memory_frames if f is not frame]
+        return max(frame["peak"] - frame["start"], 0)
+
+    def add_event(self, name, category, start, end, args=None):
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self.origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": thread.native_id,
+            "args": args or {},
+        }
+        with self.lock:
+            self.thread_names[thread.native_id] = thread.name
+            self.events.append(event)
+
+    def record(self, operation, latency, copied_bytes=0):
+        # İstekten sonucun ekrana gelmesine kadar geçen toplam süre
+        end = time.perf_counter()
+        self.add_event(operation, "işlem", end - latency, end, {"copied_bytes": copied_bytes})
+        with self.lock:
+            self.latencies[operation].append(latency)
+            self.copied[operation] += copied_bytes
+
+    def summary(self):
+        rows = []
+        with self.lock:
+            for operation, values in self.latencies.items():
+                samples = np.fromiter(values, dtype=np.float64)
+                rows.append({
+                    "operation": operation,
+                    "count": len(samples),
+                    "last": float(samples[-1]),
+                    "mean": float(samples.mean()),
+                    "p95": float(np.percentile(samples, 95)),
+                    "copied_bytes": self.copied[operation],
+                    "phases": dict(self.phases[operation]),
+                    "phase_memory": dict(self.phase_memory[operation]),
+                    # Son çalıştırmada aşamaların en büyük tepe ayırması; ölçülmediyse None
+                    "allocated_bytes": max(self.phase_memory[operation].values(), default=None),
+                })
+        return rows
+
+    def chrome_trace(self):
+        with self.lock:
+            events = list(self.events)
+            names = dict(self.thread_names)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                    for tid, name in names.items()]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.chrome_trace(), handle)
+
+    def clear(self):
+        with self.lock:
+            self.events.clear()
+            self.latencies.clear()
+            self.phases.clear()
+            self.copied.clear()
+            self.phase_memory.clear()
+
+    def profile_next(self, operation):
+        self.profile_target = operation
+
+    @contextmanager
+    def profiled(self, operation):
+        # Yalnızca hedeflenen işlemin bir sonraki çalıştırması, o iş parçacığında profillenir
+        with self.lock:
+            armed = self.profile_target == operation
+            if armed:
+                self.profile_target = None
+        if not armed:
+            yield
+            return
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            stem = re.sub(r"\W+", "_", operation).strip("_") or "islem"
+            path = os.path.join(self.profile_dir, f"profil_{stem}_{time.strftime('%Y%m%d_%H%M%S')}.prof")
+            profiler.dump_stats(path)
+            self.last_profile = path
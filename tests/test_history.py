@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from history import EditHistory
+
+
+def binary_image():
+    array = np.zeros((30, 20), dtype=np.uint8)
+    array[5:12, 6:15] = 255
+    array[18:26, 2:10] = 255
+    return Image.fromarray(array)
+
+
+def test_unrecorded_change_keeps_undo_chain():
+    # İki kayıt arasında geçmişe girmeyen bir RGB kopya: geri alma zinciri bozulmamalı
+    history = EditHistory()
+    original = binary_image()
+    dilated = Image.fromarray(255 - np.asarray(original))
+    history.push(original, dilated)
+    drawn = dilated.convert("RGB")
+    eroded = original.copy()
+    history.push(drawn, eroded)
+
+    assert history.undo().tobytes() == drawn.tobytes()
+    assert history.undo().tobytes() == dilated.tobytes()
+    assert history.undo().tobytes() == original.tobytes()
+    assert history.redo().tobytes() == dilated.tobytes()
+
+
+def test_centroid_then_undo():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    import main
+    from filters.geometry import compute_centroid
+    from filters.morphology import dilation, erosion
+    from filters.regions import find_regions
+    from filters.thresholding import otsu_threshold
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = main.ImageProcessor()
+    try:
+        original = binary_image()
+        window.original_image = original
+        window.bump_image_version()
+        source = np.asarray(original)
+        thresholded = Image.fromarray(otsu_threshold(source))
+        dilated = Image.fromarray(dilation(source))
+        window.push_result(thresholded)
+        window.push_result(dilated)
+        binary = window.binary_input()
+        window.draw_centroid(window.processed_image.convert("RGB"), compute_centroid(binary), find_regions(binary))
+        drawn = window.processed_image
+        window.push_result(Image.fromarray(erosion(source)))
+
+        expected = [drawn, dilated, thresholded]
+        for image in expected:
+            window.undo_last_operation()
+            assert window.processed_image.mode == image.mode
+            assert window.processed_image.tobytes() == image.tobytes()
+    finally:
+        window.executor.shutdown()
+        window.writer.close()
+        app.processEvents()
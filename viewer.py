@@ -0,0 +1,57 @@
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QLabel
+
+# Fare tekerleğiyle yakınlaştırılan, sürüklenerek kaydırılan görüntü etiketi.
+# Görünen bölgeyi görüntü koordinatlarında bildirir; çizim ImageProcessor'dadır.
+
+MAX_ZOOM = 16.0
+ZOOM_STEP = 1.25
+
+
+class ZoomableLabel(QLabel):
+    viewport_changed = pyqtSignal()
+
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self.zoom = 1.0
+        self.center = (0.5, 0.5)
+        self.drag_start = None
+
+    def reset_view(self):
+        self.zoom = 1.0
+        self.center = (0.5, 0.5)
+
+    def viewport(self, image_width, image_height):
+        # (x0, y0, x1, y1); zoom == 1 iken tüm görüntü
+        visible_w = image_width / self.zoom
+        visible_h = image_height / self.zoom
+        cx = min(max(self.center[0] * image_width, visible_w / 2), image_width - visible_w / 2)
+        cy = min(max(self.center[1] * image_height, visible_h / 2), image_height - visible_h / 2)
+        x0, y0 = int(cx - visible_w / 2), int(cy - visible_h / 2)
+        return (x0, y0, max(x0 + 1, int(cx + visible_w / 2)), max(y0 + 1, int(cy + visible_h / 2)))
+
+    def wheelEvent(self, event):
+        factor = ZOOM_STEP if event.angleDelta().y() > 0 else 1 / ZOOM_STEP
+        zoom = min(max(self.zoom * factor, 1.0), MAX_ZOOM)
+        if zoom != self.zoom:
+            self.zoom = zoom
+            self.viewport_changed.emit()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.zoom > 1.0:
+            self.drag_start = (event.pos(), self.center)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_start is not None:
+            start, center = self.drag_start
+            delta = event.pos() - start
+            span = self.zoom * max(self.width(), 1), self.zoom * max(self.height(), 1)
+            self.center = (min(max(center[0] - delta.x() / span[0], 0.0), 1.0),
+                           min(max(center[1] - delta.y() / span[1], 0.0), 1.0))
+            self.viewport_changed.emit()
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_start = None
+        super().mouseReleaseEvent(event)
@@ -0,0 +1,121 @@
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+# Filtreleri GUI iş parçacığı dışında çalıştıran yürütücü.
+# - Yeni bir işlem istendiğinde devam eden işlemin sonucu iptal edilir (yok sayılır),
+#   kuyrukta bekleyen iş havuzdan geri alınır.
+# - Kısa aralıklarla gelen tıklamalar tek bir işleme birleştirilir; aynı anahtarlı
+#   (aynı işlem, parametre ve girdi) iş zaten çalışıyorsa tekrar başlatılmaz. Anahtarsız
+#   ya da farklı anahtarlı istek çalışan işin yerini alır.
+# - Sonuçlar sinyallerle GUI iş parçacığına iletilir.
+
+
+class _JobSignals(QObject):
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _Job(QRunnable):
+    def __init__(self, job_id, compute):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.job_id = job_id
+        self.compute = compute
+        self.signals = _JobSignals()
+
+    def run(self):
+        try:
+            result = self.compute()
+        except Exception as exc:
+            self.signals.failed.emit(self.job_id, str(exc))
+            return
+        self.signals.finished.emit(self.job_id, result)
+
+
+class OperationExecutor(QObject):
+    started = pyqtSignal(str)
+    finished = pyqtSignal(str, float)
+    failed = pyqtSignal(str, str)
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent=None, coalesce_ms=30):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.coalesce_ms = coalesce_ms
+        self.pending = None
+        self.current = None
+        self.jobs = {}
+        self.next_id = 0
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.start_pending)
+
+    def is_busy(self):
+        return self.current is not None or self.pending is not None
+
+    def submit(self, name, compute, on_result, key=None):
+        if key is not None and self.current and self.current["key"] == key and self.pending is None:
+            return False
+        self.pending = (name, compute, on_result, key)
+        self.timer.start(self.coalesce_ms)
+        return True
+
+    def cancel(self):
+        self.timer.stop()
+        self.pending = None
+        self.drop_current()
+        self.busy_changed.emit(False)
+
+    def shutdown(self):
+        self.cancel()
+        self.pool.waitForDone()
+
+    def drop_current(self):
+        if self.current is None:
+            return
+        job = self.jobs[self.current["id"]]
+        if self.pool.tryTake(job):
+            del self.jobs[job.job_id]
+        # Çalışmaya başlamış iş durdurulamaz; biterse sonucu yok sayılır
+        self.current = None
+
+    def start_pending(self):
+        if self.pending is None:
+            return
+        name, compute, on_result, key = self.pending
+        self.pending = None
+        self.drop_current()
+
+        self.next_id += 1
+        job = _Job(self.next_id, compute)
+        job.signals.finished.connect(self.on_job_finished)
+        job.signals.failed.connect(self.on_job_failed)
+        self.jobs[job.job_id] = job
+        self.current = {"id": job.job_id, "name": name, "key": key, "on_result": on_result,
+                        "start": time.perf_counter()}
+        self.pool.start(job)
+        self.started.emit(name)
+        self.busy_changed.emit(True)
+
+    def take_current(self, job_id):
+        self.jobs.pop(job_id, None)
+        if self.current is None or self.current["id"] != job_id:
+            return None
+        current, self.current = self.current, None
+        if self.pending is None:
+            self.busy_changed.emit(False)
+        return current
+
+    def on_job_finished(self, job_id, result):
+        current = self.take_current(job_id)
+        if current is None:
+            return
+        current["on_result"](result)
+        self.finished.emit(current["name"], time.perf_counter() - current["start"])
+
+    def on_job_failed(self, job_id, message):
+        current = self.take_current(job_id)
+        if current is not None:
+            self.failed.emit(current["name"], message)